@@ -0,0 +1,62 @@
+import os
+import numpy as np
+from pandas import DataFrame
+from data_visualization.data_loader.local_file_loader import FileExtension
+
+# Writing and parsing .xlsx is slow (about a minute per 4M cells), so larger Excel cases are skipped
+EXCEL_MAX_CELLS = 1_000_000
+
+# Column counts per dataset shape: (float, int, categorical)
+SHAPES: dict[str, tuple[int, int, int]] = {
+    'narrow': (4, 2, 2),
+    'wide': (150, 40, 10),
+}
+
+_WRITERS = {
+    FileExtension.CSV: lambda data, path: data.to_csv(path, index=False),
+    FileExtension.JSON: lambda data, path: data.to_json(path),
+    FileExtension.PARQUET: lambda data, path: data.to_parquet(path, index=False),
+    FileExtension.EXCEL: lambda data, path: data.to_excel(path, index=False),
+    FileExtension.PICKLE: lambda data, path: data.to_pickle(path),
+    # Uncompressed, so reads can map the file instead of decompressing it
+    FileExtension.ARROW: lambda data, path: data.to_feather(path, compression='uncompressed'),
+}
+
+
+def make_dataset(rows: int, shape: str = 'narrow', seed: int = 0) -> DataFrame:
+    """
+    Generates a synthetic dataset with float, small-int and low-cardinality string columns.
+
+    Columns are named f0.., i0.. and c0..; c0 has 5 levels and later categorical columns
+    have progressively more, so both cheap and expensive hue groupings are covered.
+    """
+    n_float, n_int, n_cat = SHAPES[shape]
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for i in range(n_float):
+        columns[f'f{i}'] = rng.normal(loc=i, scale=1 + i % 5, size=rows)
+    for i in range(n_int):
+        columns[f'i{i}'] = rng.integers(0, 10 ** (1 + i % 4), size=rows)
+    for i in range(n_cat):
+        levels = np.array([f'level_{j}' for j in range(5 * 4 ** i)][:1000], dtype=object)
+        columns[f'c{i}'] = levels[rng.integers(0, len(levels), size=rows)]
+    return DataFrame(columns)
+
+
+def dataset_file(data: DataFrame, extension: FileExtension, data_dir: str, name: str) -> str:
+    """
+    Writes `data` in the given format under `data_dir`, reusing a previous file with the same name.
+
+    Returns:
+        str: The file path, or None if the format is skipped for this size.
+    """
+    if extension is FileExtension.EXCEL and data.size > EXCEL_MAX_CELLS:
+        return None
+    suffix = extension.value if isinstance(extension.value, str) else extension.value[0]
+    path = os.path.join(data_dir, f'{name}.{suffix}')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        tmp_path = os.path.join(data_dir, f'{name}.tmp.{suffix}')  # Writers pick the engine by suffix
+        _WRITERS[extension](data, tmp_path)
+        os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,192 @@
+"""
+Headless performance benchmarks for the loaders, the column summary and every plot type.
+
+Synthetic datasets are generated once per size and shape, written in every supported
+format under --data-dir and reused by later runs. Each case records its wall time
+and, unless --no-memory is given, the peak memory traced by tracemalloc during a
+second run (allocations made by pyarrow's own memory pool are not traced).
+
+Run the default sizes and compare against an earlier run:
+    python -m benchmarks.run --output after.json --compare before.json
+
+Include the 50M-row case (needs tens of GB of RAM and disk):
+    python -m benchmarks.run --sizes 10k 1m 50m --shapes narrow
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from data_visualization.data_loader import File
+from data_visualization.data_loader.local_file_loader import FileExtension
+from data_visualization.data_loader.column_stats import DistinctCountJob, summary_columns
+from data_visualization.plot_types import Plots
+from .datasets import SHAPES, make_dataset, dataset_file
+
+# (x, y, hue) used for each plot type on the synthetic datasets
+PLOT_SPECS: dict[str, tuple[str, str, str]] = {
+    'Scatter': ('f0', 'f1', 'c0'),
+    'Histogram': ('f0', None, 'c0'),
+    'Box': ('c0', 'f0', None),
+    'Count': ('c1', None, 'c0'),
+    'Bar': ('c0', 'f0', None),
+}
+
+_SIZE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(text: str) -> int:
+    """Parses row counts such as '10000', '10k' or '50m'."""
+    text = text.strip().lower()
+    if text[-1] in _SIZE_SUFFIXES:
+        return int(float(text[:-1]) * _SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def measure(func: Callable[[], object], repeat: int = 1, trace_memory: bool = True) -> dict:
+    """
+    Times `func` (best of `repeat` runs) and, optionally, traces its peak memory in one extra run.
+
+    Tracing is kept out of the timed runs since tracemalloc slows down allocation-heavy code.
+    """
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {'seconds': min(seconds), 'peak_memory_bytes': peak}
+
+
+def summarize(data: pd.DataFrame) -> None:
+    """Runs the column summary computation the window performs after every load."""
+    num_cols, cat_cols = summary_columns(data)
+    DistinctCountJob(data, num_cols + cat_cols).start().wait()
+
+
+def render(data: pd.DataFrame, plot_type: str, figure: Figure) -> None:
+    """Draws one plot on the reused figure and renders it, as plot_graph does."""
+    x, y, hue = PLOT_SPECS[plot_type]
+    figure.clear()
+    Plots(plot_type).plot(data, x=x, y=y, hue=hue, ax=figure.add_subplot())
+    figure.canvas.draw()
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = []
+    figure = Figure(figsize=(8, 5.5))
+    FigureCanvasAgg(figure)
+
+    def record(benchmark: str, case: str, shape: str, rows: int, func: Callable[[], object]) -> None:
+        print(f'{benchmark:<9} {case:<13} {shape:<7} {rows:>11,} rows ... ', end='', flush=True)
+        result = measure(func, args.repeat, not args.no_memory)
+        peak = result['peak_memory_bytes']
+        print(f"{result['seconds']:8.3f} s" + (f'  {peak / 2**20:9,.1f} MB peak' if peak is not None else ''))
+        results.append({'benchmark': benchmark, 'case': case, 'shape': shape, 'rows': rows, **result})
+
+    for shape in args.shapes:
+        for rows in args.sizes:
+            data = make_dataset(rows, shape)
+            name = f'{shape}_{rows}'
+
+            for extension in args.formats:
+                path = dataset_file(data, extension, args.data_dir, name)
+                if path is None:
+                    results.append({'benchmark': 'read', 'case': extension.name.lower(), 'shape': shape,
+                                    'rows': rows, 'skipped': 'too many rows for this format'})
+                    continue
+                record('read', extension.name.lower(), shape, rows, lambda: File().read(path))
+                if args.arrow and extension in File._ARROW_BACKED:
+                    record('read', f'{extension.name.lower()}-arrow', shape, rows,
+                           lambda: File(arrow=True).read(path))
+
+            record('summary', 'nunique', shape, rows, lambda data=data: summarize(data))
+
+            for plot_type in args.plots:
+                record('plot', plot_type.lower(), shape, rows, lambda data=data: render(data, plot_type, figure))
+
+            del data
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'seaborn': sns.__version__,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """Prints the time and peak memory of each case relative to a baseline run."""
+    def _key(result):
+        return result['benchmark'], result['case'], result['shape'], result['rows']
+
+    previous = {_key(result): result for result in baseline['results'] if 'seconds' in result}
+    print(f"\n{'case':<45} {'time':>18} {'peak memory':>18}")
+    for result in current['results']:
+        old = previous.get(_key(result))
+        if old is None or 'seconds' not in result:
+            continue
+        label = '{} {} {} {:,}'.format(*_key(result))
+        time_ratio = result['seconds'] / old['seconds'] if old['seconds'] else float('nan')
+        line = f'{label:<45} {time_ratio:>17.2f}x'
+        if result.get('peak_memory_bytes') and old.get('peak_memory_bytes'):
+            line += f" {result['peak_memory_bytes'] / old['peak_memory_bytes']:>17.2f}x"
+        print(line)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[10_000, 100_000, 1_000_000],
+                        help='Row counts to generate, e.g. 10k 1m 50m.')
+    parser.add_argument('--shapes', nargs='+', choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument('--formats', nargs='+', type=lambda name: FileExtension[name.upper()],
+                        default=list(FileExtension), help='File formats to read, e.g. csv parquet.')
+    parser.add_argument('--plots', nargs='+', choices=list(Plots._PLOTS), default=list(Plots._PLOTS))
+    parser.add_argument('--arrow', action='store_true', help='Also read every format into Arrow-backed columns.')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per case; the best one is kept.')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced run for peak memory.')
+    parser.add_argument('--data-dir', default='./.cache/benchmark_data', help='Where generated files are kept.')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON file for the results.')
+    parser.add_argument('--compare', help='An earlier results file to compare against.')
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'\nResults written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Startup-time regression check for the desktop app.
+
+Each run starts a fresh interpreter that imports the application, opens the window and
+waits for its first paint. The import time, the time to the first paint and the total
+process time are recorded, together with any deferred module (pandas, matplotlib, seaborn,
+the Kaggle client) that was imported too early. Without a display only the import is timed.
+
+The check fails (exit status 1) when a deferred module is imported at startup, seaborn or
+the Kaggle client is imported by the background pre-warm, or a median time grows by more
+than --tolerance over the --compare baseline.
+
+Record a baseline, then check a later change against it:
+    python -m benchmarks.startup --output startup_before.json
+    python -m benchmarks.startup --compare startup_before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+# Modules `import data_visualization` must not import; the window loads them after its first paint
+DEFERRED_MODULES: tuple[str, ...] = (
+    'numpy',
+    'pandas',
+    'pyarrow',
+    'matplotlib',
+    'seaborn',
+    'data_visualization.data_loader',
+    'data_visualization.plot_types',
+)
+
+# Modules only imported when first used, never by the background pre-warm
+ON_DEMAND_MODULES: tuple[str, ...] = (
+    'seaborn',
+    'data_visualization.data_loader.kaggle_file_loader',
+)
+
+_TIMES: tuple[str, ...] = ('import_seconds', 'first_paint_seconds', 'process_seconds')
+
+
+def probe() -> dict:
+    """Imports and opens the app in this process, timing each step from the import onwards."""
+    start = time.perf_counter()
+    from data_visualization import DataVisualizationWindow
+    result = {
+        'import_seconds': time.perf_counter() - start,
+        'imported_at_startup': [name for name in DEFERRED_MODULES if name in sys.modules],
+        'first_paint_seconds': None,
+    }
+
+    from tkinter import TclError
+    try:
+        app = DataVisualizationWindow()
+    except TclError as e:
+        result['display_error'] = str(e)  # No display to open the window on
+        return result
+    # Queued behind the window's own first-paint callback, so the loop stops right after it
+    app.after_idle(app.quit)
+    app.run()
+    result['first_paint_seconds'] = time.perf_counter() - start
+
+    for thread in threading.enumerate():
+        if thread.name == 'prewarm-imports':
+            thread.join()
+    result['imported_by_prewarm'] = [name for name in ON_DEMAND_MODULES if name in sys.modules]
+    app.destroy()
+    return result
+
+
+def run(runs: int) -> dict:
+    """Probes the startup `runs` times, each in a new interpreter, and reports the medians."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-m', 'benchmarks.startup', '--probe'],
+                                   capture_output=True, text=True, check=True)
+        sample = json.loads(completed.stdout.strip().splitlines()[-1])
+        sample['process_seconds'] = time.perf_counter() - start
+        samples.append(sample)
+
+    medians = {}
+    for name in _TIMES:
+        values = [sample[name] for sample in samples if sample.get(name) is not None]
+        medians[name] = statistics.median(values) if values else None
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'runs': runs,
+            'display': samples[0].get('display_error') is None,
+        },
+        'medians': medians,
+        'samples': samples,
+    }
+
+
+def check(report: dict, baseline: dict = None, tolerance: float = 1.25) -> list[str]:
+    """Returns the regressions in `report`, relative to `baseline` where one is given."""
+    failures = []
+    for sample in report['samples']:
+        for name in sample['imported_at_startup']:
+            failures.append(f'{name} is imported at startup')
+        for name in sample.get('imported_by_prewarm', []):
+            failures.append(f'{name} is imported before it is needed')
+    failures = list(dict.fromkeys(failures))
+
+    if baseline is not None:
+        for name in _TIMES:
+            new, old = report['medians'].get(name), baseline['medians'].get(name)
+            if new is not None and old and new > old * tolerance:
+                failures.append(f'{name} grew from {old:.3f} s to {new:.3f} s ({new / old:.2f}x)')
+    return failures
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time; medians are kept.')
+    parser.add_argument('--output', default='startup_results.json', help='JSON file for the results.')
+    parser.add_argument('--compare', help='An earlier results file to check against.')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='Largest allowed ratio of a median time to its baseline.')
+    parser.add_argument('--probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.probe:
+        print(json.dumps(probe()))
+        return
+
+    report = run(args.runs)
+    for name, seconds in report['medians'].items():
+        print(f'{name:<20} ' + (f'{seconds:8.3f} s' if seconds is not None else '       -  (no display)'))
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'\nResults written to {args.output}')
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    failures = check(report, baseline, args.tolerance)
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
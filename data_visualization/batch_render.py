@@ -0,0 +1,247 @@
+"""
+Renders a list of plot specs for one dataset to image files, without a display.
+
+Specs are read from a JSON or YAML file (YAML needs PyYAML) holding a list of objects:
+
+    [
+        {"type": "Histogram", "x": "age", "hue": "sex"},
+        {"type": "Scatter", "x": "age", "y": "income", "options": {"mode": "density"}},
+        {"type": "Box", "x": "city", "y": "income", "options": {"mode": "exact"}},
+        {"type": "Count", "x": "city", "name": "cities", "format": "svg"}
+    ]
+
+`type` and `x` are required; `y`, `hue`, `options` (extra Plots options), `name` (output
+file name without suffix) and `format` ('png', 'svg', ...) are optional. The specs are
+split across worker processes using the Agg backend; each worker loads the dataset once
+and renders its share. Per-plot timings are printed and written to a JSON report.
+
+Render the specs in reports.json into ./charts with four workers:
+    python -m data_visualization.batch_render data.parquet reports.json --output-dir charts --workers 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Union
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from pandas import DataFrame
+
+from data_visualization.data_loader import File, LazyDataset, ChunkedDataset
+from data_visualization.plot_types import Plots, ScatterMode, StatsMode
+
+# Set by _init_worker in each worker process
+_DATASET: Union[DataFrame, LazyDataset, ChunkedDataset] = None
+_LOAD_SECONDS: float = None
+
+
+def load_specs(spec_path: str) -> list[dict[str, Any]]:
+    """
+    Reads and validates the plot specs of a .json, .yaml or .yml file.
+
+    Raises:
+        ValueError: If the file is not a list of specs, or a spec has an unknown type or no x column.
+    """
+    with open(spec_path) as f:
+        if spec_path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError('Reading YAML specs requires PyYAML (pip install pyyaml).') from None
+            specs = yaml.safe_load(f)
+        else:
+            specs = json.load(f)
+
+    if not isinstance(specs, list):
+        raise ValueError(f'{spec_path} must hold a list of plot specs.')
+    plot_types = {name.lower(): name for name in Plots._PLOTS}
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict) or str(spec.get('type', '')).lower() not in plot_types:
+            raise ValueError(f'Spec {i} needs a type, one of: {", ".join(Plots._PLOTS)}')
+        if not spec.get('x'):
+            raise ValueError(f'Spec {i} needs an x column.')
+        spec['type'] = plot_types[spec['type'].lower()]
+    return specs
+
+
+def output_path(spec: dict[str, Any], index: int, output_dir: str, image_format: str = 'png') -> str:
+    """Returns the file a spec renders to: its `name`, or one built from its index, type and columns."""
+    name = spec.get('name')
+    if not name:
+        columns = '_'.join(str(spec[key]) for key in ('x', 'y', 'hue') if spec.get(key))
+        name = f"{index:03d}_{spec['type']}_{columns}"
+    name = re.sub(r'[^\w.=-]+', '_', str(name))  # Column names may hold characters paths cannot
+    return os.path.join(output_dir, f"{name}.{spec.get('format', image_format)}")
+
+
+def _plot_options(spec: dict[str, Any]) -> dict[str, Any]:
+    options = dict(spec.get('options') or {})
+    if 'mode' in options:
+        options['mode'] = (StatsMode if spec['type'] in ('Box', 'Bar') else ScatterMode)(options['mode'])
+    return options
+
+
+def _init_worker(dataset_path: str, file_options: dict[str, Any]) -> None:
+    """Loads the dataset once per worker process."""
+    global _DATASET, _LOAD_SECONDS
+    matplotlib.use('Agg')
+    start = time.perf_counter()
+    _DATASET = File(**file_options).read(dataset_path)
+    _LOAD_SECONDS = time.perf_counter() - start
+
+
+def render_spec(spec: dict[str, Any], path: str, figsize: tuple[float, float] = (8, 5.5),
+                dpi: int = 100, data: Union[DataFrame, LazyDataset, ChunkedDataset] = None) -> dict[str, Any]:
+    """
+    Renders one spec to `path` and times each step.
+
+    Args:
+        spec (dict): A validated plot spec.
+        path (str): The image file to write; its suffix picks the format.
+        figsize (tuple): Figure size in inches.
+        dpi (int): Resolution of raster formats.
+        data: The dataset. Defaults to the one loaded by the worker.
+
+    Returns:
+        dict: The spec's columns, output path, worker pid and `seconds` for the plot, draw
+            and save steps, or `error` if the spec failed.
+    """
+    data = _DATASET if data is None else data
+    result = {'type': spec['type'], 'x': spec['x'], 'y': spec.get('y'), 'hue': spec.get('hue'),
+              'output': path, 'worker': os.getpid()}
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    try:
+        start = time.perf_counter()
+        Plots(spec['type'], **_plot_options(spec)).plot(
+            data, x=spec['x'], y=spec.get('y'), hue=spec.get('hue'), ax=figure.add_subplot()
+        )
+        plotted = time.perf_counter()
+        figure.canvas.draw()
+        drawn = time.perf_counter()
+        figure.savefig(path)
+        saved = time.perf_counter()
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+        return result
+    result['seconds'] = {'plot': plotted - start, 'draw': drawn - plotted,
+                         'save': saved - drawn, 'total': saved - start}
+    return result
+
+
+def _render_in_worker(spec: dict[str, Any], path: str, figsize: tuple[float, float],
+                      dpi: int) -> dict[str, Any]:
+    result = render_spec(spec, path, figsize, dpi)
+    result['load_seconds'] = _LOAD_SECONDS
+    return result
+
+
+def render_all(dataset_path: str, specs: list[dict[str, Any]], output_dir: str, workers: int = None,
+               image_format: str = 'png', figsize: tuple[float, float] = (8, 5.5), dpi: int = 100,
+               file_options: dict[str, Any] = None, on_result=None) -> dict[str, Any]:
+    """
+    Renders every spec of `specs` for the dataset at `dataset_path` into `output_dir`.
+
+    Args:
+        workers (int): Worker processes. Defaults to one per CPU core, capped by the number of specs;
+            with one worker the specs are rendered in this process.
+        file_options (dict): Keyword arguments for `File`, e.g. {'arrow': True}.
+        on_result (Callable[[dict], None]): Called with each spec's result as it finishes.
+
+    Returns:
+        dict: A report with the worker count, per-worker dataset load times, per-plot results
+            in spec order and the total wall time.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    # Shards of a partitioned dataset are read serially inside each worker
+    file_options = {'max_workers': 1, **(file_options or {})}
+    paths = [output_path(spec, i, output_dir, image_format) for i, spec in enumerate(specs)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs)))
+    results = [None] * len(specs)
+    load_seconds = {}
+    start = time.perf_counter()
+
+    if workers == 1:
+        _init_worker(dataset_path, file_options)
+        load_seconds[os.getpid()] = _LOAD_SECONDS
+        for i, (spec, path) in enumerate(zip(specs, paths)):
+            results[i] = render_spec(spec, path, figsize, dpi)
+            if on_result is not None:
+                on_result(results[i])
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(dataset_path, file_options)) as executor:
+            futures = {executor.submit(_render_in_worker, spec, path, figsize, dpi): i
+                       for i, (spec, path) in enumerate(zip(specs, paths))}
+            for future in as_completed(futures):
+                result = future.result()
+                load_seconds[result['worker']] = result.pop('load_seconds')
+                results[futures[future]] = result
+                if on_result is not None:
+                    on_result(result)
+
+    return {
+        'dataset': dataset_path,
+        'workers': workers,
+        'load_seconds': load_seconds,
+        'plots': results,
+        'total_seconds': time.perf_counter() - start,
+    }
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    label = f"{result['type']:<9} {result['x']!s:<16} {result['y'] or '-'!s:<16} {result['hue'] or '-'!s:<12}"
+    if 'error' in result:
+        print(f"{label} FAILED  {result['error']}")
+    else:
+        seconds = result['seconds']
+        print(f"{label} {seconds['total']:7.3f} s  (plot {seconds['plot']:.3f}, draw {seconds['draw']:.3f}, "
+              f"save {seconds['save']:.3f})  -> {result['output']}")
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dataset', help='Data file, directory or glob pattern to plot.')
+    parser.add_argument('specs', help='JSON or YAML file with the list of plot specs.')
+    parser.add_argument('--output-dir', default='charts', help='Where the images are written.')
+    parser.add_argument('--format', default='png', help="Image format for specs without one, e.g. 'png' or 'svg'.")
+    parser.add_argument('--workers', type=int, help='Worker processes. Defaults to one per CPU core.')
+    parser.add_argument('--size', nargs=2, type=float, default=(8, 5.5), metavar=('WIDTH', 'HEIGHT'),
+                        help='Figure size in inches.')
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--arrow', action='store_true', help='Load the dataset into Arrow-backed columns.')
+    parser.add_argument('--lazy', action='store_true', help='Only read the columns each plot uses.')
+    parser.add_argument('--out-of-core', action='store_true',
+                        help='Stream Parquet/CSV/Arrow files chunk by chunk instead of loading them.')
+    parser.add_argument('--category-ratio', type=float, default=0.5,
+                        help='Load text columns with at most this ratio of distinct values to rows as categories.')
+    parser.add_argument('--sheet', default=0, type=lambda sheet: int(sheet) if sheet.isdigit() else sheet,
+                        help='Excel sheet name or 0-based position to plot. Defaults to the first one.')
+    parser.add_argument('--report', default=None, help='JSON file for the timings. Defaults to <output-dir>/report.json.')
+    args = parser.parse_args(argv)
+
+    specs = load_specs(args.specs)
+    report = render_all(args.dataset, specs, args.output_dir, args.workers, args.format, tuple(args.size),
+                        args.dpi, {'downcast': True, 'arrow': args.arrow, 'lazy': args.lazy,
+                         'category_ratio': args.category_ratio, 'sheet_name': args.sheet,
+                         'out_of_core': args.out_of_core}, _print_result)
+
+    report_path = args.report or os.path.join(args.output_dir, 'report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    failed = sum('error' in result for result in report['plots'])
+    loads = ', '.join(f'{seconds:.2f} s' for seconds in report['load_seconds'].values())
+    print(f"\n{len(specs) - failed} of {len(specs)} plots rendered in {report['total_seconds']:.2f} s "
+          f"with {report['workers']} worker(s) (dataset load: {loads}). Report written to {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,18 @@
-from .local_file_loader import File
-from .kaggle_file_loader import KaggleFile
+from .file_cache import FileCache
+from .dataset_store import DatasetStore
+from .lazy_dataset import LazyDataset
+from .chunked_dataset import ChunkedDataset
+from .excel import ExcelSheet, list_sheets
+from .local_file_loader import File, LoadCancelled, MemoryReport, SchemaMismatchError
+from .background_loader import BackgroundLoader, BackgroundDownloader, LoadEvent
 
-__all__ = ["File", "KaggleFile"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    # The Kaggle client is only imported once a download needs it
+    if name == 'KaggleFile':
+        from .kaggle_file_loader import KaggleFile
+        return KaggleFile
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+__all__ = ["File", "FileCache", "DatasetStore", "LazyDataset", "ChunkedDataset", "ExcelSheet", "list_sheets", "LoadCancelled", "MemoryReport", "SchemaMismatchError", "BackgroundLoader", "BackgroundDownloader", "LoadEvent", "KaggleFile"]
\ No newline at end of file
@@ -0,0 +1,140 @@
+import queue
+import threading
+from enum import Enum
+from typing import Any, TYPE_CHECKING
+from .local_file_loader import File, LoadCancelled
+
+if TYPE_CHECKING:
+    from .kaggle_file_loader import KaggleFile
+
+
+class LoadEvent(Enum):
+    """
+    Enumerates the events a background task reports back to its owner.
+
+    Attributes:
+        PROGRESS: Payload is the task's progress tuple, e.g. (bytes_read, total_bytes, rows_parsed)
+            for a BackgroundLoader or (stage, done, total) for a BackgroundDownloader.
+        PREVIEW: Payload is a quick partial result to show until DONE, e.g. a BackgroundLoader's
+            sample of the file's rows.
+        DONE: Payload is the task's result.
+        ERROR: Payload is the exception raised by the task.
+        CANCELLED: Payload is None.
+    """
+
+    PROGRESS = "progress"
+    PREVIEW = "preview"
+    DONE = "done"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+
+
+class BackgroundTask:
+    """
+    Runs `_work` on a worker thread so the caller's event loop stays responsive.
+
+    The worker never touches the GUI; it only pushes (LoadEvent, payload) pairs into
+    a queue which the owner drains with `poll()` from its own thread, e.g. from a
+    Tk `after` callback. Subclasses implement `_work`, reporting progress through
+    `_report_progress` and checking `_cancel_event`.
+    """
+
+    def __init__(self) -> None:
+        self._events: queue.Queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "BackgroundTask":
+        """Starts the worker thread and returns the task for chaining."""
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Asks the worker to abort; a CANCELLED event follows once it stops."""
+        self._cancel_event.set()
+
+    def is_running(self) -> bool:
+        """Returns True while the worker thread is still running."""
+        return self._thread.is_alive()
+
+    def poll(self) -> list[tuple[LoadEvent, Any]]:
+        """Returns every event reported since the last call, oldest first."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _report_progress(self, *progress: Any) -> None:
+        self._events.put((LoadEvent.PROGRESS, progress))
+
+    def _work(self) -> Any:
+        raise NotImplementedError
+
+    def _run(self) -> None:
+        try:
+            result = self._work()
+        except LoadCancelled:
+            self._events.put((LoadEvent.CANCELLED, None))
+        except Exception as e:
+            self._events.put((LoadEvent.ERROR, e))
+        else:
+            self._events.put((LoadEvent.DONE, result))
+
+
+class BackgroundLoader(BackgroundTask):
+    """
+    Runs `File.read` on a worker thread.
+
+    With `preview_rows`, `File.read_preview` runs first and its rows are reported as a
+    PREVIEW event, so they can be explored while the full read continues.
+
+    Read a file without blocking:
+        loader = BackgroundLoader("data.csv").start()
+        ...
+        for event, payload in loader.poll():
+            ...
+
+    Show a sample spread through the file first:
+        loader = BackgroundLoader("data.csv", preview_rows=100_000, spread=True).start()
+    """
+
+    def __init__(self, file_path: str, file: File = None, preview_rows: int = None, spread: bool = False) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.file = file if file is not None else File()
+        self.preview_rows = preview_rows
+        self.spread = spread
+
+    def _work(self) -> Any:
+        if self.preview_rows:
+            try:
+                preview = self.file.read_preview(self.file_path, self.preview_rows, self.spread)
+            except Exception:
+                preview = None  # The full read reports what is wrong with the file
+            if preview is not None and not self._cancel_event.is_set():
+                self._events.put((LoadEvent.PREVIEW, preview))
+        return self.file.read(self.file_path, progress=self._report_progress,
+                              cancel_event=self._cancel_event)
+
+
+class BackgroundDownloader(BackgroundTask):
+    """
+    Runs `KaggleFile.download` on a worker thread; DONE carries the dataset folder.
+
+    Download a dataset without blocking:
+        downloader = BackgroundDownloader("https://www.kaggle.com/datasets/owner/slug").start()
+    """
+
+    def __init__(self, url: str, kaggle: 'KaggleFile' = None) -> None:
+        super().__init__()
+        self.url = url
+        if kaggle is None:
+            from .kaggle_file_loader import KaggleFile  # Loaded on the first download
+            kaggle = KaggleFile()
+        self.kaggle = kaggle
+
+    def _work(self) -> str:
+        return self.kaggle.download(self.url, progress=self._report_progress,
+                                    cancel_event=self._cancel_event)
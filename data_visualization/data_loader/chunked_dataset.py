@@ -0,0 +1,66 @@
+from typing import Iterator
+from pandas import ArrowDtype, DataFrame
+
+
+class ChunkedDataset:
+    """
+    A dataset that is never held in memory: columns are streamed from the source in
+    chunks of `chunk_rows` rows, for aggregations that can be computed chunk by chunk.
+
+    The source is a `pyarrow.dataset.Dataset` over Parquet, CSV or Arrow IPC files, so only
+    the requested columns are read, and a directory of Hive-style 'key=value' folders
+    exposes its partition keys as columns.
+
+    Attributes:
+        schema (DataFrame): An empty frame with the dataset's column names and dtypes.
+        num_rows (int): Row count when the source's metadata provides it, otherwise None.
+        chunk_rows (int): Rows per chunk.
+
+    Stream the columns a plot needs:
+        for chunk in dataset.iter_chunks("age", "sex"):
+            ...
+    """
+
+    _CHUNK_ROWS: int = 1_000_000
+
+    def __init__(self, source, num_rows: int = None, chunk_rows: int = None, dtype_backend: str = None) -> None:
+        """
+        Args:
+            source (pyarrow.dataset.Dataset): The files to stream.
+            num_rows (int): Row count from the source's metadata, if known. Defaults to None.
+            chunk_rows (int): Rows per chunk. Defaults to `_CHUNK_ROWS`.
+            dtype_backend (str): 'pyarrow' for ArrowDtype chunks. Defaults to None (NumPy dtypes).
+        """
+        self.source = source
+        self.num_rows = num_rows
+        self.chunk_rows = chunk_rows or self._CHUNK_ROWS
+        self.dtype_backend = dtype_backend
+        self.schema = self._to_pandas(source.schema.empty_table())
+
+    @property
+    def columns(self):
+        """The dataset's column names."""
+        return self.schema.columns
+
+    def _to_pandas(self, table) -> DataFrame:
+        if self.dtype_backend == 'pyarrow':
+            return table.to_pandas(types_mapper=ArrowDtype)
+        return table.to_pandas()
+
+    def iter_chunks(self, *columns: str) -> Iterator[DataFrame]:
+        """
+        Yields frames of up to `chunk_rows` rows holding the requested columns, in file order.
+
+        Args:
+            *columns (str): Column names; None entries and duplicates are ignored.
+
+        Raises:
+            ValueError: If a column is not part of the dataset.
+        """
+        wanted = list(dict.fromkeys(col for col in columns if col is not None))
+        unknown = [col for col in wanted if col not in self.schema.columns]
+        if unknown:
+            raise ValueError(f'Columns not found in dataset: {unknown}')
+        for batch in self.source.to_batches(columns=wanted, batch_size=self.chunk_rows):
+            if batch.num_rows:
+                yield self._to_pandas(batch)
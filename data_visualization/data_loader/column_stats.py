@@ -0,0 +1,212 @@
+import queue
+import threading
+from typing import Union
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, Future
+from pandas import DataFrame, Series, CategoricalDtype
+from pandas.util import hash_array
+from .chunked_dataset import ChunkedDataset
+
+# Columns longer than this get a HyperLogLog estimate instead of an exact count
+EXACT_DISTINCT_LIMIT = 1_000_000
+
+# Leading rows inspected to tell low-cardinality columns, which stay exact, from high-cardinality ones
+_CARDINALITY_SAMPLE_ROWS = 10_000
+
+
+def summary_columns(data: DataFrame) -> tuple[list[str], list[str]]:
+    """
+    Splits a dataset's columns into the numerical and categorical ones listed in the column summary.
+
+    Returns:
+        (numerical_columns, categorical_columns)
+    """
+    num_cols = list(data.select_dtypes(include=['number']).columns)
+    # 'string' covers Arrow-backed text; 'category' the partition columns of multi-file datasets
+    cat_cols = list(data.select_dtypes(include=['object', 'string', 'category']).columns)
+    return num_cols, cat_cols
+
+
+def approximate_distinct(values: Series, precision: int = 14) -> int:
+    """
+    Estimates the number of distinct non-null values with HyperLogLog.
+
+    Values are hashed to 64 bits in one vectorized pass; the top `precision` bits pick
+    one of 2**precision registers and each register keeps the longest run of leading
+    zeros seen in the remaining bits. The standard error is about 1.04 / sqrt(2**precision),
+    i.e. under 1% for the default precision.
+
+    Args:
+        values (Series): The column to estimate.
+        precision (int): Number of register index bits, between 11 and 18. Defaults to 14.
+    """
+    values = values.dropna()
+    if values.empty:
+        return 0
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    _add_to_registers(registers, values.to_numpy())
+    return _estimate_distinct(registers)
+
+
+def _add_to_registers(registers: np.ndarray, values: np.ndarray) -> None:
+    """Hashes non-null `values` into HyperLogLog `registers` in place; see `approximate_distinct`."""
+    precision = int(registers.size).bit_length() - 1
+    remaining_bits = 64 - precision
+    hashes = hash_array(values)
+    index = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+    # Keeping at most 53 bits lets float64 represent the remainder exactly for log2
+    remainder = (hashes & np.uint64((1 << remaining_bits) - 1)).astype(np.float64)
+    with np.errstate(divide='ignore'):
+        rank = np.where(remainder > 0, remaining_bits - np.floor(np.log2(remainder)), remaining_bits + 1)
+    np.maximum.at(registers, index, rank.astype(np.uint8))
+
+
+def _estimate_distinct(registers: np.ndarray) -> int:
+    """Returns the HyperLogLog estimate of filled `registers`."""
+    m = registers.size
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)  # Linear counting is more accurate for small cardinalities
+    return int(round(estimate))
+
+
+def count_distinct(values: Series, exact_limit: int = EXACT_DISTINCT_LIMIT) -> tuple[int, bool]:
+    """
+    Counts the distinct non-null values of a column, exactly when that is cheap.
+
+    Long columns are estimated with HyperLogLog unless their leading rows show few distinct
+    values, since then an exact count only needs a small hash table.
+
+    Returns:
+        (count, approximate): `approximate` is True when the count is a HyperLogLog estimate.
+    """
+    if isinstance(values.dtype, CategoricalDtype) or len(values) <= exact_limit:
+        return int(values.nunique()), False
+    if values.iloc[:_CARDINALITY_SAMPLE_ROWS].nunique() <= _CARDINALITY_SAMPLE_ROWS // 10:
+        return int(values.nunique()), False
+    return approximate_distinct(values), True
+
+
+def count_distinct_chunked(dataset: ChunkedDataset, columns: list[str],
+                           exact_limit: int = EXACT_DISTINCT_LIMIT) -> list[tuple[str, int, bool]]:
+    """
+    Counts the distinct non-null values of several columns of an out-of-core dataset in one pass.
+
+    Each column keeps its exact set of values until it grows past `exact_limit`; from then
+    on the values are folded into HyperLogLog registers, so memory stays bounded.
+
+    Returns:
+        A (column, count, approximate) tuple per column, in `columns` order.
+    """
+    distinct: dict[str, np.ndarray] = {column: None for column in columns}
+    registers: dict[str, np.ndarray] = {}
+    for chunk in dataset.iter_chunks(*columns):
+        for column in columns:
+            values = chunk[column].dropna().unique()
+            values = np.asarray(values.astype(object) if isinstance(values.dtype, CategoricalDtype) else values)
+            if column in registers:
+                _add_to_registers(registers[column], values)
+                continue
+            seen = distinct[column]
+            seen = values if seen is None else np.asarray(Series(np.concatenate((seen, values))).unique())
+            if len(seen) > exact_limit:
+                registers[column] = np.zeros(1 << 14, dtype=np.uint8)
+                _add_to_registers(registers[column], seen)
+                seen = None
+            distinct[column] = seen
+    return [(column, _estimate_distinct(registers[column]), True) if column in registers
+            else (column, len(distinct[column]) if distinct[column] is not None else 0, False)
+            for column in columns]
+
+
+class DistinctCountJob:
+    """
+    Counts the distinct values of many columns on a thread pool, streaming results as they finish.
+
+    Like BackgroundLoader, the workers only push results into a queue; the owner drains it
+    with `poll()` from its own thread.
+
+    An out-of-core ChunkedDataset is counted by a single task that streams every column
+    once, and its results all arrive together.
+
+    Count in the background:
+        job = DistinctCountJob(data, data.columns).start()
+        ...
+        for column, count, approximate in job.poll():
+            ...
+    """
+
+    def __init__(self, data: Union[DataFrame, ChunkedDataset], columns: list[str], max_workers: int = None,
+                 exact_limit: int = EXACT_DISTINCT_LIMIT) -> None:
+        self.data = data
+        self.columns = list(columns)
+        self.exact_limit = exact_limit
+        self._results: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='distinct-count')
+        self._futures: list[Future] = []
+        self._pending = len(self.columns)
+        self._pending_lock = threading.Lock()
+        self._finished = threading.Event()
+
+    def start(self) -> "DistinctCountJob":
+        """Submits one task per column and returns the job for chaining."""
+        if isinstance(self.data, ChunkedDataset) and self.columns:
+            self._pending = 1
+            future = self._executor.submit(count_distinct_chunked, self.data, self.columns, self.exact_limit)
+            future.add_done_callback(self._collect_all)
+            self._futures.append(future)
+            self._executor.shutdown(wait=False)
+            return self
+        for column in self.columns:
+            future = self._executor.submit(count_distinct, self.data[column], self.exact_limit)
+            future.add_done_callback(lambda f, column=column: self._collect(column, f))
+            self._futures.append(future)
+        self._executor.shutdown(wait=False)
+        if not self.columns:
+            self._finished.set()
+        return self
+
+    def cancel(self) -> None:
+        """Drops every column that has not started counting yet."""
+        for future in self._futures:
+            future.cancel()
+
+    def is_running(self) -> bool:
+        """
+        Returns True while some column is still being counted. Once it returns False,
+        every result is already waiting in the queue for `poll()`.
+        """
+        return not self._finished.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until every column has been counted; returns False if `timeout` seconds passed first."""
+        return self._finished.wait(timeout)
+
+    def poll(self) -> list[tuple[str, int, bool]]:
+        """Returns the (column, count, approximate) results finished since the last call."""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def _collect_all(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            for result in future.result():
+                self._results.put(result)
+        self._task_done()
+
+    def _collect(self, column: str, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            count, approximate = future.result()
+            self._results.put((column, count, approximate))
+        self._task_done()
+
+    def _task_done(self) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._finished.set()
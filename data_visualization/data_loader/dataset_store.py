@@ -0,0 +1,252 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from threading import Event
+from typing import Callable
+from .local_file_loader import File, FileExtension, LoadCancelled, extension_of
+
+# Called with ('compact', files_done, files_total) while downloaded files are compacted
+CompactProgress = Callable[[str, int, int], None]
+
+
+class DatasetStore:
+    """
+    Keeps downloaded datasets on disk, indexed by dataset id and version, within a disk budget.
+
+    Each dataset version lives in a folder named after the SHA-256 of its downloaded archive,
+    so the same content reached through two ids or versions is stored once. `index.json`
+    maps each '<owner>/<slug>@<version>' key to its content folder, size and last use, and
+    the least recently used datasets are evicted once the store grows past `max_bytes`.
+
+    With `compact`, CSV and JSON files are rewritten as zstd-compressed Parquet when a
+    dataset is added and the raw files are deleted, so later opens read the compact copy.
+    Files that cannot be read or written as Parquet are kept as they are.
+
+    Methods:
+        lookup(self, dataset_id: str, version: int = None) -> str:
+            Returns the folder of a stored dataset version, or None if it is not stored.
+
+        add(self, dataset_id: str, version: int, folder: str, content: str, compact: bool = False) -> str:
+            Moves an extracted dataset into the store and returns its folder there.
+
+        remove(self, dataset_id: str, version: int = None) -> None:
+            Drops one version of a dataset, or all of them.
+
+        download_path(self, dataset_id: str, version: int = None) -> str:
+            Returns where the archive of a dataset version is downloaded before it is added.
+    """
+    _INDEX: str = 'index.json'
+    _CONTENT_DIR: str = 'content'
+    _DOWNLOAD_DIR: str = 'downloads'
+    # Files rewritten as Parquet by compaction
+    _COMPACTED: tuple[FileExtension, ...] = (FileExtension.CSV, FileExtension.JSON)
+
+    def __init__(self, root: str = './Datasets', max_bytes: int = 20 * 2**30) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(dataset_id: str, version: int = None) -> str:
+        """Returns the index key of a dataset version; an unknown version is stored as 'latest'."""
+        return f'{dataset_id}@{version if version is not None else "latest"}'
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, self._INDEX)
+
+    def _content_path(self, content: str) -> str:
+        return os.path.join(self.root, self._CONTENT_DIR, content[:24])
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            with open(self._index_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}  # No store yet, or an unreadable index whose folders get re-downloaded
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._index_path() + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self._index_path())  # Readers never see a half-written index
+
+    def entries(self) -> list[dict]:
+        """Returns the index entries, most recently used first."""
+        with self._lock:
+            index = self._load_index()
+        return sorted(({'key': key, **entry} for key, entry in index.items()),
+                      key=lambda entry: entry['last_used'], reverse=True)
+
+    def size(self) -> int:
+        """Returns the total size of the stored datasets, in bytes, counting shared content once."""
+        with self._lock:
+            index = self._load_index()
+        return sum({entry['content']: entry['bytes'] for entry in index.values()}.values())
+
+    def download_path(self, dataset_id: str, version: int = None) -> str:
+        """Returns where the archive of a dataset version is downloaded; a '.part' suffix marks a partial one."""
+        name = hashlib.sha1(self.key(dataset_id, version).encode()).hexdigest()[:16]
+        return os.path.join(self.root, self._DOWNLOAD_DIR, f'{name}.zip')
+
+    def lookup(self, dataset_id: str, version: int = None) -> str:
+        """
+        Returns the folder of a stored dataset version and marks it as recently used.
+
+        Args:
+            dataset_id (str): '<owner>/<slug>'.
+            version (int): The dataset version. Defaults to None, which matches the newest
+                stored version, e.g. when the current version could not be looked up offline.
+
+        Returns:
+            str: The dataset's folder, or None if it is not stored.
+        """
+        with self._lock:
+            index = self._load_index()
+            if version is not None:
+                key = self.key(dataset_id, version)
+            else:
+                stored = [key for key, entry in index.items() if entry['id'] == dataset_id]
+                key = max(stored, key=lambda key: index[key]['added'], default=None)
+            entry = index.get(key)
+            if entry is None:
+                return None
+            folder = self._content_path(entry['content'])
+            if not os.path.isdir(folder):
+                del index[key]  # Deleted by hand
+                self._save_index(index)
+                return None
+            entry['last_used'] = time.time()
+            self._save_index(index)
+            return folder
+
+    def add(self, dataset_id: str, version: int, folder: str, content: str, compact: bool = False,
+            progress: CompactProgress = None, cancel_event: Event = None) -> str:
+        """
+        Moves an extracted dataset into the store and evicts old datasets past the budget.
+
+        Args:
+            dataset_id (str): '<owner>/<slug>'.
+            version (int): The dataset version, or None if it is unknown.
+            folder (str): The extracted files; the folder is moved, or deleted if the same
+                content is already stored.
+            content (str): The SHA-256 hex digest of the downloaded archive.
+            compact (bool): Rewrite CSV and JSON files as compressed Parquet. Defaults to False.
+            progress (CompactProgress): Called with ('compact', done, total) per file compacted.
+            cancel_event (Event): When set from another thread, stops between files.
+
+        Returns:
+            str: The dataset's folder in the store.
+
+        Raises:
+            LoadCancelled: If `cancel_event` is set while compacting; `folder` is left as it is.
+        """
+        destination = self._content_path(content)
+        reused = os.path.isdir(destination)
+        if reused:
+            shutil.rmtree(folder, ignore_errors=True)  # Same archive under another id or version
+        else:
+            if compact:
+                compact_folder(folder, progress, cancel_event)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            os.replace(folder, destination)
+
+        key = self.key(dataset_id, version)
+        now = time.time()
+        with self._lock:
+            index = self._load_index()
+            if reused:
+                compact = any(entry['compacted'] for entry in index.values() if entry['content'] == content)
+            index[key] = {
+                'id': dataset_id,
+                'version': version,
+                'content': content,
+                'bytes': _folder_bytes(destination),
+                'compacted': compact,
+                'added': now,
+                'last_used': now,
+            }
+            self._evict(index, keep=key)
+            self._save_index(index)
+        return destination
+
+    def remove(self, dataset_id: str, version: int = None) -> None:
+        """
+        Drops stored datasets.
+
+        Args:
+            dataset_id (str): '<owner>/<slug>'.
+            version (int): The version to drop. Defaults to None, which drops every version.
+        """
+        with self._lock:
+            index = self._load_index()
+            for key in [key for key, entry in index.items() if entry['id'] == dataset_id
+                        and (version is None or entry['version'] == version)]:
+                self._delete(index, key)
+            self._save_index(index)
+
+    def _evict(self, index: dict[str, dict], keep: str) -> None:
+        """Removes least recently used datasets, never `keep`, until the store fits in `max_bytes`."""
+        sizes = {entry['content']: entry['bytes'] for entry in index.values()}
+        total = sum(sizes.values())
+        for key in sorted(index, key=lambda key: index[key]['last_used']):
+            if total <= self.max_bytes:
+                break
+            content = index[key]['content']
+            if content == index[keep]['content']:
+                continue
+            if self._delete(index, key):
+                total -= sizes[content]
+
+    def _delete(self, index: dict[str, dict], key: str) -> bool:
+        """Drops `key` from `index`, and its folder once no other key shares it. Returns True if the folder went."""
+        content = index.pop(key)['content']
+        if any(entry['content'] == content for entry in index.values()):
+            return False
+        shutil.rmtree(self._content_path(content), ignore_errors=True)
+        return True
+
+
+def compact_folder(folder: str, progress: CompactProgress = None, cancel_event: Event = None) -> int:
+    """
+    Rewrites the CSV and JSON files under `folder` as zstd-compressed Parquet files next to
+    them (e.g. 'train.csv' becomes 'train.parquet') and deletes the originals.
+
+    Each file is parsed by `File.read`, so the Parquet copy holds the same columns and types
+    a later load of the raw file would. Files that fail to parse or to convert are kept.
+
+    Returns:
+        int: The number of files compacted.
+
+    Raises:
+        LoadCancelled: If `cancel_event` is set; files compacted so far stay compacted.
+    """
+    sources = [os.path.join(directory, name) for directory, _, names in os.walk(folder) for name in sorted(names)
+               if extension_of(name) in DatasetStore._COMPACTED]
+    compacted = 0
+    for i, source in enumerate(sources):
+        if cancel_event is not None and cancel_event.is_set():
+            raise LoadCancelled(folder)
+        target = os.path.splitext(source)[0] + '.parquet'
+        if os.path.exists(target):
+            target = source + '.parquet'  # Keep an existing Parquet file of the same name
+        tmp_path = target + '.tmp'
+        try:
+            File().read(source).to_parquet(tmp_path, compression='zstd', index=False)
+            os.replace(tmp_path, target)
+            os.remove(source)
+            compacted += 1
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        if progress is not None:
+            progress('compact', i + 1, len(sources))
+    return compacted
+
+
+def _folder_bytes(folder: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for directory, _, names in os.walk(folder) for name in names)
@@ -0,0 +1,96 @@
+import re
+import importlib.util
+import posixpath
+import zipfile
+from functools import lru_cache
+from typing import NamedTuple
+from xml.etree import ElementTree
+
+# Bytes of a worksheet scanned for its <dimension> element, which writers put before the cell data
+_DIMENSION_SCAN_BYTES = 64 * 2**10
+
+_DIMENSION = re.compile(rb'<(?:\w+:)?dimension\s+ref="([A-Z]*)(\d+)(?::[A-Z]*(\d+))?"')
+_SHEET_DATA = re.compile(rb'<(?:\w+:)?sheetData')
+
+_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+class ExcelSheet(NamedTuple):
+    """
+    A worksheet of an Excel workbook.
+
+    Attributes:
+        name (str): The sheet name, as passed to `File(sheet_name=...)`.
+        rows (int): Data rows below the header row, or None if the workbook does not record it.
+    """
+    name: str
+    rows: int = None
+
+    def label(self) -> str:
+        """Describes the sheet for a picker, e.g. 'Sales (12,000 rows)'."""
+        return self.name if self.rows is None else f'{self.name} ({self.rows:,} rows)'
+
+
+@lru_cache(maxsize=None)
+def excel_engine() -> str:
+    """
+    Returns 'calamine' when python-calamine is installed and pandas supports it (pandas 2.2+),
+    or None for pandas' default engine (openpyxl, which pandas opens read-only, for .xlsx).
+    """
+    if importlib.util.find_spec('python_calamine') is None:
+        return None
+    from pandas import ExcelFile
+    return 'calamine' if 'calamine' in getattr(ExcelFile, '_engines', {}) else None
+
+
+def list_sheets(file_path: str) -> list[ExcelSheet]:
+    """
+    Lists the worksheets of an Excel workbook in workbook order, without parsing any cells.
+
+    For .xlsx files the names come from the workbook part and the row counts from each
+    sheet's recorded dimension, of which only the first few kilobytes are decompressed.
+    Other formats are opened through pandas and get no row counts.
+
+    Raises:
+        ValueError: If the file is not a readable workbook.
+    """
+    if zipfile.is_zipfile(file_path):
+        try:
+            return _xlsx_sheets(file_path)
+        except (KeyError, ElementTree.ParseError) as e:
+            raise ValueError(f'{file_path} is not a valid .xlsx workbook: {e}') from None
+    from pandas import ExcelFile
+    with ExcelFile(file_path, engine=excel_engine()) as workbook:
+        return [ExcelSheet(str(name)) for name in workbook.sheet_names]
+
+
+def _xlsx_sheets(file_path: str) -> list[ExcelSheet]:
+    with zipfile.ZipFile(file_path) as archive:
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        relations = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        targets = {relation.get('Id'): relation.get('Target')
+                   for relation in relations.iter(f'{_PACKAGE_REL_NS}Relationship')}
+        names = set(archive.namelist())
+
+        sheets = []
+        for sheet in workbook.iter(f'{_MAIN_NS}sheet'):
+            target = targets.get(sheet.get(f'{_REL_NS}id'), '')
+            # Targets are relative to xl/, or absolute within the package
+            part = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+            rows = _dimension_rows(archive, part) if part in names else None
+            sheets.append(ExcelSheet(sheet.get('name'), rows))
+        return sheets
+
+
+def _dimension_rows(archive: zipfile.ZipFile, part: str) -> int:
+    """Reads a worksheet's <dimension ref="A1:K1001"> and returns its row span minus the header row."""
+    with archive.open(part) as f:
+        head = f.read(_DIMENSION_SCAN_BYTES)
+    match = _DIMENSION.search(head)
+    cells = _SHEET_DATA.search(head)
+    if match is None or (cells is not None and cells.start() < match.start()):
+        return None  # Not recorded; a <dimension> after the cell data would not be the sheet's own
+    first, last = int(match.group(2)), int(match.group(3) or match.group(2))
+    return max(last - first, 0)
@@ -0,0 +1,135 @@
+import os
+import glob
+import hashlib
+from pandas import read_feather, RangeIndex, DataFrame
+
+
+class FileCache:
+    """
+    Keeps columnar (Feather) copies of parsed files on disk so reopening them skips parsing.
+
+    Entries are keyed by the source's absolute path, size and modification time, plus an
+    optional variant string for read options that change the resulting frame. Editing the
+    source therefore produces a new key, and the stale entry is dropped on the next write.
+    Least recently used entries are evicted once the cache grows past `max_bytes`.
+
+    Methods:
+        get(self, file_path: str, variant: str = '', dtype_backend: str = None) -> DataFrame:
+            Returns the cached frame for `file_path`, or None on a miss.
+
+        put(self, file_path: str, data: DataFrame, variant: str = '') -> bool:
+            Stores `data` as the cached copy of `file_path`.
+
+        invalidate(self, file_path: str = None) -> None:
+            Drops the entries of one source file, or the whole cache.
+    """
+    _SUFFIX: str = '.feather'
+
+    def __init__(self, cache_dir: str = './.cache', max_bytes: int = 2 * 2**30) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _path_key(file_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+
+    @staticmethod
+    def _version_key(file_path: str) -> str:
+        stat = os.stat(file_path)
+        return hashlib.sha1(f'{stat.st_size}:{stat.st_mtime_ns}'.encode()).hexdigest()[:16]
+
+    def _entry_path(self, file_path: str, variant: str = '') -> str:
+        variant_key = hashlib.sha1(variant.encode()).hexdigest()[:8]
+        name = f'{self._path_key(file_path)}_{self._version_key(file_path)}_{variant_key}{self._SUFFIX}'
+        return os.path.join(self.cache_dir, name)
+
+    def _entries(self, file_path: str = None) -> list[str]:
+        prefix = f'{self._path_key(file_path)}_' if file_path is not None else ''
+        return glob.glob(os.path.join(self.cache_dir, f'{prefix}*{self._SUFFIX}'))
+
+    def get(self, file_path: str, variant: str = '', dtype_backend: str = None) -> DataFrame:
+        """
+        Returns the cached copy of `file_path`, or None if it was never cached or has changed since.
+
+        Args:
+            file_path (str): Path to the source file.
+            variant (str): Read options the cached frame was produced with. Defaults to ''.
+            dtype_backend (str): 'pyarrow' to return Arrow-backed columns. Defaults to None.
+        """
+        entry = self._entry_path(file_path, variant)
+        if not os.path.exists(entry):
+            self.misses += 1
+            return None
+        try:
+            data = read_feather(entry, **({'dtype_backend': dtype_backend} if dtype_backend else {}))
+        except Exception:
+            # A truncated or unreadable entry is treated as a miss and rebuilt
+            os.remove(entry)
+            self.misses += 1
+            return None
+        os.utime(entry)  # Mark as recently used for LRU eviction
+        self.hits += 1
+        return data
+
+    def put(self, file_path: str, data: DataFrame, variant: str = '') -> bool:
+        """
+        Stores `data` as the cached copy of `file_path` and evicts old entries past the budget.
+
+        Frames Feather cannot represent as-is (a non-default index, non-string column names,
+        or mixed-type object columns) are not cached.
+
+        Args:
+            file_path (str): Path to the source file.
+            data (DataFrame): The frame parsed from `file_path`.
+            variant (str): Read options `data` was produced with. Defaults to ''.
+
+        Returns:
+            bool: True if the entry was written.
+        """
+        if not isinstance(data.index, RangeIndex) or data.index.start != 0 or data.index.step != 1:
+            return False
+        if not all(isinstance(col, str) for col in data.columns):
+            return False
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = self._entry_path(file_path, variant)
+        tmp_path = f'{entry}.tmp'
+        try:
+            data.to_feather(tmp_path)
+            os.replace(tmp_path, entry)  # Readers never see a half-written entry
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        current_prefix = f'{self._path_key(file_path)}_{self._version_key(file_path)}_'
+        for stale in self._entries(file_path):
+            if not os.path.basename(stale).startswith(current_prefix):
+                os.remove(stale)  # Left behind by an older version of the source file
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache fits in `max_bytes`."""
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(entry) for entry in entries)
+        while entries and total > self.max_bytes:
+            oldest = entries.pop(0)
+            total -= os.path.getsize(oldest)
+            os.remove(oldest)
+
+    def invalidate(self, file_path: str = None) -> None:
+        """
+        Drops cached entries.
+
+        Args:
+            file_path (str): Source file whose entries to drop. Defaults to None, which clears the whole cache.
+        """
+        for entry in self._entries(file_path):
+            os.remove(entry)
+
+    def size(self) -> int:
+        """Returns the total size of the cache on disk, in bytes."""
+        return sum(os.path.getsize(entry) for entry in self._entries())
@@ -0,0 +1,158 @@
+import re
+import json
+import codecs
+from io import BytesIO
+from itertools import islice
+from typing import BinaryIO, Iterator
+from pandas import ArrowDtype, DataFrame, concat, json_normalize, read_json
+
+# Bytes inspected to tell line-delimited JSON from a JSON document
+_SNIFF_BYTES = 64 * 2**10
+
+# Bytes read at a time while splitting a top-level array into records
+_ARRAY_BLOCK_BYTES = 2**20
+
+_LINE_SUFFIXES = ('.jsonl', '.ndjson')
+
+_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def json_layout(file_path: str) -> str:
+    """
+    Tells how a JSON file stores its records, from its suffix and first few kilobytes.
+
+    Returns:
+        'lines' for one object per line (.jsonl / .ndjson files, or a .json file whose first
+        line is a complete object followed by another line), 'array' for a top-level array
+        of objects, or None for any other document, which is read whole by `read_json`.
+    """
+    if file_path.lower().endswith(_LINE_SUFFIXES):
+        return 'lines'
+    with open(file_path, 'rb') as f:
+        head = f.read(_SNIFF_BYTES)
+    head = head.removeprefix(codecs.BOM_UTF8).lstrip()
+    if head.startswith(b'['):
+        return 'array' if head[1:].lstrip().startswith(b'{') else None
+    if not head.startswith(b'{'):
+        return None
+    first_line, _, rest = head.partition(b'\n')
+    if not rest.lstrip().startswith(b'{'):
+        return None  # A single object, or a pretty-printed document
+    try:
+        return 'lines' if isinstance(json.loads(first_line), dict) else None
+    except ValueError:
+        return None
+
+
+def iter_json_batches(f: BinaryIO, layout: str, rows: int) -> Iterator[bytes]:
+    """
+    Yields the records of a binary JSON file as line-delimited batches of up to `rows` records.
+
+    Only one batch (and, for arrays, one block of the file) is held at a time, so memory
+    stays proportional to `rows` rather than to the file. `f.tell()` tracks the bytes consumed.
+
+    Args:
+        f (BinaryIO): The open file.
+        layout (str): 'lines' or 'array', as returned by `json_layout`.
+        rows (int): Records per batch.
+
+    Raises:
+        ValueError: If an array holds something other than objects, or ends early.
+    """
+    if layout == 'lines':
+        while True:
+            lines = list(islice(f, rows))
+            if not lines:
+                return
+            yield b''.join(lines)
+    else:
+        yield from _array_batches(f, rows)
+
+
+def _array_batches(f: BinaryIO, rows: int) -> Iterator[bytes]:
+    """Splits a top-level array of objects into line-delimited batches, decoding it block by block."""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer, position, eof = '', 0, False
+    records: list[str] = []
+
+    def _fill() -> bool:
+        nonlocal buffer, position, eof
+        block = f.read(_ARRAY_BLOCK_BYTES)
+        eof = not block
+        buffer = buffer[position:] + text_decoder.decode(block, final=eof)
+        position = 0
+        return not eof
+
+    _fill()
+    position = buffer.index('[') + 1
+    while True:
+        position = _SEPARATORS.match(buffer, position).end()
+        if position == len(buffer):
+            if _fill():
+                continue
+            raise ValueError('The JSON array is not closed.')
+        if buffer[position] == ']':
+            break
+        if buffer[position] != '{':
+            raise ValueError('The JSON array holds values other than objects.')
+        try:
+            _, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if _fill():
+                continue  # The object runs past the block
+            raise
+        # Raw newlines only occur between tokens, so each record fits on one line
+        records.append(buffer[position:end].replace('\n', ' ').replace('\r', ' '))
+        position = end
+        if len(records) == rows:
+            yield '\n'.join(records).encode()
+            records = []
+    if records:
+        yield '\n'.join(records).encode()
+
+
+def read_json_batch(batch: bytes, dtype_backend: str = None) -> DataFrame:
+    """
+    Parses a line-delimited batch, with nested objects flattened into 'parent.child' columns.
+
+    pyarrow's multithreaded JSON reader is tried first; batches it rejects, such as a field
+    whose type changes between records, go through `read_json(lines=True)` instead.
+
+    Args:
+        batch (bytes): One record per line.
+        dtype_backend (str): 'pyarrow' for ArrowDtype columns. Defaults to None (NumPy dtypes).
+    """
+    import pyarrow
+    from pyarrow.json import read_json as read_json_table
+    try:
+        table = read_json_table(BytesIO(batch))
+    except pyarrow.ArrowInvalid:
+        options = {'dtype_backend': dtype_backend} if dtype_backend is not None else {}
+        return flatten_nested(read_json(BytesIO(batch), lines=True, **options))
+    while any(pyarrow.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table.to_pandas(types_mapper=ArrowDtype) if dtype_backend == 'pyarrow' else table.to_pandas()
+
+
+def flatten_nested(data: DataFrame, sep: str = '.') -> DataFrame:
+    """
+    Replaces every column holding objects with one column per (nested) key, named
+    'parent.child' as `json_normalize` does. Values that are not objects are dropped
+    from such columns; lists are kept as they are.
+    """
+    nested = [col for col in data.columns if data[col].dtype == object
+              and isinstance(data[col].dropna().iloc[0] if data[col].notna().any() else None, dict)]
+    if not nested:
+        return data
+    parts = []
+    for col in data.columns:
+        if col not in nested:
+            parts.append(data[[col]])
+            continue
+        values = [value if isinstance(value, dict) else {} for value in data[col]]
+        flat = json_normalize(values, sep=sep)
+        flat.columns = [f'{col}{sep}{key}' for key in flat.columns]
+        flat.index = data.index
+        parts.append(flat)
+    return concat(parts, axis=1)
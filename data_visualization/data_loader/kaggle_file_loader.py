@@ -1,17 +1,251 @@
-import opendatasets as od
+import os
 import json
+import base64
+import shutil
+import hashlib
+import zipfile
+import urllib.error
+import urllib.parse
+import urllib.request
+from threading import Event
+from typing import Callable
+from .local_file_loader import LoadCancelled
+from .dataset_store import DatasetStore
+
+# Called with (stage, done, total) while a dataset downloads ('download', bytes), while it
+# is extracted ('extract', files) and while its files are compacted ('compact', files).
+DownloadProgress = Callable[[str, int, int], None]
+
+
+class _StripAuthRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Follows redirects, dropping credentials when the target is another host (e.g. signed storage URLs)."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        new_request = super().redirect_request(req, fp, code, msg, headers, newurl)
+        if new_request is not None and urllib.parse.urlsplit(newurl).netloc != urllib.parse.urlsplit(req.full_url).netloc:
+            new_request.remove_header('Authorization')
+        return new_request
+
 
-# TODO: Implement KaggleFile class
 class KaggleFile:
-    def __init__(self) -> None:
-        pass
+    """
+    Downloads Kaggle datasets through the Kaggle API into a DatasetStore.
+
+    A dataset version already in the store is opened from there without downloading it.
+    Otherwise the archive is streamed to the store's download folder as `<name>.zip.part`
+    and renamed once complete, so an interrupted download resumes from the bytes already
+    on disk with an HTTP Range request. The archive is then extracted, added to the store
+    (compacted to Parquet with `compact`) and removed.
+
+    URLs ending in '/versions/<n>' pin that version; other URLs ask the API for the current
+    version, and fall back to the newest stored one when it cannot be reached.
+
+    Methods:
+        download(self, url: str, progress: DownloadProgress = None, cancel_event: Event = None) -> str:
+            Downloads and extracts a dataset, returning its folder.
+
+    Download a dataset, or point the client at a local stand-in server:
+        folder = KaggleFile().download("https://www.kaggle.com/datasets/owner/slug")
+        folder = KaggleFile(api_url="http://127.0.0.1:8000/api/v1").download("owner/slug")
+
+    Keep at most 5 GB of compacted datasets:
+        folder = KaggleFile(store=DatasetStore(max_bytes=5 * 2**30), compact=True).download("owner/slug")
+    """
+    _API_URL: str = 'https://www.kaggle.com/api/v1'
+    _CHUNK_BYTES: int = 1 << 20
+
+    def __init__(self, api_url: str = None, data_dir: str = './Datasets',
+                 credentials_path: str = 'kaggle.json', store: DatasetStore = None,
+                 compact: bool = False) -> None:
+        """
+        Args:
+            api_url (str): Base URL of the Kaggle API. Defaults to `_API_URL`.
+            data_dir (str): Root of the default store. Defaults to './Datasets'.
+            credentials_path (str): The kaggle.json file holding the username and key.
+            store (DatasetStore): Where datasets are kept. Defaults to a DatasetStore in `data_dir`.
+            compact (bool): Rewrite the CSV and JSON files of new downloads as compressed
+                Parquet. Defaults to False.
+        """
+        self.api_url = (api_url or self._API_URL).rstrip('/')
+        self.data_dir = data_dir
+        self.credentials_path = credentials_path
+        self.store = store if store is not None else DatasetStore(data_dir)
+        self.compact = compact
+        # Whether the last `download` found the dataset in the store
+        self.from_store: bool = False
+        self._opener = urllib.request.build_opener(_StripAuthRedirectHandler)
+
+    @staticmethod
+    def dataset_id(url: str) -> str:
+        """
+        Extracts '<owner>/<slug>' from a dataset URL such as
+        'https://www.kaggle.com/datasets/owner/slug' or from an 'owner/slug' string.
+
+        Raises:
+            ValueError: If no owner and slug can be found.
+        """
+        path = urllib.parse.urlsplit(url.strip()).path if '://' in url else url.strip()
+        parts = [part for part in path.split('/') if part]
+        if parts and parts[0] == 'datasets':
+            parts = parts[1:]
+        if len(parts) < 2:
+            raise ValueError(f'Invalid Kaggle dataset URL: {url}')
+        return f'{parts[0]}/{parts[1]}'
+
+    @staticmethod
+    def dataset_version(url: str) -> int:
+        """Returns the version pinned by a URL ending in '/versions/<n>', or None."""
+        path = urllib.parse.urlsplit(url.strip()).path if '://' in url else url.strip()
+        parts = [part for part in path.split('/') if part]
+        if 'versions' in parts[:-1] and parts[parts.index('versions') + 1].isdigit():
+            return int(parts[parts.index('versions') + 1])
+        return None
+
+    def current_version(self, dataset_id: str) -> int:
+        """Asks the API for the current version number of a dataset; None if it cannot be reached."""
+        request = urllib.request.Request(f'{self.api_url}/datasets/view/{dataset_id}')
+        auth = self._auth_header()
+        if auth is not None:
+            request.add_header('Authorization', auth)
+        try:
+            with self._opener.open(request, timeout=10) as response:
+                version = json.load(response).get('currentVersionNumber')
+        except (OSError, ValueError):
+            return None
+        return int(version) if version is not None else None
 
+    def _auth_header(self) -> str:
+        """Builds a Basic auth header from kaggle.json or the KAGGLE_USERNAME/KAGGLE_KEY variables."""
+        username, key = os.environ.get('KAGGLE_USERNAME'), os.environ.get('KAGGLE_KEY')
+        if not (username and key) and os.path.exists(self.credentials_path):
+            with open(self.credentials_path) as f:
+                credentials = json.load(f)
+            username, key = credentials.get('username'), credentials.get('key')
+        if not (username and key):
+            return None
+        return 'Basic ' + base64.b64encode(f'{username}:{key}'.encode()).decode()
+
+    def download(self, url: str, progress: DownloadProgress = None, cancel_event: Event = None) -> str:
+        """
+        Downloads and extracts a dataset into the store, unless that version is stored already.
+
+        Args:
+            url (str): Dataset URL or '<owner>/<slug>'.
+            progress (DownloadProgress): Called with (stage, done, total) as the work advances.
+            cancel_event (Event): When set from another thread, stops after the current chunk.
+                A cancelled download keeps its partial archive and resumes on the next call.
+
+        Returns:
+            str: The dataset's folder in the store.
+
+        Raises:
+            ValueError: If the URL or the dataset is invalid.
+            PermissionError: If the credentials are missing or rejected.
+            LoadCancelled: If `cancel_event` is set before the work finishes.
+        """
+        dataset_id = self.dataset_id(url)
+        version = self.dataset_version(url)
+        if version is None:
+            version = self.current_version(dataset_id)
+        folder = self.store.lookup(dataset_id, version)
+        self.from_store = folder is not None
+        if folder is not None:
+            return folder
+
+        archive = self._download_archive(dataset_id, version, self.store.download_path(dataset_id, version),
+                                         progress, cancel_event)
+        content = _sha256(archive)
+        staging = os.path.splitext(archive)[0]
+        self._extract(archive, staging, progress, cancel_event)
+        folder = self.store.add(dataset_id, version, staging, content, self.compact, progress, cancel_event)
+        os.remove(archive)  # Kept until now, so a cancelled compaction starts over from it
+        return folder
+
+    def _download_archive(self, dataset_id: str, version: int, archive: str, progress: DownloadProgress = None,
+                          cancel_event: Event = None) -> str:
+        """Streams the dataset archive to `archive`, resuming a previous partial download."""
+        if os.path.exists(archive):
+            return archive  # Downloaded before, but not added to the store yet
+        os.makedirs(os.path.dirname(archive), exist_ok=True)
+        part = archive + '.part'
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+
+        query = f'?datasetVersionNumber={version}' if version is not None else ''
+        request = urllib.request.Request(f'{self.api_url}/datasets/download/{dataset_id}{query}')
+        auth = self._auth_header()
+        if auth is not None:
+            request.add_header('Authorization', auth)
+        if offset:
+            request.add_header('Range', f'bytes={offset}-')
+
+        try:
+            response = self._opener.open(request, timeout=60)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                if zipfile.is_zipfile(part):
+                    os.replace(part, archive)  # The previous attempt had already received every byte
+                    return archive
+                # The partial file does not match what the server has now, e.g. a changed archive
+                os.remove(part)
+                return self._download_archive(dataset_id, version, archive, progress, cancel_event)
+            if e.code in (401, 403):
+                raise PermissionError('Kaggle rejected the credentials.') from e
+            raise ValueError(f'Could not download dataset {dataset_id} (HTTP {e.code}).') from e
+
+        with response:
+            if response.status != 206:
+                offset = 0  # The server ignored the range, so start over
+            length = response.headers.get('Content-Length')
+            total = offset + int(length) if length is not None else 0
+            done = offset
+            with open(part, 'ab' if offset else 'wb') as f:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise LoadCancelled(dataset_id)
+                    chunk = response.read(self._CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    if progress is not None:
+                        progress('download', done, total)
+
+        if total and done < total:
+            raise ConnectionError(f'Connection closed after {done} of {total} bytes; retry to resume.')
+        os.replace(part, archive)
+        return archive
+
+    def _extract(self, archive: str, folder: str, progress: DownloadProgress = None,
+                 cancel_event: Event = None) -> None:
+        """Extracts `archive` into `folder` through a temporary folder."""
+        if not zipfile.is_zipfile(archive):
+            os.remove(archive)
+            raise ValueError('The downloaded file is not a zip archive.')
+        staging = folder + '.extracting'
+        shutil.rmtree(staging, ignore_errors=True)
+        with zipfile.ZipFile(archive) as zf:
+            members = zf.infolist()
+            for i, member in enumerate(members):
+                if cancel_event is not None and cancel_event.is_set():
+                    shutil.rmtree(staging, ignore_errors=True)
+                    raise LoadCancelled(archive)
+                zf.extract(member, staging)
+                if progress is not None:
+                    progress('extract', i + 1, len(members))
+        shutil.rmtree(folder, ignore_errors=True)
+        os.replace(staging, folder)
+
+    @staticmethod
     def download_kaggle_dataset(url: str = None, dry_run: bool = False):
+        if dry_run:
+            KaggleFile.dataset_id(url)  # Only validates the URL
+            return
         try:
-            od.download(dataset_id_or_url=url, data_dir='./Datasets', dry_run = dry_run)
+            KaggleFile().download(url)
         except ValueError as e:
-            raise "Invalid URL."
+            raise ValueError("Invalid URL.") from e
 
+    @staticmethod
     def set_credentials(username: str = None, key: str = None):
         credentials = {
             "username": username,
@@ -20,5 +254,14 @@ class KaggleFile:
         try:
             with open('kaggle.json', 'w') as f:
                 json.dump(credentials, f)
-        except ValueError as e:
-            raise "JSON file was not found."
+        except OSError as e:
+            raise FileNotFoundError("JSON file was not found.") from e
+
+
+def _sha256(file_path: str) -> str:
+    """Returns the SHA-256 hex digest of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,77 @@
+import threading
+from typing import Callable
+from pandas import DataFrame, Series
+
+
+class LazyDataset:
+    """
+    A dataset whose schema is known up front but whose columns are read on first use.
+
+    Only the columns a caller asks for are read from the source, and each column is
+    kept once read, so later requests for the same column are served from memory.
+    Threads may share a dataset; a column requested by several at once is read once.
+
+    Attributes:
+        schema (DataFrame): An empty frame with the dataset's column names and dtypes.
+        num_rows (int): Row count when the source's metadata provides it, otherwise None.
+
+    Fetch the columns a plot needs:
+        data = dataset.get("age", "income")
+    """
+
+    def __init__(self, schema: DataFrame, read_columns: Callable[[list[str]], DataFrame],
+                 num_rows: int = None) -> None:
+        """
+        Args:
+            schema (DataFrame): An empty frame describing the dataset's columns.
+            read_columns (Callable[[list[str]], DataFrame]): Reads the given columns from the source.
+            num_rows (int): Row count from the source's metadata, if known. Defaults to None.
+        """
+        self.schema = schema
+        self.num_rows = num_rows
+        self._read_columns = read_columns
+        self._loaded: dict[str, Series] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, data: DataFrame) -> "LazyDataset":
+        """Wraps an already materialized frame, for sources that cannot read a column subset."""
+        dataset = cls(data.iloc[:0], lambda columns: data[columns], num_rows=len(data))
+        dataset._loaded = {col: data[col] for col in data.columns}
+        return dataset
+
+    @property
+    def columns(self):
+        """The dataset's column names."""
+        return self.schema.columns
+
+    def loaded_columns(self) -> list[str]:
+        """Returns the names of the columns already read from the source."""
+        return list(self._loaded)
+
+    def get(self, *columns: str) -> DataFrame:
+        """
+        Returns a frame holding the requested columns, reading only those not yet loaded.
+
+        Args:
+            *columns (str): Column names; None entries and duplicates are ignored.
+
+        Returns:
+            DataFrame with the requested columns in the order given.
+
+        Raises:
+            ValueError: If a column is not part of the dataset.
+        """
+        wanted = list(dict.fromkeys(col for col in columns if col is not None))
+        unknown = [col for col in wanted if col not in self.schema.columns]
+        if unknown:
+            raise ValueError(f'Columns not found in dataset: {unknown}')
+
+        # Held while reading, so a thread asking for a column being read waits for it
+        with self._lock:
+            missing = [col for col in wanted if col not in self._loaded]
+            if missing:
+                data = self._read_columns(missing)
+                for col in missing:
+                    self._loaded[col] = data[col]
+        return DataFrame({col: self._loaded[col] for col in wanted})
@@ -1,31 +1,417 @@
 import os
+import re
+import glob
+import numpy as np
+import multiprocessing
+from io import BytesIO
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
 from enum import Enum
-from typing import Any
+from threading import Event
+from typing import Any, Callable, NamedTuple, Union
+from .file_cache import FileCache
+from .lazy_dataset import LazyDataset
+from .chunked_dataset import ChunkedDataset
+from .excel import excel_engine, list_sheets
+from .json_stream import json_layout, iter_json_batches, read_json_batch
+from data_visualization.instrumentation import timer
 from pandas import (
     read_csv,
     read_excel,
     read_parquet,
     read_json,
     read_pickle,
+    to_numeric,
+    concat,
+    factorize,
+    ArrowDtype,
+    Categorical,
+    CategoricalDtype,
     DataFrame
 )
+from pandas.api.types import is_numeric_dtype, is_bool_dtype, is_datetime64_any_dtype
+
+# Called with (bytes_read, total_bytes, rows_parsed) while a file is being read.
+ProgressCallback = Callable[[int, int, int], None]
+
+
+class MemoryReport(NamedTuple):
+    """
+    Memory footprint of a DataFrame before and after dtype downcasting and categorical encoding, in bytes.
+
+    Attributes:
+        before (int): Size of the frame as parsed by pandas.
+        after (int): Size of the frame once numeric columns were downcast and repetitive text encoded.
+    """
+    before: int
+    after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of the original memory that downcasting saved."""
+        return 1 - self.after / self.before if self.before else 0.0
+
+
+def downcast_numeric(data: DataFrame) -> DataFrame:
+    """
+    Downcasts every numeric column in place to the smallest dtype that holds its values,
+    e.g. int64 -> int8/int16/int32 and float64 -> float32 when no precision is lost.
+
+    Args:
+        data (DataFrame): The frame to downcast.
+
+    Returns:
+        The same DataFrame, for chaining.
+    """
+    for col in data.select_dtypes(include=['integer']).columns:
+        data[col] = to_numeric(data[col], downcast='integer')
+    for col in data.select_dtypes(include=['floating']).columns:
+        data[col] = to_numeric(data[col], downcast='float')
+    return data
+
+
+def encode_categories(data: DataFrame, max_ratio: float = 0.5, columns: list[str] = None) -> DataFrame:
+    """
+    Converts text columns with few distinct values to `category` dtype in place, so each
+    value is stored once and rows hold small integer codes.
+
+    Categories keep the order in which values first appear, which is the order seaborn
+    uses for text columns, so plots look the same before and after encoding.
+
+    Args:
+        data (DataFrame): The frame to encode.
+        max_ratio (float): Encode a column when its distinct values are at most this
+            fraction of its rows. Defaults to 0.5.
+        columns (list[str]): Encode exactly these columns, skipping the ratio check.
+            Defaults to None (check every text column).
+
+    Returns:
+        The same DataFrame, for chaining.
+    """
+    candidates = data.select_dtypes(include=['object', 'string']).columns if columns is None else columns
+    for col in candidates:
+        values = data[col]
+        if isinstance(values.dtype, CategoricalDtype):
+            continue
+        try:
+            codes, uniques = factorize(values)
+        except TypeError:
+            continue  # Unhashable cells such as lists
+        if columns is None and (not len(values) or len(uniques) > max_ratio * len(values)):
+            continue
+        data[col] = Categorical.from_codes(codes, uniques)
+    return data
+
+
+def concat_frames(frames: list[DataFrame]) -> DataFrame:
+    """
+    Concatenates frames like `concat(frames, ignore_index=True)`, but keeps columns that are
+    categorical in any frame categorical, merging their categories in order of appearance,
+    where a plain concat would fall back to an object column of Python strings.
+    """
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if not any(isinstance(frame[col].dtype, CategoricalDtype) for frame in frames if col in frame.columns):
+                continue
+            if not all(col in frame.columns for frame in frames):
+                continue
+            for frame in frames:
+                encode_categories(frame, columns=[col])
+            parts = [frame[col] for frame in frames]
+            if not all(isinstance(part.dtype, CategoricalDtype) for part in parts):
+                continue  # Not text in every frame
+            categories = parts[0].cat.categories.append([part.cat.categories for part in parts[1:]]).unique()
+            for frame in frames:
+                frame[col] = frame[col].cat.set_categories(categories)
+    return concat(frames, ignore_index=True)
+
+
+class LoadCancelled(Exception):
+    """Raised when a read is aborted through its cancel event."""
+
+
+class SchemaMismatchError(ValueError):
+    """Raised when the shards of a partitioned dataset have incompatible columns."""
+
+
+def _arrow_to_pandas(table, dtype_backend: str = None) -> DataFrame:
+    """Converts a pyarrow Table, wrapping its columns in ArrowDtype instead of copying them to NumPy for 'pyarrow'."""
+    if dtype_backend == 'pyarrow':
+        return table.to_pandas(types_mapper=ArrowDtype)
+    return table.to_pandas()
+
+
+def read_arrow(file_path: str, columns: list[str] = None, dtype_backend: str = None) -> DataFrame:
+    """
+    Reads a Feather or Arrow IPC file through a memory map.
+
+    Uncompressed files are not copied: the Arrow buffers point into the mapped file and,
+    with dtype_backend='pyarrow', the returned frame wraps them as they are. Compressed
+    files are decompressed into memory as usual.
+
+    Args:
+        file_path (str): Path to a .feather, .arrow or .ipc file.
+        columns (list[str]): Columns to read. Defaults to None (all columns).
+        dtype_backend (str): 'pyarrow' for ArrowDtype columns. Defaults to None (NumPy dtypes).
+    """
+    from pyarrow.feather import read_table
+    return _arrow_to_pandas(read_table(file_path, columns=columns, memory_map=True), dtype_backend)
+
+
+# Rows sampled from text formats to infer a lazy dataset's column dtypes
+_SCHEMA_SAMPLE_ROWS = 1_000
+
+
+def _csv_schema(file_path: str, dtype_backend: str = None) -> tuple[DataFrame, int]:
+    return read_csv(file_path, nrows=_SCHEMA_SAMPLE_ROWS, **_backend_option(dtype_backend)).iloc[:0], None
+
+
+def _csv_columns(file_path: str, columns: list[str], dtype_backend: str = None) -> DataFrame:
+    return read_csv(file_path, usecols=columns, **_backend_option(dtype_backend))
+
+
+def _parquet_schema(file_path: str, dtype_backend: str = None) -> tuple[DataFrame, int]:
+    from pyarrow.parquet import ParquetFile
+    parquet_file = ParquetFile(file_path)
+    return _arrow_to_pandas(parquet_file.schema_arrow.empty_table(), dtype_backend), parquet_file.metadata.num_rows
+
+
+def _parquet_columns(file_path: str, columns: list[str], dtype_backend: str = None) -> DataFrame:
+    return read_parquet(file_path, columns=columns, **_backend_option(dtype_backend))
+
+
+def _excel_schema(file_path: str, dtype_backend: str = None, sheet_name: Union[str, int] = 0,
+                  engine: str = None) -> tuple[DataFrame, int]:
+    schema = read_excel(file_path, sheet_name=sheet_name, nrows=_SCHEMA_SAMPLE_ROWS, engine=engine,
+                        **_backend_option(dtype_backend)).iloc[:0]
+    sheets = list_sheets(file_path)
+    sheet = sheets[sheet_name] if isinstance(sheet_name, int) else next(s for s in sheets if s.name == sheet_name)
+    return schema, sheet.rows
+
+
+def _excel_columns(file_path: str, columns: list[str], dtype_backend: str = None, sheet_name: Union[str, int] = 0,
+                   engine: str = None) -> DataFrame:
+    return read_excel(file_path, sheet_name=sheet_name, usecols=columns, engine=engine,
+                      **_backend_option(dtype_backend))
+
+
+def _arrow_schema(file_path: str, dtype_backend: str = None) -> tuple[DataFrame, int]:
+    import pyarrow
+    from pyarrow.ipc import open_file
+    with pyarrow.memory_map(file_path) as source:
+        schema = open_file(source).schema  # Only the footer is read, not the record batches
+    return _arrow_to_pandas(schema.empty_table(), dtype_backend), None
+
+
+def _backend_option(dtype_backend: str = None) -> dict:
+    # pandas rejects dtype_backend=None, so the option is only passed when set
+    return {'dtype_backend': dtype_backend} if dtype_backend is not None else {}
+
+
+# Evenly spaced blocks of the file a spread preview takes its rows from
+_PREVIEW_BLOCKS = 32
+
+
+def _spread_lines(file_path: str, rows: int, header: bool) -> tuple[bytes, bytes]:
+    """
+    Reads about `rows` whole lines of a text file from `_PREVIEW_BLOCKS` evenly spaced blocks,
+    seeking past everything in between.
+
+    Returns:
+        (header, lines): The first line if `header` is True (otherwise b''), and the sampled lines.
+    """
+    size = os.path.getsize(file_path)
+    per_block = max(rows // _PREVIEW_BLOCKS, 1)
+    lines = []
+    with open(file_path, 'rb') as f:
+        first = f.readline() if header else b''
+        start = end = f.tell()
+        for block in range(_PREVIEW_BLOCKS):
+            offset = start + (size - start) * block // _PREVIEW_BLOCKS
+            if offset > end:
+                f.seek(offset - 1)
+                f.readline()  # Skip to the start of the next whole line
+            elif end > f.tell():
+                f.seek(end)  # Blocks of small files overlap; continue after the last one
+            lines.extend(islice(f, per_block))
+            end = f.tell()
+    return first, b''.join(line if line.endswith(b'\n') else line + b'\n' for line in lines)
+
+
+def _csv_preview(file_path: str, rows: int, spread: bool, dtype_backend: str = None) -> DataFrame:
+    if not spread:
+        return read_csv(file_path, nrows=rows, **_backend_option(dtype_backend))
+    header, lines = _spread_lines(file_path, rows, header=True)
+    # A block may start inside a quoted field spanning lines; such rows are dropped
+    return read_csv(BytesIO(header + lines), on_bad_lines='skip', **_backend_option(dtype_backend))
+
+
+def _json_preview(file_path: str, rows: int, spread: bool, dtype_backend: str = None) -> DataFrame:
+    layout = json_layout(file_path)
+    if layout is None:
+        return None  # A single document has to be parsed whole
+    if spread and layout == 'lines':
+        _, batch = _spread_lines(file_path, rows, header=False)
+    else:
+        with open(file_path, 'rb') as f:
+            batch = next(iter_json_batches(f, layout, rows), b'')
+    return read_json_batch(batch, dtype_backend)
+
+
+def _parquet_preview(file_path: str, rows: int, spread: bool, dtype_backend: str = None) -> DataFrame:
+    import pyarrow
+    from pyarrow.parquet import ParquetFile
+    parquet_file = ParquetFile(file_path)
+    n_groups = parquet_file.num_row_groups
+    groups = np.unique(np.linspace(0, n_groups - 1, min(n_groups, _PREVIEW_BLOCKS)).astype(int)) if spread else [0]
+    per_group = max(rows // len(groups), 1) if n_groups else rows
+    # Only the first batch of each row group is decoded
+    batches = [next(parquet_file.iter_batches(batch_size=per_group, row_groups=[int(group)]), None)
+               for group in groups if n_groups]
+    table = pyarrow.Table.from_batches([batch for batch in batches if batch is not None],
+                                       schema=parquet_file.schema_arrow)
+    return _arrow_to_pandas(table, dtype_backend)
+
+
+def _excel_preview(file_path: str, rows: int, spread: bool, dtype_backend: str = None,
+                   sheet_name: Union[str, int] = 0, engine: str = None) -> DataFrame:
+    # Workbooks are parsed from the top, so a preview is always the first rows
+    return read_excel(file_path, sheet_name=sheet_name, nrows=rows, engine=engine, **_backend_option(dtype_backend))
+
+
+def _arrow_preview(file_path: str, rows: int, spread: bool, dtype_backend: str = None) -> DataFrame:
+    from pyarrow.feather import read_table
+    table = read_table(file_path, memory_map=True)
+    if spread and table.num_rows > rows:
+        table = table.take(np.linspace(0, table.num_rows - 1, rows).astype(np.int64))
+    else:
+        table = table.slice(0, rows)
+    return _arrow_to_pandas(table, dtype_backend)
+
+
 class FileExtension(Enum):
     """
     Enumerates supported file extensions and their associated file types.
 
     Attributes:
         CSV (str): Represents CSV files.
-        JSON (str): Represents JSON files.
+        JSON (tuple): Represents JSON files with extensions "json", "jsonl" or "ndjson".
         PARQUET (str): Represents Parquet files.
         EXCEL (tuple): Represents Excel files with extensions "xlsx" or "xls".
         PICKLE (tuple): Represents Pickle files with extensions "pickle", "pkl", or "p".
+        ARROW (tuple): Represents Feather / Arrow IPC files with extensions "feather", "arrow", or "ipc".
     """
 
     CSV = "csv"
-    JSON = "json"
+    JSON = ("json", "jsonl", "ndjson")
     PARQUET = "parquet"
     EXCEL = ("xlsx", "xls")
     PICKLE = ("pickle", "pkl", "p")
+    ARROW = ("feather", "arrow", "ipc")
+
+
+def extension_of(file_path: str) -> FileExtension:
+    """Returns the FileExtension matching the file's suffix exactly, or None if it is not supported."""
+    suffix = os.path.splitext(file_path)[1][1:].lower()
+    for ext in FileExtension:
+        if suffix == ext.value or (isinstance(ext.value, tuple) and suffix in ext.value):
+            return ext
+    return None
+
+
+def is_partitioned(path: str) -> bool:
+    """
+    Returns True for paths read as a set of shards: directories and glob patterns.
+    An existing file is never a pattern, even if its name holds '*', '?' or '['.
+    """
+    if os.path.isfile(path):
+        return False
+    return os.path.isdir(path) or any(char in path for char in '*?[')
+
+
+def find_shards(path: str) -> tuple[str, list[str]]:
+    """
+    Lists the data files of a directory (searched recursively) or of a glob pattern.
+
+    Files with unsupported extensions and names starting with '.' or '_' (such as
+    '_SUCCESS' markers written next to Hive partitions) are skipped.
+
+    Returns:
+        (root, shards): The directory shard names are reported relative to, and the shard
+            paths in natural order ('part-2' before 'part-10').
+
+    Raises:
+        ValueError: If no supported file is found.
+    """
+    if os.path.isdir(path):
+        root = path
+        candidates = glob.glob(os.path.join(glob.escape(path), '**', '*'), recursive=True)
+    else:
+        # The leading part of the pattern without wildcards is the root
+        root = path
+        while any(char in root for char in '*?['):
+            root = os.path.dirname(root)
+        root = root or os.curdir
+        candidates = glob.glob(path, recursive=True)
+
+    shards = [
+        candidate for candidate in candidates
+        if os.path.isfile(candidate)
+        and not any(part.startswith(('.', '_')) for part in os.path.relpath(candidate, root).split(os.sep))
+        and extension_of(candidate) is not None
+    ]
+    shards.sort(key=_natural_key)
+    if not shards:
+        raise ValueError(f'No supported data files found in {path}')
+    return root, shards
+
+
+def partition_values(shard: str, root: str) -> dict[str, str]:
+    """Returns the Hive-style 'key=value' directory names between `root` and `shard` as a dict."""
+    values = {}
+    for part in os.path.relpath(os.path.dirname(shard) or os.curdir, root).split(os.sep):
+        key, sep, value = part.partition('=')
+        if sep and key:
+            values[key] = value
+    return values
+
+
+def _dtype_family(values) -> str:
+    """Groups dtypes that concatenate without losing meaning: all numbers, all datetimes, all text."""
+    if is_bool_dtype(values.dtype):
+        return 'bool'
+    if is_numeric_dtype(values.dtype):
+        return 'number'
+    if is_datetime64_any_dtype(values.dtype):
+        return 'datetime'
+    return 'other'
+
+
+def check_schemas(frames: list[DataFrame], shards: list[str]) -> None:
+    """
+    Checks that the shards can be concatenated into one dataset: they must have the same
+    columns and each column must hold the same kind of values (numbers, datetimes, text...).
+    Columns that are entirely missing in a shard are compatible with any kind.
+
+    Raises:
+        SchemaMismatchError: Naming the first shard and column that differ from the first shard.
+    """
+    reference, reference_shard = frames[0], shards[0]
+    for data, shard in zip(frames[1:], shards[1:]):
+        if set(data.columns) != set(reference.columns):
+            missing = [col for col in reference.columns if col not in data.columns]
+            extra = [col for col in data.columns if col not in reference.columns]
+            raise SchemaMismatchError(
+                f'{shard} does not have the same columns as {reference_shard} '
+                f'(missing: {missing}, unexpected: {extra})'
+            )
+        for col in reference.columns:
+            expected, found = _dtype_family(reference[col]), _dtype_family(data[col])
+            if expected != found and not reference[col].isna().all() and not data[col].isna().all():
+                raise SchemaMismatchError(
+                    f'Column {col!r} holds {reference[col].dtype} values in {reference_shard} '
+                    f'but {data[col].dtype} values in {shard}'
+                )
 
 class File:
     """
@@ -35,21 +421,101 @@ class File:
         _get_extension(self) -> str:
             Determines the file extension from the stored filepath.
 
-        read(self, file_path: str = None) -> DataFrame:
+        read(self, file_path: str = None, progress: ProgressCallback = None,
+             cancel_event: Event = None) -> DataFrame:
             Reads the contents of a file into a pandas DataFrame.
+
+        read_preview(self, file_path: str = None, rows: int = None, spread: bool = False) -> DataFrame:
+            Reads the first rows of a file, or rows spread through it, to explore while it loads.
     """
+    _CSV_CHUNK_ROWS: int = 100_000
+
+    # Added to datasets read from several shards; holds each row's shard path relative to the root
+    _SOURCE_COLUMN: str = 'source_file'
+
+    # Text-based formats whose parsing is slow enough to be worth a columnar cache
+    _CACHEABLE: tuple[FileExtension, ...] = (FileExtension.CSV, FileExtension.JSON, FileExtension.EXCEL)
+
     _EXTENSIONS: dict[FileExtension, Any]= {
         FileExtension.CSV: read_csv,
         FileExtension.JSON: read_json,
         FileExtension.PARQUET: read_parquet,
         FileExtension.EXCEL: read_excel,
-        FileExtension.PICKLE: read_pickle
+        FileExtension.PICKLE: read_pickle,
+        FileExtension.ARROW: read_arrow
+    }
+
+    # Formats whose reader takes dtype_backend; Pickle restores the dtypes it was saved with
+    _ARROW_BACKED: tuple[FileExtension, ...] = (
+        FileExtension.CSV, FileExtension.JSON, FileExtension.PARQUET, FileExtension.EXCEL, FileExtension.ARROW
+    )
+
+    # (schema reader, column subset reader) for formats that can read a subset of columns
+    _PROJECTED_READERS: dict[FileExtension, tuple[Any, Any]] = {
+        FileExtension.CSV: (_csv_schema, _csv_columns),
+        FileExtension.PARQUET: (_parquet_schema, _parquet_columns),
+        FileExtension.EXCEL: (_excel_schema, _excel_columns),
+        FileExtension.ARROW: (_arrow_schema, read_arrow),
     }
 
-    def __init__(self) -> None:
+    # Readers of a quick preview for `read_preview`, called as reader(file_path, rows, spread, **reader options)
+    _PREVIEW_READERS: dict[FileExtension, Any] = {
+        FileExtension.CSV: _csv_preview,
+        FileExtension.JSON: _json_preview,
+        FileExtension.PARQUET: _parquet_preview,
+        FileExtension.EXCEL: _excel_preview,
+        FileExtension.ARROW: _arrow_preview,
+    }
+
+    _PREVIEW_ROWS: int = 100_000
+
+    # pyarrow.dataset formats that can be streamed in out-of-core mode
+    _CHUNKED_FORMATS: dict[FileExtension, str] = {
+        FileExtension.CSV: 'csv',
+        FileExtension.PARQUET: 'parquet',
+        FileExtension.ARROW: 'ipc',
+    }
+
+    def __init__(self, downcast: bool = False, chunk_size: int = None, cache: FileCache = None,
+                 lazy: bool = False, arrow: bool = False, max_workers: int = None,
+                 category_ratio: float = None, sheet_name: Union[str, int] = 0,
+                 out_of_core: bool = False) -> None:
+        """
+        Args:
+            downcast (bool): Stream CSV files in chunks and downcast each chunk's numeric
+                columns before concatenating them. Defaults to False.
+            chunk_size (int): Rows per CSV chunk. Defaults to `_CSV_CHUNK_ROWS`.
+            cache (FileCache): On-disk columnar cache consulted before parsing CSV, JSON
+                and Excel files. Defaults to None (no caching).
+            lazy (bool): Make `read` return a LazyDataset that only reads the schema up
+                front and fetches columns on demand. Defaults to False.
+            arrow (bool): Read into Arrow-backed columns (dtype_backend="pyarrow"), which
+                store strings far more compactly than Python objects. Defaults to False.
+            max_workers (int): Worker processes used to read the shards of a directory or
+                glob pattern. Defaults to None (one per CPU core).
+            category_ratio (float): Encode text columns whose distinct values are at most this
+                fraction of the rows as `category`; CSV files are encoded chunk by chunk while
+                parsing. Defaults to None (no encoding).
+            sheet_name (Union[str, int]): Name or position of the Excel sheet to read; see
+                `list_sheets` for the sheets of a workbook. Defaults to 0 (the first sheet).
+            out_of_core (bool): Make `read` return a ChunkedDataset that streams Parquet, CSV
+                or Arrow files chunk by chunk instead of loading them, for datasets larger
+                than memory. Defaults to False.
+        """
         self.data: DataFrame = None
         self.file_path: str = None
         self.extension: str = None
+        self.downcast = downcast
+        self.chunk_size = chunk_size or self._CSV_CHUNK_ROWS
+        self.memory_report: MemoryReport = None
+        self.cache = cache
+        self.from_cache: bool = False
+        self.lazy = lazy
+        self.arrow = arrow
+        self.max_workers = max_workers
+        self.category_ratio = category_ratio
+        self.sheet_name = sheet_name
+        self.out_of_core = out_of_core
 
     def _get_extension(self) -> str:
         """
@@ -61,43 +527,430 @@ class File:
         Raises:
             ValueError: If the file extension is not supported.
         """
-        _, file_extension = os.path.splitext(self.file_path)
-        file_extension = file_extension[1:]
-        for ext in FileExtension:
-            if file_extension in ext.value:
-                return ext
-        raise ValueError(f'Unsupported file extension: {file_extension}')
+        extension = extension_of(self.file_path)
+        if extension is None:
+            raise ValueError(f'Unsupported file extension: {os.path.splitext(self.file_path)[1][1:]}')
+        return extension
+
+    def _read_csv_chunks(self, progress: ProgressCallback = None, cancel_event: Event = None) -> DataFrame:
+        """
+        Reads a CSV file in chunks of `chunk_size` rows, reporting progress
+        after every chunk and checking the cancel event in between.
+
+        With `downcast` enabled each chunk is downcast before the next one is parsed,
+        so only one full-width chunk is alive at a time, and `memory_report` records
+        the parsed versus downcast size. With `category_ratio` set, the text columns the
+        first chunk shows to be repetitive are encoded as `category` in every chunk.
+
+        Raises:
+            LoadCancelled: If the cancel event is set before the read finishes.
+        """
+        total_bytes = os.path.getsize(self.file_path)
+        chunks = []
+        rows = 0
+        parsed_bytes = 0
+        compact = self.downcast or self.category_ratio is not None
+        categorical = None
+        with open(self.file_path, 'rb') as f:
+            for chunk in read_csv(f, chunksize=self.chunk_size, **self._reader_options()):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(self.file_path)
+                if compact:
+                    parsed_bytes += int(chunk.memory_usage(deep=True).sum())
+                if self.downcast:
+                    chunk = downcast_numeric(chunk)
+                if self.category_ratio is not None:
+                    # The first chunk decides which columns are encoded, so every chunk agrees
+                    if categorical is None:
+                        encode_categories(chunk, self.category_ratio)
+                        categorical = list(chunk.select_dtypes(include=['category']).columns)
+                    else:
+                        encode_categories(chunk, columns=categorical)
+                chunks.append(chunk)
+                rows += len(chunk)
+                if progress is not None:
+                    progress(min(f.tell(), total_bytes), total_bytes, rows)
+        if not chunks:
+            return read_csv(self.file_path, **self._reader_options())
+        data = concat_frames(chunks)
+        if compact:
+            self.memory_report = MemoryReport(parsed_bytes, int(data.memory_usage(deep=True).sum()))
+        return data
+
+    def _read_json_batches(self, layout: str, progress: ProgressCallback = None,
+                           cancel_event: Event = None) -> DataFrame:
+        """
+        Reads a line-delimited JSON file, or a top-level array of objects, `chunk_size`
+        records at a time, flattening nested objects into 'parent.child' columns.
+
+        Each batch is compacted like a CSV chunk before the next one is parsed, so parsing
+        needs memory for one batch rather than for the whole document.
+
+        Raises:
+            LoadCancelled: If the cancel event is set before the read finishes.
+        """
+        total_bytes = os.path.getsize(self.file_path)
+        chunks = []
+        rows = 0
+        parsed_bytes = 0
+        compact = self.downcast or self.category_ratio is not None
+        categorical = None
+        options = self._reader_options()
+        with open(self.file_path, 'rb') as f:
+            for batch in iter_json_batches(f, layout, self.chunk_size):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(self.file_path)
+                chunk = read_json_batch(batch, **options)
+                del batch
+                if compact:
+                    parsed_bytes += int(chunk.memory_usage(deep=True).sum())
+                if self.downcast:
+                    chunk = downcast_numeric(chunk)
+                if self.category_ratio is not None:
+                    # The first batch decides which columns are encoded, so every batch agrees
+                    if categorical is None:
+                        encode_categories(chunk, self.category_ratio)
+                        categorical = list(chunk.select_dtypes(include=['category']).columns)
+                    else:
+                        encode_categories(chunk, columns=[col for col in categorical if col in chunk.columns])
+                chunks.append(chunk)
+                rows += len(chunk)
+                if progress is not None:
+                    progress(min(f.tell(), total_bytes), total_bytes, rows)
+        if not chunks:
+            return DataFrame()
+        data = concat_frames(chunks)
+        if compact:
+            self.memory_report = MemoryReport(parsed_bytes, int(data.memory_usage(deep=True).sum()))
+        return data
 
-    def read(self, file_path: str = None) -> DataFrame:
+    def read(self, file_path: str = None, progress: ProgressCallback = None,
+             cancel_event: Event = None) -> DataFrame:
         """
         Args:
-        file_path (str): Path to the file to read. Defaults to None.
+        file_path (str): Path to the file to read, or a directory or glob pattern whose files
+            are read as the shards of one dataset. Defaults to None.
+        progress (ProgressCallback): Called with (bytes_read, total_bytes, rows_parsed)
+            as the read advances. Defaults to None.
+        cancel_event (Event): When set from another thread, aborts the read. Defaults to None.
 
         Returns:
-            DataFrame containing the read data.
+            DataFrame containing the read data, a LazyDataset in lazy mode, or a ChunkedDataset out of core.
 
         Raises:
             ValueError: If the file extension is not supported.
+            SchemaMismatchError: If the shards of a directory or glob pattern have incompatible columns.
+            LoadCancelled: If `cancel_event` is set before the read finishes.
 
         Supported File Extensions:
             - CSV
-            - JSON
+            - JSON (line-delimited files and arrays of objects are streamed in batches)
             - Parquet
             - Excel
             - Pickle
+            - Feather / Arrow IPC (memory-mapped)
 
         Read a file from a specified path:
             data = File().read("data.csv")
+
+        Read a large CSV with compact numeric dtypes:
+            file = File(downcast=True)
+            data = file.read("data.csv")
+            print(file.memory_report)
+
+        Reopen previously parsed files from a columnar cache:
+            data = File(cache=FileCache()).read("data.csv")
+
+        Pick an Excel sheet by name; the cache keeps one entry per sheet:
+            sheets = list_sheets("report.xlsx")  # [ExcelSheet(name='Sales', rows=12000), ...]
+            data = File(sheet_name="Sales", cache=FileCache()).read("report.xlsx")
+
+        Read into Arrow-backed columns; uncompressed Arrow files are mapped rather than copied:
+            data = File(arrow=True).read("data.feather")
+
+        Read only the columns that are used:
+            dataset = File(lazy=True).read("data.parquet")
+            data = dataset.get("age", "income")
+
+        Stream a dataset larger than memory; plots aggregate it chunk by chunk:
+            dataset = File(out_of_core=True).read("events/")
+            Plots('Histogram').plot(dataset, x="latency")
+
+        Read the shards of a (Hive-partitioned) directory or a glob pattern in parallel:
+            data = File().read("sales/")  # Adds 'source_file' and e.g. 'year' for sales/year=2024/...
+            data = File(max_workers=4).read("logs/part-*.csv")
         """
         if file_path is not None:
             self.file_path = file_path  # Update file_path if provided
 
+        with timer.phase('File.read', file=os.path.basename(os.path.normpath(self.file_path))) as span:
+            data = self._read(progress, cancel_event)
+            span.rows = data.num_rows if isinstance(data, (LazyDataset, ChunkedDataset)) else len(data)
+        return data
+
+    def read_preview(self, file_path: str = None, rows: int = None, spread: bool = False) -> DataFrame:
+        """
+        Reads a quick preview of a file to explore while `read` loads all of it.
+
+        The preview holds the first `rows` rows or, with `spread`, rows taken from blocks
+        spread evenly through the file (CSV, line-delimited JSON, Parquet row groups and
+        Arrow files), without reading the rest. Downcasting and categorical encoding are
+        applied as in `read`, so the preview has the dtypes the full load will have
+        (category levels may be fewer).
+
+        Args:
+            file_path (str): Path to the file. Defaults to None (the stored path).
+            rows (int): Rows to read. Defaults to `_PREVIEW_ROWS`.
+            spread (bool): Sample the whole file instead of reading its head. Defaults to False.
+
+        Returns:
+            The preview, or None for directories, glob patterns, Pickle files and JSON
+            documents that are not records, which cannot be read in part.
+        """
+        if file_path is not None:
+            self.file_path = file_path
+        if is_partitioned(self.file_path):
+            return None
+        self.extension = extension_of(self.file_path)
+        read_preview = self._PREVIEW_READERS.get(self.extension)
+        if read_preview is None:
+            return None
+
+        with timer.phase('File.read_preview', file=os.path.basename(self.file_path)) as span:
+            data = read_preview(self.file_path, rows or self._PREVIEW_ROWS, spread, **self._reader_options())
+            if data is not None:
+                # `read` downcasts the formats it streams in chunks
+                if self.downcast and self.extension in (FileExtension.CSV, FileExtension.JSON):
+                    downcast_numeric(data)
+                if self.category_ratio is not None:
+                    encode_categories(data, self.category_ratio)
+                span.rows = len(data)
+        return data
+
+    def _read(self, progress: ProgressCallback = None, cancel_event: Event = None) -> DataFrame:
+        """Reads `file_path` as described in `read`."""
+        if self.out_of_core:
+            return self._open_chunked(progress)
+        if is_partitioned(self.file_path):
+            return self._read_partitioned(progress, cancel_event)
+
         self.extension = self._get_extension()
+        self.memory_report = None
         read_func = self._EXTENSIONS.get(self.extension)
 
         if read_func is None:
             raise ValueError(f'Unsupported file extension: {self.extension}')
 
-        self.data = read_func(self.file_path)  # Store the read data
+        self.from_cache = False
+        if self.lazy and self.extension in self._PROJECTED_READERS:
+            self.data = self._open_lazy(progress)
+            return self.data
+
+        use_cache = self.cache is not None and self.extension in self._CACHEABLE
+        if use_cache:
+            self.data = self.cache.get(self.file_path, self._cache_variant(),
+                                       self._reader_options().get('dtype_backend'))
+            if self.data is not None:
+                self.from_cache = True
+                if progress is not None:
+                    total_bytes = os.path.getsize(self.file_path)
+                    progress(total_bytes, total_bytes, len(self.data))
+                return self.data
+
+        streamed = (self.downcast or self.category_ratio is not None
+                    or progress is not None or cancel_event is not None)
+        layout = json_layout(self.file_path) if self.extension is FileExtension.JSON else None
+        if self.extension is FileExtension.CSV and streamed:
+            self.data = self._read_csv_chunks(progress, cancel_event)
+        elif layout is not None:
+            self.data = self._read_json_batches(layout, progress, cancel_event)
+        else:
+            # Formats without a streaming reader only report start and finish
+            total_bytes = os.path.getsize(self.file_path)
+            if progress is not None:
+                progress(0, total_bytes, 0)
+            options = self._reader_options()
+            if self.extension is FileExtension.CSV and self.arrow:
+                options['engine'] = 'pyarrow'  # Multithreaded parser that builds Arrow columns directly
+            self.data = read_func(self.file_path, **options)  # Store the read data
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled(self.file_path)
+            if progress is not None:
+                progress(total_bytes, total_bytes, len(self.data))
+            if self.category_ratio is not None:
+                encode_categories(self.data, self.category_ratio)
+
+        if use_cache:
+            self.cache.put(self.file_path, self.data, self._cache_variant())
+        if self.lazy:
+            # JSON and Pickle cannot read a column subset, so they are wrapped once fully loaded
+            self.data = LazyDataset.from_frame(self.data)
         return self.data
 
+    def _read_partitioned(self, progress: ProgressCallback = None, cancel_event: Event = None) -> DataFrame:
+        """
+        Reads every shard of a directory or glob pattern, in worker processes when there is
+        more than one, and concatenates them in shard order once their schemas are checked.
+
+        `source_file` records each row's shard, and every Hive-style 'key=value' directory
+        adds a categorical column `key`. Progress is reported as shards finish.
+        """
+        root, shards = find_shards(self.file_path)
+        self.extension = None
+        self.memory_report = None
+        self.from_cache = False
+        sizes = [os.path.getsize(shard) for shard in shards]
+        total_bytes = sum(sizes)
+        options = {'downcast': self.downcast, 'chunk_size': self.chunk_size, 'cache': self.cache, 'arrow': self.arrow,
+                   'category_ratio': self.category_ratio, 'sheet_name': self.sheet_name}
+        results = [None] * len(shards)
+        read_bytes = 0
+        rows = 0
+        if progress is not None:
+            progress(0, total_bytes, 0)
+
+        def _collect(i: int, result: tuple[DataFrame, MemoryReport, bool]) -> None:
+            nonlocal read_bytes, rows
+            results[i] = result
+            read_bytes += sizes[i]
+            rows += len(result[0])
+            if progress is not None:
+                progress(read_bytes, total_bytes, rows)
+
+        workers = min(self.max_workers or os.cpu_count() or 1, len(shards))
+        if workers <= 1:
+            for i, shard in enumerate(shards):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(self.file_path)
+                _collect(i, _read_shard(shard, options))
+        else:
+            # Spawned workers start from a clean interpreter; forking would copy the locks
+            # held by this process's other threads (Tk, background loaders) in whatever state they are in
+            executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+            try:
+                futures: dict[Future, int] = {executor.submit(_read_shard, shard, options): i
+                                              for i, shard in enumerate(shards)}
+                pending = set(futures)
+                while pending:
+                    finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise LoadCancelled(self.file_path)
+                    for future in finished:
+                        _collect(futures[future], future.result())
+            finally:
+                # Queued shards are dropped; running ones finish in the background and are discarded
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        frames = [data for data, _, _ in results]
+        check_schemas(frames, shards)
+        data = concat_frames(frames)
+        lengths = [len(frame) for frame in frames]
+        if self._SOURCE_COLUMN not in data.columns:
+            names = [os.path.relpath(shard, root) for shard in shards]
+            data[self._SOURCE_COLUMN] = Categorical.from_codes(np.repeat(np.arange(len(shards)), lengths), names)
+
+        partitions = [partition_values(shard, root) for shard in shards]
+        for key in dict.fromkeys(key for values in partitions for key in values):
+            if key in data.columns:
+                continue  # A column stored in the files wins over the directory name
+            levels = _sorted_levels({values[key] for values in partitions if key in values})
+            codes = [levels.index(values[key]) if key in values else -1 for values in partitions]
+            data[key] = Categorical.from_codes(np.repeat(codes, lengths), levels)
+
+        reports = [report for _, report, _ in results]
+        if all(report is not None for report in reports):
+            self.memory_report = MemoryReport(sum(report.before for report in reports),
+                                              sum(report.after for report in reports))
+        self.from_cache = all(from_cache for _, _, from_cache in results)
+        self.data = LazyDataset.from_frame(data) if self.lazy else data
+        return self.data
+
+    def _open_chunked(self, progress: ProgressCallback = None) -> ChunkedDataset:
+        """
+        Opens `file_path` (a file, directory or glob pattern) as a pyarrow dataset and returns
+        a ChunkedDataset streaming it. Only metadata is read here.
+
+        Raises:
+            ValueError: If the files are not all Parquet, all CSV or all Arrow IPC.
+        """
+        import pyarrow.dataset as ds
+        self.memory_report = None
+        self.from_cache = False
+        if is_partitioned(self.file_path):
+            root, shards = find_shards(self.file_path)
+            extensions = {extension_of(shard) for shard in shards}
+        else:
+            root, shards = None, [self.file_path]
+            extensions = {self._get_extension()}
+        self.extension = extensions.pop() if len(extensions) == 1 else None
+        if self.extension not in self._CHUNKED_FORMATS:
+            raise ValueError('Out-of-core datasets must be all Parquet, all CSV or all Arrow IPC files.')
+
+        source = ds.dataset(shards, format=self._CHUNKED_FORMATS[self.extension],
+                            partitioning='hive' if root is not None else None, partition_base_dir=root)
+        # Parquet and Arrow files record their row counts; counting CSV rows would mean a full scan
+        num_rows = source.count_rows() if self.extension is not FileExtension.CSV else None
+        if progress is not None:
+            total_bytes = sum(os.path.getsize(shard) for shard in shards)
+            progress(total_bytes, total_bytes, num_rows or 0)
+        self.data = ChunkedDataset(source, num_rows, dtype_backend='pyarrow' if self.arrow else None)
+        return self.data
+
+    def _open_lazy(self, progress: ProgressCallback = None) -> LazyDataset:
+        """
+        Reads only the schema of the file and returns a LazyDataset that reads
+        the remaining columns through the extension's column subset reader.
+        """
+        read_schema, read_columns = self._PROJECTED_READERS[self.extension]
+        file_path = self.file_path
+        options = self._reader_options()
+        schema, num_rows = read_schema(file_path, **options)
+
+        def _read_columns(columns: list[str]) -> DataFrame:
+            data = read_columns(file_path, columns, **options)
+            if self.downcast:
+                downcast_numeric(data)
+            if self.category_ratio is not None:
+                encode_categories(data, self.category_ratio)
+            return data
+
+        if progress is not None:
+            total_bytes = os.path.getsize(file_path)
+            progress(total_bytes, total_bytes, num_rows or 0)
+        return LazyDataset(schema, _read_columns, num_rows)
+
+    def _reader_options(self) -> dict:
+        """Returns the keyword arguments the extension's reader is called with."""
+        options = {}
+        if self.arrow and self.extension in self._ARROW_BACKED:
+            options['dtype_backend'] = 'pyarrow'
+        if self.extension is FileExtension.EXCEL:
+            options.update(sheet_name=self.sheet_name, engine=excel_engine())
+        return options
+
+    def _cache_variant(self) -> str:
+        """Describes the read options that change the parsed frame, so each gets its own cache entry."""
+        return (f'downcast={self.downcast}' + (',arrow' if self.arrow else '')
+                + (f',categories={self.category_ratio}' if self.category_ratio is not None else '')
+                + (f',sheet={self.sheet_name!r}' if self.extension is FileExtension.EXCEL and self.sheet_name != 0 else '')
+                + (',flattened' if self.extension is FileExtension.JSON else ''))
+
+
+def _natural_key(text: str) -> list:
+    """Sort key that compares runs of digits as numbers, so 'month=9' sorts before 'month=10'."""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', text)]
+
+
+def _sorted_levels(values: set[str]) -> list[str]:
+    """Sorts partition values numerically when they are all numbers (so '9' < '10'), else naturally."""
+    try:
+        return sorted(values, key=float)
+    except ValueError:
+        return sorted(values, key=_natural_key)
+
+
+def _read_shard(shard: str, options: dict) -> tuple[DataFrame, MemoryReport, bool]:
+    """Reads one shard of a partitioned dataset, possibly in a worker process."""
+    file = File(**options)
+    data = file.read(shard)
+    return data, file.memory_report, file.from_cache
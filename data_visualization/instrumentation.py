@@ -0,0 +1,214 @@
+import os
+import json
+import time
+import threading
+from typing import Any, NamedTuple
+
+
+class PhaseRecord(NamedTuple):
+    """
+    One timed phase of a session.
+
+    Attributes:
+        name (str): Phase name, e.g. 'File.read' or 'canvas.draw'.
+        start (float): Seconds since the timer was enabled.
+        seconds (float): Wall time of the phase.
+        rows (int): Rows the phase worked on, if known.
+        memory_delta (int): Change in the process's resident memory over the phase, in bytes, if known.
+        thread (str): Name of the thread the phase ran on.
+        args (dict): Extra details, e.g. the file name or plot type.
+    """
+    name: str
+    start: float
+    seconds: float
+    rows: int
+    memory_delta: int
+    thread: str
+    args: dict
+
+
+def _resident_memory() -> int:
+    """Returns the resident memory of this process in bytes, or None where it cannot be read cheaply."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class Span:
+    """An open phase; set `rows` (and any `args`) before it ends."""
+
+    __slots__ = ('timer', 'name', 'rows', 'args', '_start', '_memory')
+
+    def __init__(self, timer: 'PhaseTimer', name: str, args: dict) -> None:
+        self.timer = timer
+        self.name = name
+        self.rows: int = None
+        self.args = args
+        self._memory = _resident_memory()
+        self._start = time.perf_counter()
+
+    def end(self) -> None:
+        """Closes the phase and records it."""
+        seconds = time.perf_counter() - self._start
+        memory = _resident_memory()
+        delta = memory - self._memory if memory is not None and self._memory is not None else None
+        self.timer._add(PhaseRecord(self.name, self._start - self.timer._origin, seconds, self.rows, delta,
+                                    threading.current_thread().name, self.args))
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.end()
+
+
+class _NullSpan:
+    """Stands in for a Span while timing is disabled; everything it is given is dropped."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class PhaseTimer:
+    """
+    Records the wall time, rows and memory delta of named phases such as reading a file,
+    computing the column summary, building a plot and drawing the canvas.
+
+    While disabled, `phase` returns a shared no-op span, so instrumented code pays one
+    attribute check. Records can be exported as JSON or as a Chrome trace, which opens
+    in chrome://tracing or https://ui.perfetto.dev.
+
+    Methods:
+        phase(self, name: str, **args) -> Span:
+            Starts a phase; use it as a context manager or call `end()` on the result.
+
+        summary(self, names: list[str] = None) -> str:
+            Describes the latest record of each phase for display.
+
+        export_json(self, path: str) -> None / export_chrome_trace(self, path: str) -> None:
+            Write the session to a file.
+
+    Time a phase:
+        with timer.phase('File.read', file='data.csv') as span:
+            data = File().read('data.csv')
+            span.rows = len(data)
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = False
+        self.records: list[PhaseRecord] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        if enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        """Starts a new session."""
+        self.clear()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording; the records so far are kept for export."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Drops every record and restarts the session clock."""
+        with self._lock:
+            self.records = []
+            self._origin = time.perf_counter()
+
+    def phase(self, name: str, **args: Any) -> Span:
+        """Starts timing a phase named `name`, with `args` stored alongside the record."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def _add(self, record: PhaseRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def latest(self, name: str) -> PhaseRecord:
+        """Returns the most recent record of the phase `name`, or None."""
+        with self._lock:
+            return next((record for record in reversed(self.records) if record.name == name), None)
+
+    def summary(self, names: list[str] = None) -> str:
+        """
+        Describes the latest record of each phase, e.g. 'File.read 1.20 s (1,000,000 rows, +80 MB) | canvas.draw 0.15 s'.
+
+        Args:
+            names (list[str]): Phases to include, in order. Defaults to every recorded phase.
+        """
+        if names is None:
+            with self._lock:
+                names = list(dict.fromkeys(record.name for record in self.records))
+        parts = []
+        for name in names:
+            record = self.latest(name)
+            if record is None:
+                continue
+            details = []
+            if record.rows is not None:
+                details.append(f'{record.rows:,} rows')
+            if record.memory_delta is not None:
+                details.append(f'{record.memory_delta / 2**20:+,.0f} MB')
+            parts.append(f'{name} {record.seconds:.2f} s' + (f" ({', '.join(details)})" if details else ''))
+        return ' | '.join(parts)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Returns the records as JSON-ready dicts, oldest first."""
+        with self._lock:
+            return [record._asdict() for record in self.records]
+
+    def export_json(self, path: str) -> None:
+        """Writes the records to `path` as a JSON list."""
+        with open(path, 'w') as f:
+            json.dump({'pid': os.getpid(), 'phases': self.to_dicts()}, f, indent=2, default=str)
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Writes the records to `path` in the Chrome trace event format (complete 'X' events in microseconds)."""
+        pid = os.getpid()
+        records = self.to_dicts()
+        # Trace viewers want numeric thread ids; metadata events name them
+        threads = {name: tid for tid, name in enumerate(dict.fromkeys(record['thread'] for record in records))}
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for name, tid in threads.items()]
+        events += [
+            {
+                'name': record['name'],
+                'ph': 'X',
+                'ts': record['start'] * 1e6,
+                'dur': record['seconds'] * 1e6,
+                'pid': pid,
+                'tid': threads[record['thread']],
+                'args': {'rows': record['rows'], 'memory_delta': record['memory_delta'], **record['args']},
+            }
+            for record in records
+        ]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+
+
+# Shared by the loaders, plots and window; DATA_VIS_TIMING=1 enables it from the start
+timer = PhaseTimer(enabled=os.environ.get('DATA_VIS_TIMING', '') not in ('', '0'))
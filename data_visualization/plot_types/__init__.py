@@ -1,3 +1,7 @@
-from .plots import Plots
+from .plots import Plots, ScatterMode, StatsMode
+from .render_cache import RenderCache
+from .level_of_detail import DetailTask, detail_for_view, redraw_detail, supports_detail
+from .dashboard import Dashboard, PlotSpec
 
-__all__ = ["Plots"]
\ No newline at end of file
+__all__ = ["Plots", "ScatterMode", "StatsMode", "RenderCache", "DetailTask", "detail_for_view", "redraw_detail",
+           "supports_detail", "Dashboard", "PlotSpec"]
\ No newline at end of file
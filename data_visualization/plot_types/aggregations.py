@@ -0,0 +1,305 @@
+import numpy as np
+from typing import NamedTuple, Union
+from pandas import Index, Series, factorize
+from pandas.api.types import is_numeric_dtype, is_bool_dtype, is_object_dtype, is_string_dtype
+from pandas import CategoricalDtype
+
+
+class HistogramAggregate(NamedTuple):
+    """
+    Bin counts behind a (possibly hue-stacked) histogram.
+
+    Attributes:
+        edges (np.ndarray): The n_bins + 1 bin edges.
+        counts (np.ndarray): An (n_bins, n_hue_levels) matrix of counts; one column without hue.
+        hue_levels (Index): The hue levels in plotting order, or None without hue.
+    """
+    edges: np.ndarray
+    counts: np.ndarray
+    hue_levels: Index = None
+
+
+class CountAggregate(NamedTuple):
+    """
+    Occurrence counts behind a (possibly hue-dodged) count plot.
+
+    Attributes:
+        levels (Index): The x levels in plotting order.
+        counts (np.ndarray): An (n_levels, n_hue_levels) matrix of counts; one column without hue.
+        hue_levels (Index): The hue levels in plotting order, or None without hue.
+    """
+    levels: Index
+    counts: np.ndarray
+    hue_levels: Index = None
+
+
+class BarAggregate(NamedTuple):
+    """
+    Group means and error bar extents behind a (possibly hue-dodged) bar plot.
+
+    Attributes:
+        levels (Index): The x levels in plotting order.
+        means (np.ndarray): An (n_levels, n_hue_levels) matrix of means; one column without hue.
+        lower (np.ndarray): Lower ends of the error bars, or None without error bars.
+        upper (np.ndarray): Upper ends of the error bars, or None without error bars.
+        counts (np.ndarray): Non-missing values behind each mean; groups with none get no bar.
+        hue_levels (Index): The hue levels in plotting order, or None without hue.
+    """
+    levels: Index
+    means: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    counts: np.ndarray
+    hue_levels: Index = None
+
+
+class BoxAggregate(NamedTuple):
+    """
+    Box statistics behind a (possibly hue-dodged) box plot.
+
+    Attributes:
+        levels (Index): The x levels in plotting order.
+        stats (list[list[dict]]): For each x level, one `matplotlib.axes.Axes.bxp` stats dict
+            per hue level, or None where the group is empty.
+        hue_levels (Index): The hue levels in plotting order, or None without hue.
+    """
+    levels: Index
+    stats: list[list[dict]]
+    hue_levels: Index = None
+
+
+# z score of a two-sided 95% normal confidence interval
+_Z_95 = 1.959963984540054
+
+
+def is_categorical(values: Series) -> bool:
+    """Returns True for columns seaborn maps to discrete colors: strings, objects and categoricals."""
+    return isinstance(values.dtype, CategoricalDtype) or is_object_dtype(values) or is_string_dtype(values)
+
+
+def is_continuous(values: Series) -> bool:
+    """Returns True for numeric, non-boolean columns that can be binned."""
+    return is_numeric_dtype(values) and not is_bool_dtype(values)
+
+
+def category_codes(values: Series) -> tuple[np.ndarray, Index]:
+    """
+    Encodes `values` as integer codes in seaborn's level order: the categories of a
+    categorical column, sorted values of a numeric one, and order of appearance otherwise.
+    Missing values get the code -1.
+
+    Returns:
+        (codes, levels)
+    """
+    if isinstance(values.dtype, CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    codes, levels = factorize(values, sort=is_numeric_dtype(values))
+    return codes, Index(levels)
+
+
+def _group_codes(x: Series, y: Series, hue: Series = None) -> tuple[np.ndarray, np.ndarray, Index, Index]:
+    """
+    Combines the x and hue codes of the rows with a value, for grouping with bincount or a sort.
+
+    Returns:
+        (codes, values, levels, hue_levels): Group codes as `x_code * n_hue_levels + hue_code`,
+            the matching float values of `y`, and the x and hue levels.
+    """
+    codes, levels = category_codes(x)
+    values = y.to_numpy(dtype=float, na_value=np.nan)
+    valid = (codes >= 0) & ~np.isnan(values)
+    hue_levels = None
+    if hue is not None:
+        hue_codes, hue_levels = category_codes(hue)
+        valid &= hue_codes >= 0
+        codes = codes.astype(np.int64) * len(hue_levels) + hue_codes
+    return codes[valid], values[valid], levels, hue_levels
+
+
+def sorted_groups(x: Series, y: Series, hue: Series = None) -> tuple[np.ndarray, np.ndarray, Index, Index]:
+    """
+    Orders the values of `y` by (x level, hue level) group with one stable sort of the group codes.
+
+    Returns:
+        (values, bounds, levels, hue_levels): Group `x_code * n_hue_levels + hue_code` holds
+            `values[bounds[group]:bounds[group + 1]]`.
+    """
+    codes, values, levels, hue_levels = _group_codes(x, y, hue)
+    n_hue = len(hue_levels) if hue_levels is not None else 1
+    values = values[np.argsort(codes, kind='stable')]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(levels) * n_hue))))
+    return values, bounds, levels, hue_levels
+
+
+def _combined_counts(codes: np.ndarray, n_levels: int, hue: Series = None) -> tuple[np.ndarray, Index]:
+    """Counts (code, hue level) pairs with a single bincount over a combined code."""
+    if hue is None:
+        valid = codes >= 0
+        return np.bincount(codes[valid], minlength=n_levels).reshape(n_levels, 1), None
+    hue_codes, hue_levels = category_codes(hue)
+    valid = (codes >= 0) & (hue_codes >= 0)
+    combined = codes[valid].astype(np.int64) * len(hue_levels) + hue_codes[valid]
+    counts = np.bincount(combined, minlength=n_levels * len(hue_levels))
+    return counts.reshape(n_levels, len(hue_levels)), hue_levels
+
+
+def histogram_counts(x: Series, hue: Series = None, edges: np.ndarray = None,
+                     bins: Union[str, int] = 'auto', uniform: bool = False) -> HistogramAggregate:
+    """
+    Bins `x`, split by `hue`, with the same edges seaborn's histplot would choose.
+
+    Args:
+        x (Series): A numeric column.
+        hue (Series): An optional categorical column aligned with `x`.
+        edges (np.ndarray): Fixed bin edges, e.g. to accumulate counts over chunks. Defaults to
+            `numpy.histogram_bin_edges(x, bins)`.
+        bins (Union[str, int]): Binning rule used when `edges` is not given. Defaults to 'auto'.
+        uniform (bool): Whether the given `edges` are equally spaced, like those of
+            `numpy.histogram_bin_edges`, so values can be binned arithmetically.
+    """
+    values = x.to_numpy(dtype=float, na_value=np.nan)
+    finite = ~np.isnan(values)
+    uniform = uniform or edges is None
+    if edges is None:
+        edges = np.histogram_bin_edges(values[finite], bins=bins)
+    n_bins = len(edges) - 1
+
+    if uniform and edges[-1] > edges[0]:
+        # Equal-width bins: compute the bin arithmetically and fix rounding at the edges,
+        # the same way numpy.histogram does, instead of a binary search per value
+        codes = np.full(len(values), -1, dtype=np.intp)
+        inside = finite & (values >= edges[0]) & (values <= edges[-1])
+        kept = values[inside]
+        bin_index = ((kept - edges[0]) * (n_bins / (edges[-1] - edges[0]))).astype(np.intp)
+        bin_index[bin_index == n_bins] -= 1
+        bin_index[kept < edges[bin_index]] -= 1
+        bin_index[(kept >= edges[bin_index + 1]) & (bin_index != n_bins - 1)] += 1
+        codes[inside] = bin_index
+    else:
+        # The last bin is closed on the right, as in numpy.histogram
+        codes = np.searchsorted(edges, values, side='right') - 1
+        codes[values == edges[-1]] = n_bins - 1
+        codes[~finite | (codes < 0) | (codes >= n_bins)] = -1
+    counts, hue_levels = _combined_counts(codes, n_bins, hue)
+    return HistogramAggregate(edges, counts, hue_levels)
+
+
+def value_counts(x: Series, hue: Series = None) -> CountAggregate:
+    """
+    Counts the occurrences of each level of `x`, split by `hue`, in seaborn's level order.
+
+    Args:
+        x (Series): The column to count.
+        hue (Series): An optional categorical column aligned with `x`.
+    """
+    codes, levels = category_codes(x)
+    counts, hue_levels = _combined_counts(codes, len(levels), hue)
+    return CountAggregate(levels, counts, hue_levels)
+
+
+def group_moments(x: Series, y: Series, hue: Series = None) -> tuple[Index, Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the count, mean and sum of squared deviations from the mean of `y` for each
+    level of `x`, split by `hue`, with bincount. Moments of separate chunks can be merged.
+
+    Returns:
+        (levels, hue_levels, counts, means, squares): The statistics are (n_levels, n_hue_levels)
+            matrices; one column without hue.
+    """
+    codes, values, levels, hue_levels = _group_codes(x, y, hue)
+    n_hue = len(hue_levels) if hue_levels is not None else 1
+    n_groups = len(levels) * n_hue
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+    # Two passes, so large offsets do not cancel out the squares
+    squares = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups)
+    shape = (len(levels), n_hue)
+    return levels, hue_levels, counts.reshape(shape), means.reshape(shape), squares.reshape(shape)
+
+
+def bar_from_moments(levels: Index, hue_levels: Index, counts: np.ndarray, means: np.ndarray,
+                     squares: np.ndarray, errorbar: str = 'ci') -> BarAggregate:
+    """Turns group moments, as returned by `group_moments`, into bar heights and error bars; see `bar_estimates`."""
+    if errorbar not in ('ci', 'se', 'sd', None):
+        raise ValueError(f"errorbar must be 'ci', 'se', 'sd' or None, not {errorbar!r}")
+    lower = upper = None
+    if errorbar is not None:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            spread = np.sqrt(squares / (counts - 1))
+            if errorbar != 'sd':
+                spread /= np.sqrt(counts)
+        if errorbar == 'ci':
+            spread *= _Z_95
+        lower, upper = means - spread, means + spread
+    return BarAggregate(levels, means, lower, upper, counts, hue_levels)
+
+
+def bar_estimates(x: Series, y: Series, hue: Series = None, errorbar: str = 'ci') -> BarAggregate:
+    """
+    Computes the mean of `y` for each level of `x`, split by `hue`, with bincount.
+
+    Args:
+        x (Series): The column whose levels get a bar.
+        y (Series): A numeric column aligned with `x`.
+        hue (Series): An optional categorical column aligned with `x`.
+        errorbar (str): 'ci' for a normal 95% confidence interval of the mean, 'se' for one
+            standard error, 'sd' for one standard deviation, or None for no error bars.
+            Unlike seaborn's bootstrapped interval these come from a closed formula.
+    """
+    return bar_from_moments(*group_moments(x, y, hue), errorbar)
+
+
+def box_statistics(x: Series, y: Series, hue: Series = None, whis: float = 1.5,
+                   max_fliers: int = 1_000, seed: int = 0) -> BoxAggregate:
+    """
+    Computes quartiles, whiskers and outliers of `y` for each level of `x`, split by `hue`,
+    the way `matplotlib.cbook.boxplot_stats` does.
+
+    The rows are grouped with one stable sort of their group codes instead of a pandas
+    groupby, and each group's outliers are capped at a random sample of `max_fliers`
+    that always keeps the most extreme low and high value, so the axis limits do not change.
+
+    Args:
+        x (Series): The column whose levels get a box.
+        y (Series): A numeric column aligned with `x`.
+        hue (Series): An optional categorical column aligned with `x`.
+        whis (float): Whisker reach as a multiple of the interquartile range.
+        max_fliers (int): Most outliers kept per box, at least the two extremes, or None to keep all of them.
+        seed (int): Seed of the outlier sample.
+    """
+    values, bounds, levels, hue_levels = sorted_groups(x, y, hue)
+    n_hue = len(hue_levels) if hue_levels is not None else 1
+    rng = np.random.default_rng(seed)
+
+    stats = []
+    for group in range(len(levels) * n_hue):
+        if group % n_hue == 0:
+            stats.append([])
+        group_values = values[bounds[group]:bounds[group + 1]]
+        if not len(group_values):
+            stats[-1].append(None)
+            continue
+        q1, med, q3 = np.percentile(group_values, [25, 50, 75])
+        iqr = q3 - q1
+        low, high = q1 - whis * iqr, q3 + whis * iqr
+        inside = group_values[(group_values >= low) & (group_values <= high)]
+        whislo = min(inside.min(), q1) if len(inside) else q1
+        whishi = max(inside.max(), q3) if len(inside) else q3
+        fliers = group_values[(group_values < whislo) | (group_values > whishi)]
+        if max_fliers is not None and len(fliers) > max_fliers:
+            extremes = np.unique([fliers.argmin(), fliers.argmax()])
+            others = np.setdiff1d(np.arange(len(fliers)), extremes, assume_unique=True)
+            sample = rng.choice(others, size=max(max_fliers - len(extremes), 0), replace=False)
+            fliers = fliers[np.sort(np.concatenate((extremes, sample)))]
+        stats[-1].append(bxp_stats(len(group_values), group_values.mean(), q1, med, q3, whislo, whishi, fliers))
+    return BoxAggregate(levels, stats, hue_levels)
+
+
+def bxp_stats(count: int, mean: float, q1: float, med: float, q3: float, whislo: float, whishi: float,
+              fliers: np.ndarray) -> dict:
+    """Builds the stats dict `Axes.bxp` draws one box from, with the notch `boxplot_stats` would compute."""
+    iqr = q3 - q1
+    notch = 1.57 * iqr / np.sqrt(count)
+    return {'mean': mean, 'med': med, 'q1': q1, 'q3': q3, 'iqr': iqr, 'cilo': med - notch, 'cihi': med + notch,
+            'whislo': whislo, 'whishi': whishi, 'fliers': fliers}
@@ -0,0 +1,177 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import NamedTuple, Union
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from pandas import DataFrame
+from data_visualization.data_loader.lazy_dataset import LazyDataset
+from data_visualization.data_loader.chunked_dataset import ChunkedDataset
+from .plots import DrawPlot, Plots
+
+
+class PlotSpec(NamedTuple):
+    """
+    The plot drawn in one dashboard cell.
+
+    Attributes:
+        plot_type (str): A key of `Plots._PLOTS`.
+        x, y, hue (str): The plotted columns; y and hue are optional.
+        options (dict): Extra `Plots` options, e.g. `mode`.
+    """
+    plot_type: str
+    x: str
+    y: str = None
+    hue: str = None
+    options: dict = None
+
+
+class Dashboard:
+    """
+    Draws a grid of plot specs as the subplots of one shared figure.
+
+    The data preparation of each cell (`Plots.prepare`: reading lazy columns, aggregating,
+    sampling) runs on a thread pool, so the cells are prepared concurrently. Like
+    DistinctCountJob, the workers only push results into a queue; the owner draws the
+    finished cells with `draw_ready()` from its own thread, since matplotlib is not
+    thread-safe.
+
+    Each cell refreshes on its own: `set_spec` re-prepares only a cell whose spec changed,
+    and a cell's stale preparation is dropped when a newer one was submitted. Changing the
+    dataset with `set_data` re-prepares every cell.
+
+    Draw a 2x2 dashboard:
+        dashboard = Dashboard(figure, 2, 2)
+        dashboard.set_data(data)
+        dashboard.set_spec(0, PlotSpec('Histogram', 'age'))
+        dashboard.set_spec(1, PlotSpec('Scatter', 'age', 'income', options={'mode': ScatterMode.DENSITY}))
+        ...
+        for index, error in dashboard.draw_ready():
+            ...
+    """
+
+    def __init__(self, figure: Figure, rows: int = 2, columns: int = 2, max_workers: int = None) -> None:
+        """
+        Args:
+            figure (Figure): The figure whose subplots are the cells. It is cleared and switched
+                to the constrained layout, so cell titles, legends and colorbars do not overlap.
+            rows, columns (int): The shape of the grid; cells are numbered row by row from 0.
+            max_workers (int): Size of the preparation thread pool. Defaults to
+                `ThreadPoolExecutor`'s own default.
+        """
+        self.figure = figure
+        self.rows = rows
+        self.columns = columns
+        self.data = None
+        self.specs: list[PlotSpec] = [None] * (rows * columns)
+        # Axes drawn for each cell, its own and any colorbar, removed when the cell is redrawn
+        self._cell_axes: list[list[Axes]] = [[] for _ in self.specs]
+        # Bumped on every submission, so only a cell's latest preparation is drawn
+        self._versions = [0] * len(self.specs)
+        self._results: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dashboard')
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        figure.clear()
+        figure.set_layout_engine('constrained')
+
+    def set_data(self, data: Union[DataFrame, LazyDataset, ChunkedDataset]) -> None:
+        """Switches to another dataset, re-preparing every cell that has a spec."""
+        if data is self.data:
+            return
+        self.data = data
+        for index, spec in enumerate(self.specs):
+            if spec is not None:
+                self._submit(index)
+
+    def set_spec(self, index: int, spec: PlotSpec) -> bool:
+        """
+        Puts `spec` in cell `index` (None empties it) and starts preparing it.
+
+        Returns:
+            bool: False if the cell already held the same spec, in which case nothing is redone.
+        """
+        if spec == self.specs[index]:
+            return False
+        self.specs[index] = spec
+        if spec is None:
+            self._versions[index] += 1
+            self._clear_cell(index)
+        elif self.data is not None:
+            self._submit(index)
+        return True
+
+    def is_running(self) -> bool:
+        """Returns True while some cell is still being prepared."""
+        with self._pending_lock:
+            return self._pending > 0
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until every cell has been prepared; returns False if `timeout` seconds passed first."""
+        return self._idle.wait(timeout)
+
+    def draw_ready(self) -> list[tuple[int, Exception]]:
+        """
+        Draws every cell whose preparation finished since the last call. Call it from the
+        thread that owns the figure; the caller redraws the canvas.
+
+        A cell whose preparation or drawing failed shows the error in place of its plot.
+
+        Returns:
+            list[tuple[int, Exception]]: The (cell index, error or None) of each cell drawn.
+        """
+        drawn = []
+        while True:
+            try:
+                index, version, draw, error = self._results.get_nowait()
+            except queue.Empty:
+                return drawn
+            if version != self._versions[index]:
+                continue  # Superseded by a newer spec or dataset
+            self._clear_cell(index)
+            before = set(self.figure.axes)
+            ax = self.figure.add_subplot(self.rows, self.columns, index + 1)
+            if error is None:
+                try:
+                    draw(ax)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                ax.clear()
+                ax.set_axis_off()
+                ax.text(.5, .5, f'{type(error).__name__}: {error}', ha='center', va='center', wrap=True,
+                        transform=ax.transAxes, color='tab:red')
+            self._cell_axes[index] = [axes for axes in self.figure.axes if axes not in before]
+            drawn.append((index, error))
+
+    def close(self) -> None:
+        """Drops the cells that have not started preparing and stops the thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, index: int) -> None:
+        self._versions[index] += 1
+        spec = self.specs[index]
+        with self._pending_lock:
+            self._pending += 1
+            self._idle.clear()
+        future = self._executor.submit(Plots(spec.plot_type, **(spec.options or {})).prepare,
+                                       self.data, spec.x, spec.y, spec.hue)
+        future.add_done_callback(lambda f, index=index, version=self._versions[index]:
+                                 self._collect(index, version, f))
+
+    def _collect(self, index: int, version: int, future: Future) -> None:
+        if not future.cancelled():
+            error = future.exception()
+            draw: DrawPlot = future.result() if error is None else None
+            self._results.put((index, version, draw, error))
+        with self._pending_lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.set()
+
+    def _clear_cell(self, index: int) -> None:
+        for axes in self._cell_axes[index]:
+            axes.remove()
+        self._cell_axes[index] = []
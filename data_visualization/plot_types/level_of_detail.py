@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Any, Union
+from matplotlib.axes import Axes
+from pandas import DataFrame, Series
+from pandas.api.types import is_numeric_dtype
+from data_visualization.data_loader.background_loader import BackgroundTask
+from data_visualization.data_loader.lazy_dataset import LazyDataset
+from data_visualization.instrumentation import timer
+from .aggregations import histogram_counts, is_categorical, is_continuous
+from .plots import CustomPlots, DrawPlot, ScatterMode, SCATTER_MAX_POINTS, DENSITY_BINS
+
+# Draws a re-aggregated view onto an Axes; built off the GUI thread, called on it
+DrawDetail = DrawPlot
+
+
+def supports_detail(data: Union[DataFrame, LazyDataset], plot_type: str, x: str = None, y: str = None,
+                    hue: str = None) -> bool:
+    """
+    Whether a plot can be re-aggregated for a zoomed view: histograms of a numeric column
+    and scatter plots of two numeric columns, drawn from an in-memory or lazy dataset.
+    """
+    if not isinstance(data, (DataFrame, LazyDataset)) or x is None:
+        return False
+    columns = data if isinstance(data, DataFrame) else data.schema
+    if any(column is not None and column not in columns for column in (x, y, hue)):
+        return False
+    if plot_type == 'Histogram':
+        return y is None and is_continuous(columns[x]) and (hue is None or is_categorical(columns[hue]))
+    if plot_type == 'Scatter':
+        return y is not None and is_numeric_dtype(columns[x]) and is_numeric_dtype(columns[y])
+    return False
+
+
+def _in_range(values: Series, limits: tuple[float, float]) -> np.ndarray:
+    """Boolean mask of the values inside the closed interval `limits`, in either order."""
+    low, high = sorted(limits)
+    values = values.to_numpy(dtype=float, na_value=np.nan)
+    return (values >= low) & (values <= high)
+
+
+def detail_for_view(data: Union[DataFrame, LazyDataset], plot_type: str, x: str = None, y: str = None,
+                    hue: str = None, xlim: tuple[float, float] = None, ylim: tuple[float, float] = None,
+                    **options: Any) -> DrawDetail:
+    """
+    Re-aggregates a plot from only the rows inside the visible axis limits.
+
+    A histogram is re-binned over the values inside `xlim`. A scatter plot draws every
+    point inside `xlim` x `ylim` once few enough are left, and otherwise re-samples them
+    or rasterizes them at full resolution over the view, as `CustomPlots.scatter` does for
+    the whole dataset.
+
+    The aggregation is done here, so this can run on a worker thread; drawing is left to
+    the returned function, which must be called on the GUI thread.
+
+    Args:
+        data: The plotted dataset. A LazyDataset only reads the x, y and hue columns.
+        plot_type (str): 'Histogram' or 'Scatter', see `supports_detail`.
+        xlim, ylim: The visible axis limits. `ylim` is ignored for histograms.
+        **options: The plot's options, e.g. `max_points`, `mode` and `bins` for 'Scatter'.
+
+    Returns:
+        A function drawing the view onto a cleared Axes.
+    """
+    with timer.phase('level_of_detail', plot=plot_type) as span:
+        if isinstance(data, LazyDataset):
+            data = data.get(x, y, hue)
+
+        if plot_type == 'Histogram':
+            mask = _in_range(data[x], xlim)
+            span.rows = rows = int(mask.sum())
+            if not rows:
+                def draw_empty(ax: Axes) -> Axes:
+                    ax.set_xlabel(x)
+                    ax.set_ylabel('Count')
+                    return ax
+                return draw_empty
+            aggregate = histogram_counts(data[x][mask], data[hue][mask] if hue is not None else None)
+            return lambda ax: CustomPlots.draw_histogram(aggregate, x= x, hue= hue, ax= ax)
+
+        max_points = options.get('max_points', SCATTER_MAX_POINTS)
+        mode = options.get('mode', ScatterMode.SAMPLE)
+        bins = options.get('bins', DENSITY_BINS)
+        mask = _in_range(data[x], xlim) & _in_range(data[y], ylim)
+        span.rows = rows = int(mask.sum())
+        columns = list(dict.fromkeys(column for column in (x, y, hue) if column is not None))
+        if rows <= max_points:
+            return CustomPlots._scatter_points(data.loc[mask, columns], x, y, hue)
+
+        suffix = ' (hue ignored)' if hue else ''
+        if mode is ScatterMode.DENSITY:
+            counts, x_edges, y_edges = np.histogram2d(
+                data[x].to_numpy(dtype=float)[mask], data[y].to_numpy(dtype=float)[mask],
+                bins=bins, range=[sorted(xlim), sorted(ylim)],
+            )
+            return CustomPlots._density_drawing(counts, x_edges, y_edges, x, y,
+                                                f'Density of {rows:,} points in view in {bins}x{bins} bins{suffix}')
+
+        sample = CustomPlots._stratified_sample(data.loc[mask, columns], hue, max_points)
+        strata = ', stratified by hue' if hue else ''
+        return CustomPlots._scatter_points(sample, x, y, hue,
+                                           f'Random sample of {len(sample):,} / {rows:,} points in view{strata}')
+
+
+def redraw_detail(ax: Axes, draw: DrawDetail, plot_type: str, xlim: tuple[float, float],
+                  ylim: tuple[float, float]) -> Axes:
+    """
+    Replaces the contents of `ax` with a view from `detail_for_view`, keeping the limits
+    it was computed for. A histogram's y-axis is rescaled to the re-binned counts.
+
+    Clearing an Axes also drops its callbacks, so limit-change callbacks must be
+    connected again afterwards.
+    """
+    figure = ax.figure
+    for other in list(figure.axes):
+        if other is not ax:
+            other.remove()  # The colorbar of a density raster
+    ax.clear()
+    # A colorbar shrinks its parent Axes and removing it does not give the space back
+    ax.set_position(ax.get_subplotspec().get_position(figure))
+    ax = draw(ax)
+    ax.set_xlim(xlim)
+    if plot_type == 'Scatter':
+        ax.set_ylim(ylim)
+    return ax
+
+
+class DetailTask(BackgroundTask):
+    """Runs `detail_for_view` on a worker thread. DONE carries the function that draws the view."""
+
+    def __init__(self, data: Union[DataFrame, LazyDataset], plot_type: str, x: str = None, y: str = None,
+                 hue: str = None, xlim: tuple[float, float] = None, ylim: tuple[float, float] = None,
+                 options: dict = None) -> None:
+        super().__init__()
+        self.data = data
+        self.plot_type = plot_type
+        self.x, self.y, self.hue = x, y, hue
+        self.xlim, self.ylim = tuple(xlim), tuple(ylim)
+        self.options = options or {}
+
+    def _work(self) -> DrawDetail:
+        return detail_for_view(self.data, self.plot_type, self.x, self.y, self.hue, self.xlim, self.ylim,
+                               **self.options)
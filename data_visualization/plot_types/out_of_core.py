@@ -0,0 +1,312 @@
+"""
+Aggregations computed chunk by chunk over a ChunkedDataset, for datasets larger than memory.
+
+Each function streams only the columns it needs and returns the same small aggregate as
+its in-memory counterpart in `aggregations`, so `CustomPlots` draws it unchanged. Histograms,
+box plots and density rasters take two passes: the first finds the bin edges or quartiles,
+the second counts.
+"""
+import numpy as np
+from pandas import DataFrame, Index, RangeIndex, concat
+from pandas.api.types import is_numeric_dtype
+from data_visualization.data_loader.chunked_dataset import ChunkedDataset
+from . import aggregations
+from .aggregations import HistogramAggregate, CountAggregate, BarAggregate, BoxAggregate
+
+# Values kept per box, or per histogram column, to estimate quartiles
+QUANTILE_SAMPLE_SIZE = 100_000
+
+
+class _GroupTable:
+    """
+    Statistics of (x level, hue level) groups accumulated over chunks that may each hold
+    different levels. Levels are kept in order of first appearance; `finish` sorts numeric
+    ones, as seaborn orders them.
+    """
+
+    def __init__(self, hue: bool, levels: Index = None, **fill: float) -> None:
+        """
+        Args:
+            hue (bool): Whether groups are split by hue; otherwise there is a single column.
+            levels (Index): Fixed x levels, e.g. histogram bins. Defaults to None (collected from the chunks).
+            **fill: The statistics to keep, each with the value of a group not seen yet.
+        """
+        self.levels = levels
+        self.fixed = levels is not None
+        self.hue_levels = None
+        self.hue = hue
+        self.fill = fill
+        shape = (len(levels) if levels is not None else 0, 0 if hue else 1)
+        self.arrays = {name: np.full(shape, value, dtype=float) for name, value in fill.items()}
+
+    def align(self, levels: Index, hue_levels: Index = None) -> tuple[np.ndarray, np.ndarray]:
+        """Adds unseen levels and returns the table rows and columns of a chunk's levels."""
+        rows = np.arange(len(levels)) if self.fixed else self._extend('levels', levels, axis=0)
+        cols = self._extend('hue_levels', hue_levels, axis=1) if self.hue else np.zeros(1, dtype=np.intp)
+        return rows, cols
+
+    def _extend(self, name: str, levels: Index, axis: int) -> np.ndarray:
+        current = getattr(self, name)
+        new = levels if current is None else levels[~levels.isin(current)]
+        if current is None or len(new):
+            setattr(self, name, new if current is None else current.append(new))
+            padding = [(0, 0), (0, 0)]
+            padding[axis] = (0, len(new))
+            for key, array in self.arrays.items():
+                self.arrays[key] = np.pad(array, padding, constant_values=self.fill[key])
+        return getattr(self, name).get_indexer(levels)
+
+    def finish(self) -> tuple[Index, Index, dict[str, np.ndarray]]:
+        """Returns (levels, hue_levels, statistics), with numeric levels sorted."""
+        levels = self.levels if self.levels is not None else Index([])
+        hue_levels = (self.hue_levels if self.hue_levels is not None else Index([])) if self.hue else None
+        arrays = dict(self.arrays)
+        if not self.fixed and is_numeric_dtype(levels):
+            order = np.argsort(levels.to_numpy(), kind='stable')
+            levels = levels[order]
+            arrays = {key: array[order] for key, array in arrays.items()}
+        if hue_levels is not None and is_numeric_dtype(hue_levels):
+            order = np.argsort(hue_levels.to_numpy(), kind='stable')
+            hue_levels = hue_levels[order]
+            arrays = {key: array[:, order] for key, array in arrays.items()}
+        return levels, hue_levels, arrays
+
+
+class _Reservoir:
+    """A uniform random sample of at most `size` items: those given the smallest random keys."""
+
+    def __init__(self, size: int, rng: np.random.Generator) -> None:
+        self.size = size
+        self.rng = rng
+        self.keys = np.empty(0)
+        self.values = np.empty(0)
+
+    def add(self, values: np.ndarray) -> None:
+        keys = np.concatenate((self.keys, self.rng.random(len(values))))
+        values = np.concatenate((self.values, values))
+        if len(keys) > self.size:
+            kept = np.argpartition(keys, self.size)[:self.size]
+            keys, values = keys[kept], values[kept]
+        self.keys, self.values = keys, values
+
+
+def _finite(values) -> np.ndarray:
+    values = values.to_numpy(dtype=float, na_value=np.nan)
+    return values[np.isfinite(values)]
+
+
+def _auto_edges(count: int, low: float, high: float, sample: np.ndarray) -> np.ndarray:
+    """
+    Returns the edges `numpy.histogram_bin_edges(values, 'auto')` picks for `count` values
+    spanning [low, high], with the interquartile range estimated from `sample`.
+    """
+    width = 0.0
+    if high > low:
+        sturges = (high - low) / (np.log2(count) + 1)
+        q75, q25 = np.percentile(sample, [75, 25])
+        fd = 2 * (q75 - q25) * count ** (-1 / 3)
+        width = min(fd, sturges) if fd else sturges
+    n_bins = int(np.ceil((high - low) / width)) if width else 1
+    if high == low:
+        low, high = low - .5, high + .5
+    return np.linspace(low, high, n_bins + 1)
+
+
+def histogram_counts(dataset: ChunkedDataset, x: str, hue: str = None, bins='auto',
+                     seed: int = 0) -> HistogramAggregate:
+    """
+    Bins the numeric column `x`, split by `hue`, over every chunk of `dataset`.
+
+    The first pass finds the value range and samples values for the interquartile range
+    the 'auto' rule needs; the second counts each chunk into the fixed edges.
+
+    Raises:
+        ValueError: If `x` has no finite values.
+    """
+    count, low, high = 0, np.inf, -np.inf
+    sample = _Reservoir(QUANTILE_SAMPLE_SIZE, np.random.default_rng(seed))
+    for chunk in dataset.iter_chunks(x):
+        values = _finite(chunk[x])
+        if len(values):
+            count += len(values)
+            low, high = min(low, values.min()), max(high, values.max())
+            sample.add(values)
+    if not count:
+        raise ValueError(f'Column {x!r} has no finite values to bin.')
+    if bins == 'auto':
+        edges = _auto_edges(count, low, high, sample.values)
+    else:
+        edges = np.histogram_bin_edges(np.array([low, high]), bins=bins)
+
+    bins_index = RangeIndex(len(edges) - 1)
+    table = _GroupTable(hue is not None, bins_index, counts=0)
+    for chunk in dataset.iter_chunks(x, hue):
+        aggregate = aggregations.histogram_counts(chunk[x], chunk[hue] if hue is not None else None,
+                                                  edges, uniform=True)
+        rows, cols = table.align(bins_index, aggregate.hue_levels)
+        table.arrays['counts'][np.ix_(rows, cols)] += aggregate.counts
+    _, hue_levels, arrays = table.finish()
+    return HistogramAggregate(edges, arrays['counts'].astype(np.int64), hue_levels)
+
+
+def value_counts(dataset: ChunkedDataset, x: str, hue: str = None) -> CountAggregate:
+    """Counts the occurrences of each level of `x`, split by `hue`, over every chunk of `dataset`."""
+    table = _GroupTable(hue is not None, counts=0)
+    for chunk in dataset.iter_chunks(x, hue):
+        aggregate = aggregations.value_counts(chunk[x], chunk[hue] if hue is not None else None)
+        rows, cols = table.align(aggregate.levels, aggregate.hue_levels)
+        table.arrays['counts'][np.ix_(rows, cols)] += aggregate.counts
+    levels, hue_levels, arrays = table.finish()
+    return CountAggregate(levels, arrays['counts'].astype(np.int64), hue_levels)
+
+
+def bar_estimates(dataset: ChunkedDataset, x: str, y: str, hue: str = None, errorbar: str = 'ci') -> BarAggregate:
+    """
+    Computes the mean of `y` for each level of `x`, split by `hue`, over every chunk of `dataset`.
+
+    Each chunk's counts, means and squared deviations are merged with the pairwise update
+    of Chan et al., so the result equals `aggregations.bar_estimates` on the whole column.
+    """
+    table = _GroupTable(hue is not None, counts=0, means=0, squares=0)
+    for chunk in dataset.iter_chunks(x, y, hue):
+        levels, hue_levels, counts, means, squares = aggregations.group_moments(
+            chunk[x], chunk[y], chunk[hue] if hue is not None else None
+        )
+        rows, cols = table.align(levels, hue_levels)
+        cells = np.ix_(rows, cols)
+        total_counts = table.arrays['counts'][cells]
+        total_means = table.arrays['means'][cells]
+        merged = total_counts + counts
+        seen = counts > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = np.where(seen, means - total_means, 0)
+            share = np.where(seen, counts / merged, 0)
+        table.arrays['means'][cells] = total_means + delta * share
+        table.arrays['squares'][cells] += np.where(seen, squares, 0) + delta ** 2 * total_counts * share
+        table.arrays['counts'][cells] = merged
+    levels, hue_levels, arrays = table.finish()
+    counts = arrays['counts'].astype(np.int64)
+    means = np.where(counts > 0, arrays['means'], np.nan)
+    return aggregations.bar_from_moments(levels, hue_levels, counts, means, arrays['squares'], errorbar)
+
+
+def box_statistics(dataset: ChunkedDataset, x: str, y: str, hue: str = None, whis: float = 1.5,
+                   max_fliers: int = 1_000, seed: int = 0) -> BoxAggregate:
+    """
+    Computes box statistics of `y` for each level of `x`, split by `hue`, over every chunk of `dataset`.
+
+    The first pass counts and averages each group exactly and keeps a uniform sample of
+    `QUANTILE_SAMPLE_SIZE` values per group, whose quartiles stand in for the group's (they are
+    exact for smaller groups). The second pass finds the whisker ends within those fences
+    exactly and samples the outliers beyond them, always keeping the most extreme two.
+    """
+    rng = np.random.default_rng(seed)
+    groups: dict[tuple, dict] = {}
+
+    def _groups(chunk: DataFrame):
+        values, bounds, levels, hue_levels = aggregations.sorted_groups(
+            chunk[x], chunk[y], chunk[hue] if hue is not None else None
+        )
+        hue_levels = hue_levels if hue_levels is not None else [None]
+        for group in range(len(bounds) - 1):
+            if bounds[group + 1] > bounds[group]:
+                key = (levels[group // len(hue_levels)], hue_levels[group % len(hue_levels)])
+                yield key, values[bounds[group]:bounds[group + 1]]
+
+    for chunk in dataset.iter_chunks(x, y, hue):
+        for key, values in _groups(chunk):
+            if key not in groups:
+                groups[key] = {'count': 0, 'sum': 0.0, 'sample': _Reservoir(QUANTILE_SAMPLE_SIZE, rng)}
+            group = groups[key]
+            group['count'] += len(values)
+            group['sum'] += values.sum()
+            group['sample'].add(values)
+
+    for group in groups.values():
+        group['q1'], group['med'], group['q3'] = np.percentile(group['sample'].values, [25, 50, 75])
+        iqr = group['q3'] - group['q1']
+        group.update(low=group['q1'] - whis * iqr, high=group['q3'] + whis * iqr, whislo=np.inf, whishi=-np.inf,
+                     fliers=_Reservoir(max_fliers or np.iinfo(np.int64).max, rng), extremes=[])
+
+    for chunk in dataset.iter_chunks(x, y, hue):
+        for key, values in _groups(chunk):
+            group = groups[key]
+            inside = values[(values >= group['low']) & (values <= group['high'])]
+            if len(inside):
+                group['whislo'] = min(group['whislo'], inside.min())
+                group['whishi'] = max(group['whishi'], inside.max())
+            fliers = values[(values < group['low']) | (values > group['high'])]
+            if len(fliers):
+                group['fliers'].add(fliers)
+                group['extremes'] = [min([fliers.min(), *group['extremes']]), max([fliers.max(), *group['extremes']])]
+
+    table = _GroupTable(hue is not None, index=-1)
+    for n, (level, hue_level) in enumerate(groups):
+        rows, cols = table.align(Index([level]), Index([hue_level]) if hue is not None else None)
+        table.arrays['index'][rows[0], cols[0]] = n
+    levels, hue_levels, arrays = table.finish()
+
+    keys = list(groups)
+    stats = []
+    for row in arrays['index'].astype(np.intp):
+        stats.append([])
+        for n in row:
+            if n < 0:
+                stats[-1].append(None)
+                continue
+            group = groups[keys[n]]
+            sample = group['fliers']
+            fliers = sample.values
+            if group['extremes']:
+                # The extremes take the place of the sampled values with the largest keys,
+                # so a box keeps at most `max_fliers` outliers
+                extremes = np.unique(group['extremes'])
+                others = ~np.isin(sample.values, extremes)
+                sample_keys, fliers = sample.keys[others], sample.values[others]
+                if max_fliers and len(fliers) > max_fliers - len(extremes):
+                    fliers = fliers[np.argsort(sample_keys)[:max(max_fliers - len(extremes), 0)]]
+                fliers = np.unique(np.concatenate((fliers, extremes)))
+            stats[-1].append(aggregations.bxp_stats(
+                group['count'], group['sum'] / group['count'], group['q1'], group['med'], group['q3'],
+                min(group['whislo'], group['q1']), max(group['whishi'], group['q3']), fliers,
+            ))
+    return BoxAggregate(levels, stats, hue_levels)
+
+
+def sample_rows(dataset: ChunkedDataset, columns: list[str], size: int, seed: int = 0) -> DataFrame:
+    """Returns a uniform random sample of `size` rows of `columns`, in dataset order."""
+    rng = np.random.default_rng(seed)
+    kept = None
+    offset = 0
+    for chunk in dataset.iter_chunks(*columns):
+        chunk = chunk.assign(_key=rng.random(len(chunk)), _row=np.arange(offset, offset + len(chunk)))
+        offset += len(chunk)
+        kept = chunk if kept is None else concat([kept, chunk], ignore_index=True)
+        if len(kept) > size:
+            kept = kept.iloc[np.argpartition(kept['_key'].to_numpy(), size)[:size]]
+    if kept is None:
+        return dataset.schema[list(dict.fromkeys(col for col in columns if col is not None))]
+    return kept.sort_values('_row').drop(columns=['_key', '_row']).reset_index(drop=True)
+
+
+def density_counts(dataset: ChunkedDataset, x: str, y: str, bins: int = 300) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bins the x/y points of `dataset` into a `bins` x `bins` count grid, like `numpy.histogram2d`.
+
+    Returns:
+        (counts, x_edges, y_edges)
+    """
+    low, high = np.full(2, np.inf), np.full(2, -np.inf)
+    for chunk in dataset.iter_chunks(x, y):
+        points = chunk[[x, y]].dropna().to_numpy(dtype=float)
+        if len(points):
+            low, high = np.minimum(low, points.min(axis=0)), np.maximum(high, points.max(axis=0))
+    if not np.all(np.isfinite(low)):
+        raise ValueError(f'Columns {x!r} and {y!r} have no points in common.')
+    # histogram2d widens empty ranges the same way
+    bounds = [(lo, hi) if hi > lo else (lo - .5, hi + .5) for lo, hi in zip(low, high)]
+    counts = np.zeros((bins, bins))
+    for chunk in dataset.iter_chunks(x, y):
+        points = chunk[[x, y]].dropna().to_numpy(dtype=float)
+        counts += np.histogram2d(points[:, 0], points[:, 1], bins=bins, range=bounds)[0]
+    return counts, np.linspace(*bounds[0], bins + 1), np.linspace(*bounds[1], bins + 1)
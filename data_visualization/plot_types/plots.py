@@ -1,29 +1,468 @@
-from seaborn import (
-    scatterplot,
-    histplot,
-    boxplot,
-    countplot,
-    barplot,
-)
-from matplotlib.pyplot import Axes
+import colorsys
+import numpy as np
+from enum import Enum
+from matplotlib import rcParams
+from matplotlib.colors import LogNorm, to_rgb, to_rgba
+from matplotlib.patches import Patch
+from matplotlib.pyplot import Axes, gca
 from pandas import DataFrame
-from typing import Any
+from pandas.api.types import is_numeric_dtype
+from typing import Any, Callable, Union
+from data_visualization.data_loader.lazy_dataset import LazyDataset
+from data_visualization.data_loader.chunked_dataset import ChunkedDataset
+from data_visualization.instrumentation import timer
+from . import out_of_core
+from .aggregations import (
+    HistogramAggregate,
+    CountAggregate,
+    BarAggregate,
+    BoxAggregate,
+    histogram_counts,
+    value_counts,
+    bar_estimates,
+    box_statistics,
+    is_categorical,
+    is_continuous,
+)
+
+
+class ScatterMode(Enum):
+    """
+    Enumerates how scatter plots with more rows than their threshold are drawn.
+
+    Attributes:
+        SAMPLE: Draw a random sample, stratified by hue so every group keeps its share.
+        DENSITY: Bin the points into a 2-D count raster drawn with `imshow`.
+    """
+
+    SAMPLE = "sample"
+    DENSITY = "density"
+
+
+class StatsMode(Enum):
+    """
+    Enumerates how bar and box plots compute their statistics.
+
+    Attributes:
+        FAST: Aggregate every group in one vectorized pass, with closed-form error bars
+            and a capped sample of box plot outliers.
+        EXACT: Let seaborn compute them, with bootstrapped confidence intervals and every outlier.
+    """
+
+    FAST = "fast"
+    EXACT = "exact"
+
+
+def _hue_colors(n_levels: int) -> list:
+    """Returns the colors seaborn assigns to `n_levels` categorical hue levels."""
+    from seaborn import color_palette
+    return color_palette(None if n_levels <= len(color_palette()) else 'husl', n_levels)
+
+
+def _box_line_color(colors: list) -> tuple:
+    """Returns the gray seaborn outlines boxes with: 60% of the lightness of the darkest fill color."""
+    lightness = min(colorsys.rgb_to_hls(*to_rgb(color))[1] for color in colors) * .6
+    return (lightness, lightness, lightness)
+
+
+# Scatter plots with more rows than this are sampled or rasterized
+SCATTER_MAX_POINTS = 50_000
+
+# Raster resolution per axis of density-mode scatter plots
+DENSITY_BINS = 300
+
+# Rows sampled from an out-of-core dataset for plots that cannot be aggregated chunk by chunk
+_OUT_OF_CORE_SAMPLE_ROWS = 1_000_000
+
+
+# Draws a prepared plot onto an Axes (pyplot's current one for None)
+DrawPlot = Callable[[Axes], Axes]
+
+
+def _prepare_sample(prepare, data: ChunkedDataset, x: str, y: str, hue: str, **options) -> DrawPlot:
+    """Prepares a plot from a uniform sample of an out-of-core dataset's rows, stating so in the title."""
+    sample = out_of_core.sample_rows(data, [x, y, hue], _OUT_OF_CORE_SAMPLE_ROWS)
+    draw_sample = prepare(sample, x, y, hue, **options)
+    total = f'{data.num_rows:,}' if data.num_rows is not None else 'all'
+
+    def draw(ax: Axes = None) -> Axes:
+        ax = draw_sample(ax)
+        ax.set_title(f'Random sample of {len(sample):,} / {total} rows')
+        return ax
+    return draw
+
+
+def _has_group_stats(data: DataFrame, x: str, y: str, hue: str) -> bool:
+    """Whether a bar or box plot can be aggregated directly: numeric y per level of x, with an optional categorical hue."""
+    if x is None or y is None or any(column not in data for column in (x, y, hue) if column is not None):
+        return False  # Left to seaborn, which raises ValueError for an unknown column
+    return is_continuous(data[y]) and (hue is None or is_categorical(data[hue]))
+
+
+def _draw_empty(ax: Axes, x: str, y: str) -> Axes:
+    """Labels the empty Axes seaborn leaves when there is no group to draw, e.g. for an empty dataset."""
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    return ax
+
+
+def _check_columns(data: Union[DataFrame, LazyDataset, ChunkedDataset], x: str, y: str, hue: str) -> None:
+    """Raises ValueError, like seaborn does, if x, y or hue is not a column of `data`."""
+    unknown = [column for column in (x, y, hue) if column is not None and column not in data.columns]
+    if unknown:
+        raise ValueError(f'Columns not found in dataset: {unknown}')
+
 
 class CustomPlots:
     """
     Provides custom plotting functions for histograms and counts,
     enhancing them with bar labels for better readability.
+
+    Histograms of a numeric column and counts along x are aggregated with NumPy first and
+    drawn from the counts, matching seaborn's histplot/countplot output. Bar means and box
+    statistics of a numeric y per level of x are aggregated the same way unless
+    `StatsMode.EXACT` is asked for; other inputs go through seaborn directly.
+
+    seaborn is imported by the functions that use it rather than with this module, since
+    importing it takes longer than the rest of the application's startup.
+
+    Each plot also has a `prepare_*` variant that does the aggregation, sampling or
+    statistics without touching matplotlib and returns a function that draws the result,
+    so the preparation can run on a worker thread. Plots left to seaborn are computed
+    when drawn.
     """
-    def histogram(data: DataFrame = None, x: str = None, y:str = None, hue: str = None) -> Axes:
-        ax = histplot(data=data, x=x, y=y, hue=hue, multiple= 'stack')
-        for container in ax.containers:
-            ax.bar_label(container, label_type= 'center')
+    def histogram(data: DataFrame = None, x: str = None, y:str = None, hue: str = None, ax: Axes = None) -> Axes:
+        return CustomPlots.prepare_histogram(data, x, y, hue)(ax)
+
+    def prepare_histogram(data: DataFrame = None, x: str = None, y: str = None, hue: str = None) -> DrawPlot:
+        if isinstance(data, ChunkedDataset):
+            _check_columns(data, x, y, hue)
+            if y is None and is_continuous(data.schema[x]) and (hue is None or is_categorical(data.schema[hue])):
+                aggregate = out_of_core.histogram_counts(data, x, hue)
+                return lambda ax= None: CustomPlots.draw_histogram(aggregate, x= x, hue= hue, ax= ax)
+            return _prepare_sample(CustomPlots.prepare_histogram, data, x, y, hue)
+        if y is None and is_continuous(data[x]) and (hue is None or is_categorical(data[hue])):
+            aggregate = histogram_counts(data[x], data[hue] if hue is not None else None)
+            return lambda ax= None: CustomPlots.draw_histogram(aggregate, x= x, hue= hue, ax= ax)
+
+        def draw(ax: Axes = None) -> Axes:
+            from seaborn import histplot
+            ax = histplot(data=data, x=x, y=y, hue=hue, multiple= 'stack', ax=ax)
+            for container in ax.containers:
+                ax.bar_label(container, label_type= 'center')
+            return ax
+        return draw
+
+    def count(data: DataFrame = None, x: str = None, y:str = None, hue: str = None, ax: Axes = None) -> Axes:
+        return CustomPlots.prepare_count(data, x, y, hue)(ax)
+
+    def prepare_count(data: DataFrame = None, x: str = None, y: str = None, hue: str = None) -> DrawPlot:
+        if isinstance(data, ChunkedDataset):
+            _check_columns(data, x, y, hue)
+            if y is None and x is not None and (hue is None or is_categorical(data.schema[hue])):
+                aggregate = out_of_core.value_counts(data, x, hue)
+                return lambda ax= None: CustomPlots.draw_count(aggregate, x= x, hue= hue, ax= ax)
+            return _prepare_sample(CustomPlots.prepare_count, data, x, y, hue)
+        if y is None and x is not None and (hue is None or is_categorical(data[hue])):
+            aggregate = value_counts(data[x], data[hue] if hue is not None else None)
+            return lambda ax= None: CustomPlots.draw_count(aggregate, x= x, hue= hue, ax= ax)
+
+        def draw(ax: Axes = None) -> Axes:
+            from seaborn import countplot
+            ax = countplot(data=data, x=x, y=y, hue=hue, ax=ax)
+            for container in ax.containers:
+                ax.bar_label(container, label_type= 'center')
+            return ax
+        return draw
+
+    def draw_histogram(aggregate: HistogramAggregate, x: str = None, hue: str = None, ax: Axes = None) -> Axes:
+        """
+        Draws pre-computed bin counts as a histogram stacked by hue, with the count of
+        each bar labelled at its center, as `histplot(multiple='stack')` would.
+        """
+        ax = ax if ax is not None else gca()
+        edges, counts = aggregate.edges, aggregate.counts
+        widths = np.diff(edges)
+        n_levels = counts.shape[1]
+        colors = _hue_colors(n_levels) if aggregate.hue_levels is not None else ['C0']
+
+        # seaborn draws the last hue level at the bottom of the stack
+        bottoms = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1] - counts
+        containers = []
+        for level in reversed(range(n_levels)):
+            container = ax.bar(edges[:-1], counts[:, level], widths, bottoms[:, level], align='edge',
+                               facecolor=to_rgba(colors[level], .75), edgecolor=rcParams['patch.edgecolor'])
+            ax.bar_label(container, labels=[f'{count:g}' for count in counts[:, level]], label_type='center')
+            containers.append(container)
+
+        # Thin the bar outlines when bins get narrow, like seaborn does
+        ax.autoscale_view()
+        binwidth_points = 72 / ax.figure.dpi * abs(
+            ax.transData.transform([(edges[0] + widths.min(), 0)])[0, 0] - ax.transData.transform([(edges[0], 0)])[0, 0]
+        )
+        linewidth = min(.1 * binwidth_points, rcParams['patch.linewidth'])
+        for container in containers:
+            for bar in container:
+                bar.set_linewidth(linewidth)
+
+        ax.set_xlabel(x)
+        ax.set_ylabel('Count')
+        if aggregate.hue_levels is not None:
+            ax.legend(handles=containers[::-1], labels=[str(level) for level in aggregate.hue_levels], title=hue)
+        return ax
+
+    def draw_count(aggregate: CountAggregate, x: str = None, hue: str = None, ax: Axes = None) -> Axes:
+        """
+        Draws pre-computed occurrence counts as bars dodged by hue, with the count of
+        each bar labelled at its center, as `countplot` would.
+        """
+        from seaborn import desaturate
+        ax = ax if ax is not None else gca()
+        counts = aggregate.counts
+        n_x, n_levels = counts.shape
+        if not n_x or not n_levels:
+            return _draw_empty(ax, x, 'count')
+        positions = np.arange(n_x)
+        colors = _hue_colors(n_levels) if aggregate.hue_levels is not None else ['C0']
+        width = .8 / n_levels
+
+        containers = []
+        for level in range(n_levels):
+            # Combinations that never occur get no bar, as in seaborn
+            present = counts[:, level] > 0 if aggregate.hue_levels is not None else slice(None)
+            container = ax.bar(positions[present] - .4 + level * width, counts[present, level], width,
+                               align='edge', color=desaturate(colors[level], .75), edgecolor='none')
+            ax.bar_label(container, labels=[f'{count:g}' for count in counts[present, level]], label_type='center')
+            containers.append(container)
+
+        ax.set_xticks(positions, [str(level) for level in aggregate.levels])
+        ax.set_xlim(-.5, n_x - .5)
+        ax.xaxis.grid(False)
+        ax.set_xlabel(x)
+        ax.set_ylabel('count')
+        if aggregate.hue_levels is not None:
+            ax.legend(handles=containers, labels=[str(level) for level in aggregate.hue_levels], title=hue)
+        return ax
+
+    def bar(data: DataFrame = None, x: str = None, y: str = None, hue: str = None, ax: Axes = None,
+            mode: StatsMode = StatsMode.FAST, errorbar: str = 'ci') -> Axes:
+        """
+        Draws the mean of y for each level of x as bars dodged by hue.
+
+        Args:
+            mode (StatsMode): Compute the means and error bars in one vectorized pass, or with seaborn.
+            errorbar (str): 'ci', 'se', 'sd' or None; in fast mode the 95% interval is the normal
+                approximation instead of seaborn's 1000-sample bootstrap. Out-of-core datasets
+                are always aggregated in fast mode.
+        """
+        return CustomPlots.prepare_bar(data, x, y, hue, mode, errorbar)(ax)
+
+    def prepare_bar(data: DataFrame = None, x: str = None, y: str = None, hue: str = None,
+                    mode: StatsMode = StatsMode.FAST, errorbar: str = 'ci') -> DrawPlot:
+        if isinstance(data, ChunkedDataset):
+            if _has_group_stats(data.schema, x, y, hue):
+                aggregate = out_of_core.bar_estimates(data, x, y, hue, errorbar)
+                return lambda ax= None: CustomPlots.draw_bar(aggregate, x= x, y= y, hue= hue, ax= ax)
+            return _prepare_sample(CustomPlots.prepare_bar, data, x, y, hue, mode= mode, errorbar= errorbar)
+        if mode is StatsMode.FAST and _has_group_stats(data, x, y, hue):
+            aggregate = bar_estimates(data[x], data[y], data[hue] if hue is not None else None, errorbar)
+            return lambda ax= None: CustomPlots.draw_bar(aggregate, x= x, y= y, hue= hue, ax= ax)
+        errorbar = ('ci', 95) if errorbar == 'ci' else errorbar
+
+        def draw(ax: Axes = None) -> Axes:
+            from seaborn import barplot
+            return barplot(data=data, x=x, y=y, hue=hue, errorbar=errorbar, ax=ax)
+        return draw
+
+    def box(data: DataFrame = None, x: str = None, y: str = None, hue: str = None, ax: Axes = None,
+            mode: StatsMode = StatsMode.FAST, max_fliers: int = 1_000) -> Axes:
+        """
+        Draws box plots of y for each level of x, dodged by hue.
+
+        Args:
+            mode (StatsMode): Compute the quartiles and whiskers in one vectorized pass, or with seaborn.
+            max_fliers (int): Most outliers drawn per box in fast mode; a random sample that
+                keeps the extremes stands in for the rest. Out-of-core datasets are always
+                aggregated in fast mode, with quartiles estimated from a sample of each group.
+        """
+        return CustomPlots.prepare_box(data, x, y, hue, mode, max_fliers)(ax)
+
+    def prepare_box(data: DataFrame = None, x: str = None, y: str = None, hue: str = None,
+                    mode: StatsMode = StatsMode.FAST, max_fliers: int = 1_000) -> DrawPlot:
+        if isinstance(data, ChunkedDataset):
+            if _has_group_stats(data.schema, x, y, hue):
+                aggregate = out_of_core.box_statistics(data, x, y, hue, max_fliers= max_fliers)
+                return lambda ax= None: CustomPlots.draw_box(aggregate, x= x, y= y, hue= hue, ax= ax)
+            return _prepare_sample(CustomPlots.prepare_box, data, x, y, hue, mode= mode, max_fliers= max_fliers)
+        if mode is StatsMode.FAST and _has_group_stats(data, x, y, hue):
+            aggregate = box_statistics(data[x], data[y], data[hue] if hue is not None else None,
+                                       max_fliers=max_fliers)
+            return lambda ax= None: CustomPlots.draw_box(aggregate, x= x, y= y, hue= hue, ax= ax)
+
+        def draw(ax: Axes = None) -> Axes:
+            from seaborn import boxplot
+            return boxplot(data=data, x=x, y=y, hue=hue, ax=ax)
+        return draw
+
+    def draw_bar(aggregate: BarAggregate, x: str = None, y: str = None, hue: str = None, ax: Axes = None) -> Axes:
+        """Draws pre-computed means and error bars as bars dodged by hue, as `barplot` would."""
+        from seaborn import desaturate
+        ax = ax if ax is not None else gca()
+        n_x, n_levels = aggregate.means.shape
+        if not n_x or not n_levels:
+            return _draw_empty(ax, x, y)
+        positions = np.arange(n_x)
+        colors = _hue_colors(n_levels) if aggregate.hue_levels is not None else ['C0']
+        width = .8 / n_levels
+
+        containers = []
+        for level in range(n_levels):
+            present = aggregate.counts[:, level] > 0
+            centers = positions[present] - .4 + (level + .5) * width
+            color = desaturate(colors[level], .75)
+            containers.append(ax.bar(centers - width / 2, aggregate.means[present, level], width,
+                                     align='edge', color=color, facecolor=color))
+            if aggregate.lower is not None:
+                # One line for all of this level's error bars, broken up by NaNs
+                ax.plot(np.repeat(centers, 3), np.column_stack((
+                    aggregate.lower[present, level], aggregate.upper[present, level], np.full(len(centers), np.nan)
+                )).ravel(), color='.26', linewidth=1.5 * rcParams['lines.linewidth'])
+
+        ax.set_xticks(positions, [str(level) for level in aggregate.levels])
+        ax.set_xlim(-.5, n_x - .5)
+        ax.xaxis.grid(False)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+        if aggregate.hue_levels is not None:
+            ax.legend(handles=containers, labels=[str(level) for level in aggregate.hue_levels], title=hue)
         return ax
 
-    def count(data: DataFrame = None, x: str = None, y:str = None, hue: str = None) -> Axes:
-        ax = countplot(data=data, x=x, y=y, hue=hue)
-        for container in ax.containers:
-            ax.bar_label(container, label_type= 'center')
+    def draw_box(aggregate: BoxAggregate, x: str = None, y: str = None, hue: str = None, ax: Axes = None) -> Axes:
+        """Draws pre-computed box statistics with `Axes.bxp`, styled and dodged by hue as `boxplot` would."""
+        from seaborn import desaturate
+        ax = ax if ax is not None else gca()
+        n_x = len(aggregate.levels)
+        n_levels = len(aggregate.hue_levels) if aggregate.hue_levels is not None else 1
+        if not n_x or not n_levels:
+            return _draw_empty(ax, x, y)
+        colors = [desaturate(color, .75) for color in
+                  (_hue_colors(n_levels) if aggregate.hue_levels is not None else ['C0'])]
+        line_color = _box_line_color(colors)
+        width = .8 / n_levels
+
+        for level in range(n_levels):
+            present = [i for i in range(n_x) if aggregate.stats[i][level] is not None]
+            if not present:
+                continue
+            ax.bxp([aggregate.stats[i][level] for i in present],
+                   positions=np.array(present) - .4 + (level + .5) * width,
+                   widths=width, capwidths=.5 * width, patch_artist=True, manage_ticks=False,
+                   boxprops={'facecolor': colors[level], 'edgecolor': line_color},
+                   medianprops={'color': line_color, 'solid_capstyle': 'butt'},
+                   whiskerprops={'color': line_color, 'solid_capstyle': 'butt'},
+                   capprops={'color': line_color},
+                   flierprops={'markeredgecolor': line_color, 'markersize': 5})
+
+        ax.set_xticks(np.arange(n_x), [str(level) for level in aggregate.levels])
+        ax.set_xlim(-.5, n_x - .5)
+        ax.xaxis.grid(False)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+        if aggregate.hue_levels is not None:
+            handles = [Patch(facecolor=color, edgecolor=line_color, linewidth=rcParams['patch.linewidth'])
+                       for color in colors]
+            ax.legend(handles=handles, labels=[str(level) for level in aggregate.hue_levels], title=hue)
+        return ax
+
+    def scatter(data: DataFrame = None, x: str = None, y: str = None, hue: str = None, ax: Axes = None,
+                max_points: int = SCATTER_MAX_POINTS, mode: ScatterMode = ScatterMode.SAMPLE,
+                bins: int = DENSITY_BINS) -> Axes:
+        """
+        Draws a scatter plot, switching to a cheaper rendering once `data` has more than
+        `max_points` rows. The title states which rendering was used.
+
+        Args:
+            max_points (int): Row count above which the large-data mode kicks in.
+            mode (ScatterMode): Sample the rows or draw a 2-D density raster.
+            bins (int): Raster resolution per axis in density mode.
+        """
+        return CustomPlots.prepare_scatter(data, x, y, hue, max_points, mode, bins)(ax)
+
+    def prepare_scatter(data: DataFrame = None, x: str = None, y: str = None, hue: str = None,
+                        max_points: int = SCATTER_MAX_POINTS, mode: ScatterMode = ScatterMode.SAMPLE,
+                        bins: int = DENSITY_BINS) -> DrawPlot:
+        if isinstance(data, ChunkedDataset):
+            return CustomPlots._prepare_scatter_out_of_core(data, x, y, hue, max_points, mode, bins)
+        rows = len(data)
+        if rows <= max_points:
+            return CustomPlots._scatter_points(data, x, y, hue)
+
+        suffix = ' (hue ignored)' if hue else ''
+        numeric = is_numeric_dtype(data[x]) and is_numeric_dtype(data[y])
+        if mode is ScatterMode.DENSITY and numeric:
+            points = data[[x, y]].dropna()
+            counts, x_edges, y_edges = np.histogram2d(points[x].to_numpy(), points[y].to_numpy(), bins=bins)
+            return CustomPlots._density_drawing(counts, x_edges, y_edges, x, y,
+                                                f'Density of {rows:,} points in {bins}x{bins} bins{suffix}')
+
+        sample = CustomPlots._stratified_sample(data, hue, max_points)
+        strata = ', stratified by hue' if hue else ''
+        return CustomPlots._scatter_points(sample, x, y, hue,
+                                           f'Random sample of {len(sample):,} / {rows:,} points{strata}')
+
+    def _prepare_scatter_out_of_core(data: ChunkedDataset, x: str, y: str, hue: str, max_points: int,
+                                     mode: ScatterMode, bins: int) -> DrawPlot:
+        """Prepares an out-of-core dataset as a density raster, or as a uniform sample of `max_points` rows."""
+        _check_columns(data, x, y, hue)
+        numeric = is_numeric_dtype(data.schema[x]) and is_numeric_dtype(data.schema[y])
+        if mode is ScatterMode.DENSITY and numeric:
+            counts, x_edges, y_edges = out_of_core.density_counts(data, x, y, bins)
+            suffix = ' (hue ignored)' if hue else ''
+            return CustomPlots._density_drawing(counts, x_edges, y_edges, x, y,
+                                                f'Density of {int(counts.sum()):,} points in {bins}x{bins} bins{suffix}')
+        sample = out_of_core.sample_rows(data, [x, y, hue], max_points)
+        total = f'{data.num_rows:,}' if data.num_rows is not None else 'all'
+        return CustomPlots._scatter_points(sample, x, y, hue, f'Random sample of {len(sample):,} / {total} points')
+
+    def _scatter_points(data: DataFrame, x: str, y: str, hue: str, title: str = None) -> DrawPlot:
+        """Returns a function drawing every row of `data` with seaborn's scatterplot, titled `title`."""
+        def draw(ax: Axes = None) -> Axes:
+            from seaborn import scatterplot
+            ax = scatterplot(data=data, x=x, y=y, hue=hue, ax=ax)
+            if title is not None:
+                ax.set_title(title)
+            return ax
+        return draw
+
+    def _density_drawing(counts: np.ndarray, x_edges: np.ndarray, y_edges: np.ndarray, x: str, y: str,
+                         title: str) -> DrawPlot:
+        """Returns a function drawing a 2-D count grid with `_draw_density`, titled `title`."""
+        def draw(ax: Axes = None) -> Axes:
+            ax = CustomPlots._draw_density(counts, x_edges, y_edges, x, y, ax)
+            ax.set_title(title)
+            return ax
+        return draw
+
+    def _stratified_sample(data: DataFrame, hue: str, max_points: int) -> DataFrame:
+        """Samples about `max_points` rows, keeping each hue group's share and at least one row per group."""
+        if hue is None:
+            return data.sample(n=max_points, random_state=0)
+        fraction = max_points / len(data)
+        shuffled = data.iloc[np.random.default_rng(0).permutation(len(data))]
+        groups = shuffled.groupby(hue, observed=True, dropna=False, sort=False)
+        quota = np.maximum(1, np.round(groups[hue].transform('size').to_numpy() * fraction))
+        return shuffled[groups.cumcount().to_numpy() < quota]
+
+    def _draw_density(counts: np.ndarray, x_edges: np.ndarray, y_edges: np.ndarray, x: str, y: str,
+                      ax: Axes = None) -> Axes:
+        """Draws a 2-D count grid as a log-scaled image with a colorbar."""
+        ax = ax if ax is not None else gca()
+        image = ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto',
+                          extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                          norm=LogNorm(), cmap='viridis', interpolation='nearest')
+        ax.figure.colorbar(image, ax=ax, label='Points per bin')
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
         return ax
 
 class Plots:
@@ -33,30 +472,76 @@ class Plots:
     """
 
     _PLOTS: dict[str, Any] = {
-        'Scatter': scatterplot,
+        'Scatter': CustomPlots.scatter,
         'Histogram': CustomPlots.histogram,
-        'Box': boxplot,
+        'Box': CustomPlots.box,
         'Count': CustomPlots.count,
-        'Bar': barplot,
+        'Bar': CustomPlots.bar,
     }
 
-    def __init__(self, plot_type: str = None) -> None:
+    _PREPARE: dict[str, Any] = {
+        'Scatter': CustomPlots.prepare_scatter,
+        'Histogram': CustomPlots.prepare_histogram,
+        'Box': CustomPlots.prepare_box,
+        'Count': CustomPlots.prepare_count,
+        'Bar': CustomPlots.prepare_bar,
+    }
+
+    def __init__(self, plot_type: str = None, **options: Any) -> None:
+        """
+        Args:
+            plot_type (str): A key of `_PLOTS`.
+            **options: Extra keyword arguments for the plot function,
+                e.g. `max_points` and `mode` for 'Scatter', or `mode` for 'Box' and 'Bar'.
+        """
         self.plot_type = plot_type
+        self.options = options
 
-    def plot(self, data: DataFrame, x: str = None, y: str = None, hue: str = None) -> Axes:
+    def plot(self, data: Union[DataFrame, LazyDataset, ChunkedDataset], x: str = None, y: str = None, hue: str = None,
+             ax: Axes = None) -> Axes:
         """
         Creates the specified plot type using the provided data and arguments.
 
         Args:
-            data: The DataFrame containing the data to plot.
+            data: The DataFrame containing the data to plot. A LazyDataset only
+                reads the x, y and hue columns; a ChunkedDataset is aggregated chunk by
+                chunk and only the aggregate is drawn.
             x: The name of the column for the x-axis.
             y: The name of the column for the y-axis.
             hue: The name of the column to use for grouping by hue.
+            ax: The Axes to draw on. Defaults to pyplot's current Axes.
 
         Returns:
             The Axes object containing the generated plot.
+
+        Raises:
+            ValueError: If x, y or hue is not a column of `data`.
         """
-        ax = self._PLOTS[self.plot_type](data= data, x= x, y= y, hue= hue)
+        with timer.phase('Plots.plot', plot=self.plot_type) as span:
+            _check_columns(data, x, y, hue)
+            if isinstance(data, LazyDataset):
+                data = data.get(x, y, hue)
+            span.rows = data.num_rows if isinstance(data, ChunkedDataset) else len(data)
+            ax = self._PLOTS[self.plot_type](data= data, x= x, y= y, hue= hue, ax= ax, **self.options)
         return ax
 
+    def prepare(self, data: Union[DataFrame, LazyDataset, ChunkedDataset], x: str = None, y: str = None,
+                hue: str = None) -> DrawPlot:
+        """
+        Does the data preparation of `plot` (reading lazy columns, aggregating, sampling)
+        without drawing anything, so it can run on a worker thread.
+
+        Args:
+            data, x, y, hue: As for `plot`.
+
+        Returns:
+            A function that draws the plot onto the Axes it is given; call it on the GUI thread.
+        """
+        with timer.phase('Plots.prepare', plot=self.plot_type) as span:
+            _check_columns(data, x, y, hue)
+            if isinstance(data, LazyDataset):
+                data = data.get(x, y, hue)
+            span.rows = data.num_rows if isinstance(data, ChunkedDataset) else len(data)
+            return self._PREPARE[self.plot_type](data= data, x= x, y= y, hue= hue, **self.options)
+
 
@@ -0,0 +1,130 @@
+import hashlib
+import weakref
+import itertools
+import numpy as np
+from collections import OrderedDict
+from typing import Hashable, Union
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+from data_visualization.data_loader.lazy_dataset import LazyDataset
+from data_visualization.data_loader.chunked_dataset import ChunkedDataset
+
+# Rows hashed when fingerprinting a DataFrame, spread evenly over its length
+_FINGERPRINT_SAMPLE_ROWS = 1_000
+
+# Serial numbers of the LazyDataset and ChunkedDataset objects fingerprinted so far. Unlike
+# id(), a serial number is never handed to another object once the first one is freed.
+_serials: "weakref.WeakKeyDictionary[object, int]" = weakref.WeakKeyDictionary()
+_next_serial = itertools.count()
+
+
+def dataset_fingerprint(data: Union[DataFrame, LazyDataset, ChunkedDataset]) -> str:
+    """
+    Returns a cheap fingerprint of a dataset: its shape, column dtypes and a hash of
+    evenly spaced sample rows. Two loads of the same file get the same fingerprint.
+
+    A LazyDataset or ChunkedDataset is identified by its schema, row count and a serial
+    number given to each such object, since hashing sample rows would force every column
+    to be read.
+
+    The sample rows can miss an edit to a file, so callers that reload data should
+    `RenderCache.clear()` rather than rely on the fingerprint changing.
+    """
+    digest = hashlib.sha1()
+    if isinstance(data, (LazyDataset, ChunkedDataset)):
+        if data not in _serials:
+            _serials[data] = next(_next_serial)
+        digest.update(repr((list(data.schema.dtypes.items()), data.num_rows, _serials[data])).encode())
+        return digest.hexdigest()
+
+    digest.update(repr((data.shape, list(data.dtypes.items()))).encode())
+    if len(data):
+        rows = np.unique(np.linspace(0, len(data) - 1, _FINGERPRINT_SAMPLE_ROWS).astype(np.intp))
+        try:
+            digest.update(hash_pandas_object(data.iloc[rows], index=False).to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cells such as lists fall back to their text form
+            digest.update(data.iloc[rows].to_string().encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    An LRU cache of rendered plot images, bounded by the total size of the stored buffers.
+
+    Keys combine a dataset fingerprint with the plot spec, so flipping back to a plot
+    already drawn for the same data only has to blit the stored pixels.
+
+    Methods:
+        key(self, data, plot_type, x, y, hue, options, size) -> tuple:
+            Builds the cache key for a plot.
+
+        get(self, key) -> np.ndarray:
+            Returns the cached RGBA buffer, or None on a miss.
+
+        put(self, key, image) -> None:
+            Stores an RGBA buffer, evicting least recently used ones past `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 200 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._size = 0
+        self._fingerprint: tuple[weakref.ref, str] = None
+
+    def key(self, data: Union[DataFrame, LazyDataset, ChunkedDataset], plot_type: str, x: str = None, y: str = None,
+            hue: str = None, options: dict = None, size: tuple[int, int] = None) -> tuple:
+        """
+        Builds the cache key for drawing `plot_type` of `data` with the given columns,
+        plot options and canvas size in pixels.
+        """
+        # The last dataset's fingerprint is remembered, so repeated plots skip the sampling.
+        # A weak reference avoids keeping a replaced dataset alive.
+        if self._fingerprint is None or self._fingerprint[0]() is not data:
+            self._fingerprint = (weakref.ref(data), dataset_fingerprint(data))
+        return (self._fingerprint[1], plot_type, x, y, hue, tuple(sorted((options or {}).items())), size)
+
+    def get(self, key: tuple) -> np.ndarray:
+        """Returns the cached image for `key`, or None, and counts the hit or miss."""
+        image = self._entries.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return image
+
+    def put(self, key: tuple, image: np.ndarray) -> None:
+        """Stores `image` under `key`, evicting least recently used images past the budget."""
+        if key in self._entries:
+            self._size -= self._entries.pop(key).nbytes
+        if image.nbytes > self.max_bytes:
+            return
+        self._entries[key] = image
+        self._size += image.nbytes
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drops every cached image and resets the statistics."""
+        self._entries.clear()
+        self._fingerprint = None
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached images, in bytes."""
+        return self._size
+
+    def stats(self) -> str:
+        """Summarizes the cache for display, e.g. 'Render cache: 3 hits / 5 misses (4 plots, 7.0 MB)'."""
+        return (f'Render cache: {self.hits} hits / {self.misses} misses '
+                f'({len(self)} plots, {self._size / 2**20:,.1f} MB)')
@@ -1,24 +1,84 @@
 import sys
 import os
-import gc
+import importlib
+import threading
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from data_visualization.plot_types import Plots
-from data_visualization.data_loader import File, KaggleFile
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from typing import TYPE_CHECKING
+from data_visualization.instrumentation import timer
+from .column_summary import VirtualColumnList
 from tkinter import (
     filedialog,
     messagebox,
     StringVar
 )
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from data_visualization.data_loader import BackgroundLoader, BackgroundDownloader, ExcelSheet
+    from data_visualization.data_loader.column_stats import DistinctCountJob
+    from data_visualization.plot_types import Dashboard, DetailTask, PlotSpec
+
+# pandas, matplotlib and the loaders take over a second to import, so the window is shown
+# without them and they are imported on a background thread once it has been drawn. The
+# methods that use them import them locally; seaborn and the Kaggle client are left to load
+# on first use.
+PREWARMED_MODULES: tuple[str, ...] = (
+    'data_visualization.data_loader',
+    'data_visualization.data_loader.column_stats',
+    'data_visualization.plot_types',
+    'matplotlib.figure',
+    'matplotlib.backends.backend_tkagg',
+)
+
+
 class DataVisualizationWindow(ctk.CTk):
+    _LOAD_POLL_INTERVAL_MS: int = 100
+    _SUMMARY_POLL_INTERVAL_MS: int = 100
+    _DETAIL_POLL_INTERVAL_MS: int = 50
+    # Quiet time after the last zoom or pan step before the view is re-aggregated
+    _DETAIL_DEBOUNCE_MS: int = 250
+    _DASHBOARD_POLL_INTERVAL_MS: int = 50
+    # Rows and columns of the dashboard grid
+    _DASHBOARD_SHAPE: tuple[int, int] = (2, 2)
+    # Text columns with at most this ratio of distinct values to rows are loaded as `category`
+    _CATEGORY_RATIO: float = 0.5
+    # Files at least this large are previewed from a sample of rows while they load
+    _PREVIEW_MIN_BYTES: int = 50 * 2**20
+    _PREVIEW_ROWS: int = 100_000
+    # Disk budget of the Kaggle dataset store; least recently used datasets are evicted past it
+    _DATASET_STORE_BYTES: int = 20 * 2**30
+    # Phases listed in the timing status, in pipeline order
+    _TIMED_PHASES: list[str] = ['window.first_paint', 'File.read', 'update_data_columns', 'DistinctCountJob', 'Plots.plot', 'Plots.prepare', 'level_of_detail', 'canvas.draw']
+
     def __init__(self) -> None:
+        first_paint_span = timer.phase('window.first_paint')
         super().__init__()
+        # Ended by _on_first_paint once Tk has drawn the widgets
+        self._first_paint_span = first_paint_span
         self.data = None
         self.canvas = None
         self.figure = None
+        self.toolbar = None
         self.plotter = None
+        self.loader = None
+        self.downloader = None
+        self.summary_job = None
+        self._summary_span = None
+        # True while `data` is a preview sample awaiting the full load
+        self.is_preview = False
+        # (plot_type, options, x, y, hue) of the plot on screen, re-rendered when the full dataset arrives
+        self._last_plot = None
+        # (data, plot_type, options, x, y, hue) re-aggregated for the visible range after a zoom or pan
+        self._detail_spec = None
+        self.detail_task = None
+        self._detail_after = None
+        # Set while plots go to the cells of a dashboard rather than the whole figure
+        self.dashboard = None
+        self._polling_dashboard = False
+        # Created on first use, since they need the modules imported after the first paint
+        self.file_cache = None
+        self.render_cache = None
+        self.dataset_store = None
         self._center_screen()
         self.title("Data Visualization")
         self.resizable(False, False)
@@ -29,12 +89,33 @@ class DataVisualizationWindow(ctk.CTk):
 
         self.create_plot_frame()
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        # Idle callbacks run in order, so this one runs after the widgets' own redraws
+        self.after_idle(self._on_first_paint)
 
-        self.mainloop()
+    def _on_first_paint(self) -> None:
+        """Records the time to the first drawn window and starts importing the heavy modules."""
+        self._first_paint_span.end()
+        self._show_timings()
+        threading.Thread(target=self._prewarm, name='prewarm-imports', daemon=True).start()
+
+    @staticmethod
+    def _prewarm() -> None:
+        """Imports `PREWARMED_MODULES`, so the first load and plot do not wait for them."""
+        for name in PREWARMED_MODULES:
+            importlib.import_module(name)
 
     def _on_closing(self) -> None:
         """Executes closes all canvas and closes the window when the exit icon is clicked."""
-        plt.close('all')
+        plt = sys.modules.get('matplotlib.pyplot')  # Only loaded once something has plotted
+        if plt is not None:
+            plt.close('all')
+        if self.loader is not None:
+            self.loader.cancel()
+        if self.downloader is not None:
+            self.downloader.cancel()
+        self._cancel_detail()
+        if self.dashboard is not None:
+            self.dashboard.close()
         self.figure = None
         self.plotter = None
         self.canvas = None
@@ -86,6 +167,45 @@ class DataVisualizationWindow(ctk.CTk):
                                             command=self.toggle_import_options)
         self.radio_kaggle.grid(row= 2, column=0, padx= 10, pady= 10, sticky= ctk.W)
 
+        # Lazy loading reads only the schema and fetches the plotted columns on demand
+        self.lazy_load_var = ctk.BooleanVar(value= False)
+        self.lazy_load_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.lazy_load_var,
+                                                text= 'Load columns on demand')
+        self.lazy_load_checkbox.grid(row= 3, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
+        # Out-of-core loading streams Parquet/CSV/Arrow files and plots only their aggregates
+        self.out_of_core_var = ctk.BooleanVar(value= False)
+        self.out_of_core_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.out_of_core_var,
+                                                  text= 'Stream larger-than-memory files')
+        self.out_of_core_checkbox.grid(row= 4, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
+        # Large files show a sample spread through the file while the rest loads
+        self.preview_load_var = ctk.BooleanVar(value= True)
+        self.preview_load_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.preview_load_var,
+                                                   text= 'Preview large files while loading')
+        self.preview_load_checkbox.grid(row= 5, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
+        # Arrow-backed columns keep text compact and map Feather/Arrow files instead of copying them
+        self.arrow_load_var = ctk.BooleanVar(value= False)
+        self.arrow_load_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.arrow_load_var,
+                                                 text= 'Arrow-backed columns')
+        self.arrow_load_checkbox.grid(row= 6, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
+        # Kaggle downloads keep compressed Parquet copies of their CSV/JSON files instead of the raw files
+        self.compact_download_var = ctk.BooleanVar(value= False)
+        self.compact_download_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.compact_download_var,
+                                                       text= 'Compact Kaggle downloads')
+        self.compact_download_checkbox.grid(row= 7, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
+        # Phase timings for reading, summarizing, plotting and drawing, shown in the browse frame
+        self.timing_var = ctk.BooleanVar(value= timer.enabled)
+        self.timing_checkbox = ctk.CTkCheckBox(self.import_frame, variable= self.timing_var,
+                                             text= 'Record timings', command= self.toggle_timings)
+        self.timing_checkbox.grid(row= 8, column=0, padx= 10, pady= 10, sticky= ctk.W)
+        self.export_timings_btn = ctk.CTkButton(self.import_frame, text= 'Export timings',
+                                                command= self.export_timings)
+        self.export_timings_btn.grid(row= 9, column=0, padx= 10, pady= 10, sticky= ctk.W)
+
         self.browse_frame = ctk.CTkFrame(self)
         self.browse_frame.grid(row= 0, column= 1, padx= 10, pady= 10, sticky= ctk.NSEW)
         
@@ -93,6 +213,14 @@ class DataVisualizationWindow(ctk.CTk):
         self.download_progress_label.place(x= 300, y= 10)
         self.plot_progress_label = ctk.CTkLabel(self.browse_frame, text=' ')
         self.plot_progress_label.place(x= 300, y= 10)
+        self.load_progress_label = ctk.CTkLabel(self.browse_frame, text=' ')
+        self.load_progress_label.place(x= 10, y= 10)
+        # Status text for the timings, in the same frame as the progress labels but below the
+        # file entry: the summary wraps over several lines and would cover the entry at the top
+        self.timing_label = ctk.CTkLabel(self.browse_frame, text=' ', font= ctk.CTkFont(size= 11),
+                                         wraplength= 780, justify= 'left')
+        self.timing_label.place(x= 10, y= 92)
+        self.cancel_load_btn = ctk.CTkButton(self.browse_frame, text= 'Cancel', command= self.cancel_loading)
 
         self.entry_textvariable = ctk.StringVar()
         self.read_entry = ctk.CTkEntry(self.browse_frame, width=600,
@@ -109,72 +237,218 @@ class DataVisualizationWindow(ctk.CTk):
 
     def create_data_columns_frame(self) -> None:
         """
-        Creates a scrollable frame to display information about numerical and categorical columns.
+        Creates scrolling lists to display information about numerical and categorical columns.
+
+        Only the visible rows have widgets, so wide datasets do not create a label per column.
         """
-        # Create the scrollable frame for numerical data type
-        self.num_col_frame = ctk.CTkScrollableFrame(self, height= 150, width=230)
+        # Create the list for numerical data type
+        self.num_col_frame = VirtualColumnList(self, title= 'Numerical Columns')
         self.num_col_frame.grid(row= 1, column= 0, padx= 10, pady= 10, sticky= ctk.NW)
 
-        # Add labels for the numerical columns and unique values
-        self.num_label = ctk.CTkLabel(self.num_col_frame, text= 'Numerical Columns')
-        self.num_label.grid(row= 0, column=0, padx= 10, pady= 5, sticky= ctk.N)
-        self.num_unique_label = ctk.CTkLabel(self.num_col_frame, text= 'Unique Values')
-        self.num_unique_label.grid(row= 0, column=1, padx= 10, pady= 5, sticky= ctk.N)
-        
-        # Create the scrollable frame for categorical data type
-        self.cat_col_frame = ctk.CTkScrollableFrame(self, height= 150, width=230)
+        # Create the list for categorical data type
+        self.cat_col_frame = VirtualColumnList(self, title= 'Categorical Columns')
         self.cat_col_frame.grid(row= 2, column= 0, padx= 10, pady= 10, sticky= ctk.NW)
 
-        # Add labels for the categorical columns and unique values
-        self.cat_label = ctk.CTkLabel(self.cat_col_frame, text= 'Categorical Columns')
-        self.cat_label.grid(row= 0, column=0, padx= 10, pady= 5, sticky= ctk.N)
-        self.cat_unique_label = ctk.CTkLabel(self.cat_col_frame, text= 'Unique Values')
-        self.cat_unique_label.grid(row= 0, column=1, padx= 10, pady= 5, sticky= ctk.N)
-
     def load_local_file(self) -> None:
         """
-        Prompts the user to select a local file, reads its data, and updates the GUI.
+        Prompts the user to select a local file, reads its data in the background,
+        and updates the GUI once the read finishes.
 
-        Supported file types: CSV, JSON, Parquet, Excel, Pickle.
-
-        Raises:
-            ValueError: If an unsupported file type is selected.
+        Supported file types: CSV, JSON, Parquet, Excel, Pickle, Feather/Arrow IPC.
+        Unsupported file types are reported in an error dialog.
         """
         file_path = filedialog.askopenfilenames(
             title="Select a File",
             filetypes=[
                 ("CSV Files", "*.csv"),
-                ("JSON Files", "*.json"),
+                ("JSON Files", ["*.json","*.jsonl","*.ndjson"]),
                 ("Parquet Files", "*.parquet"),
                 ("Excel Files", ["*.xlsx","*.xls"]),  
                 ("Pickle Files", ["*.pickle","*.pkl","*.p"]),
+                ("Feather / Arrow Files", ["*.feather","*.arrow","*.ipc"]),
                 ("All Files", "*.*")
             ]
         )
         if file_path:
-            try:
-                self.data = File().read(file_path[0])
+            def _on_loaded():
                 self.entry_textvariable.set(file_path[0])
                 self.update_data_columns()
                 self.enable_plot(self.plot_frame)
+                self.enable_plot(self.dashboard_frame)
                 # self.disable_load_option(self.import_frame)
-            except ValueError as e:
-                messagebox.showerror(
-                    title="Unsupported File Type",
-                    message=f"The selected file type is not supported. Please choose a file with a supported extension (CSV, JSON, Parquet, Excel, or Pickle)."
+
+            self.start_loading(file_path[0], _on_loaded)
+
+    def start_loading(self, file_path: str, on_loaded) -> None:
+        """
+        Reads `file_path` on a background worker and calls `on_loaded` on the main loop
+        once `self.data` holds the result.
+
+        While the read runs, progress is shown in the browse frame and a Cancel button
+        replaces the load controls. Any load already in progress is cancelled first.
+
+        Args:
+            file_path (str): Path to the file to read.
+            on_loaded (Callable[[], None]): Called without arguments after a successful load.
+        """
+        from data_visualization.data_loader import File, FileCache, BackgroundLoader
+        sheet_name = self._choose_sheet(file_path)
+        if sheet_name is None:
+            return
+        if self.loader is not None:
+            self.loader.cancel()
+        if self.file_cache is None:
+            self.file_cache = FileCache()
+        file = File(downcast= True, cache= self.file_cache, lazy= self.lazy_load_var.get(),
+                    arrow= self.arrow_load_var.get(), category_ratio= self._CATEGORY_RATIO,
+                    sheet_name= sheet_name, out_of_core= self.out_of_core_var.get())
+        preview = (self.preview_load_var.get() and not file.lazy and not file.out_of_core
+                   and os.path.isfile(file_path) and os.path.getsize(file_path) >= self._PREVIEW_MIN_BYTES)
+        self.loader = BackgroundLoader(file_path, file, preview_rows= self._PREVIEW_ROWS if preview else None,
+                                       spread= True).start()
+        self.load_progress_label.configure(text= 'Loading dataset. . .')
+        self.cancel_load_btn.place(x= 620, y= 10)
+        self.local_read_btn.configure(state= 'disabled')
+        self.download_kaggle_btn.configure(state= 'disabled')
+        self.after(self._LOAD_POLL_INTERVAL_MS, self._poll_loader, self.loader, on_loaded)
+
+    def _choose_sheet(self, file_path: str):
+        """
+        Asks which sheet to load when `file_path` is an Excel workbook with several sheets.
+
+        Returns:
+            The chosen sheet name, 0 (the first sheet) for other files and single-sheet
+            workbooks, or None if the user closed the picker.
+        """
+        from data_visualization.data_loader import list_sheets
+        from data_visualization.data_loader.local_file_loader import FileExtension, extension_of
+        if extension_of(file_path) is not FileExtension.EXCEL:
+            return 0
+        try:
+            sheets = list_sheets(file_path)
+        except (OSError, ValueError):
+            return 0  # The load itself reports unreadable files
+        if len(sheets) <= 1:
+            return 0
+        picker = SheetPicker(self, os.path.basename(file_path), sheets)
+        self.wait_window(picker)
+        return picker.choice
+
+    def cancel_loading(self) -> None:
+        """Aborts the dataset download or load currently running in the background."""
+        if self.downloader is not None:
+            self.downloader.cancel()
+            self.download_progress_label.configure(text= 'Cancelling. . .')
+        if self.loader is not None:
+            self.loader.cancel()
+            self.load_progress_label.configure(text= 'Cancelling. . .')
+
+    def _poll_loader(self, loader: 'BackgroundLoader', on_loaded) -> None:
+        """Drains the loader's events on the Tk main loop and reschedules itself until it finishes."""
+        from data_visualization.data_loader import LazyDataset, ChunkedDataset, LoadEvent
+        if loader is not self.loader:
+            return  # Superseded by a newer load
+        for event, payload in loader.poll():
+            if event is LoadEvent.PROGRESS:
+                bytes_read, total_bytes, rows = payload
+                percent = 100 * bytes_read / total_bytes if total_bytes else 100
+                self.load_progress_label.configure(
+                    text= f'Loading dataset. . . {percent:.0f}% '
+                          f'({bytes_read / 2**20:,.1f} / {total_bytes / 2**20:,.1f} MB, {rows:,} rows)'
+                )
+            elif event is LoadEvent.PREVIEW:
+                self.data = payload
+                self._clear_render_cache()
+                self._set_preview(True)
+                on_loaded()
+            else:
+                self._finish_loading()
+                was_preview = self.is_preview and event is LoadEvent.DONE
+                if event is LoadEvent.DONE:
+                    self.data = payload
+                    self._clear_render_cache()
+                    self._set_preview(False)
+                    on_loaded()
+                    if was_preview and self.dashboard is not None:
+                        self._refresh_dashboard()  # Re-prepare every cell from the full dataset
+                    elif was_preview and self._last_plot is not None:
+                        self._render_plot(*self._last_plot)  # Swap the sample's plot for the full one
+                    if isinstance(payload, LazyDataset):
+                        self.load_progress_label.configure(
+                            text= f'Schema loaded: {len(payload.columns):,} columns (read on demand)'
+                        )
+                    elif isinstance(payload, ChunkedDataset):
+                        rows = f'{payload.num_rows:,} rows' if payload.num_rows is not None else 'rows'
+                        self.load_progress_label.configure(
+                            text= f'Streaming {len(payload.columns):,} columns, {rows} (out of core)'
+                        )
+                    elif loader.file.from_cache:
+                        self.load_progress_label.configure(text= 'Loaded from cache')
+                    else:
+                        self._show_memory_report(loader.file.memory_report)
+                elif event is LoadEvent.ERROR:
+                    self._show_load_error(payload)
+                if self.is_preview:
+                    self.preview_label.configure(text= 'Preview sample only: the full load did not finish')
+                return
+        self.after(self._LOAD_POLL_INTERVAL_MS, self._poll_loader, loader, on_loaded)
+
+    def _clear_render_cache(self) -> None:
+        """
+        Drops the plots rendered from the previous dataset. A reloaded file may differ in
+        rows the cache's sampled fingerprint does not look at.
+        """
+        if self.render_cache is not None:
+            self.render_cache.clear()
+            self.render_cache_label.configure(text= ' ')
+
+    def _set_preview(self, is_preview: bool) -> None:
+        """Marks whether the dataset on show is a preview sample, next to the plot controls."""
+        self.is_preview = is_preview
+        text = f'Preview: {len(self.data):,}-row sample, full dataset loading' if is_preview else ' '
+        self.preview_label.configure(text= text)
+
+    def _finish_loading(self) -> None:
+        """Restores the load controls after a background load ends."""
+        self.loader = None
+        self.load_progress_label.configure(text= ' ')
+        self.cancel_load_btn.place_forget()
+        self.local_read_btn.configure(state= 'normal')
+        self.download_kaggle_btn.configure(state= 'normal')
+
+    def _show_memory_report(self, report) -> None:
+        """Shows how much memory dtype downcasting saved on the last load, if any."""
+        if report is None:
+            return
+        self.load_progress_label.configure(
+            text= f'Loaded: {report.before / 2**20:,.1f} MB -> {report.after / 2**20:,.1f} MB '
+                  f'({report.saved_ratio:.0%} saved)'
+        )
+
+    def _show_load_error(self, error: Exception) -> None:
+        """Shows the error raised by a background load."""
+        from data_visualization.data_loader import SchemaMismatchError
+        if isinstance(error, SchemaMismatchError):
+            messagebox.showerror(title="Incompatible Files",
+                                 message=f"The files cannot be combined into one dataset:\n\n{error}")
+        elif isinstance(error, ValueError):
+            messagebox.showerror(
+                title="Unsupported File Type",
+                message="The selected file type is not supported. Please choose a file with a supported extension (CSV, JSON, Parquet, Excel, Pickle, or Feather/Arrow)."
             )
+        else:
+            messagebox.showerror(title="Loading Failed", message=f"An error occurred: {error}")
 
     def download_dataset(self) -> None:
         """
-        Downloads a dataset from Kaggle and updates the GUI.
-
-        Prompts for Kaggle credentials if not already stored.
-        Handles downloading, error cases, and loading the dataset.
+        Downloads a dataset from Kaggle in the background and loads it once extracted.
 
-        Raises:
-            Exception: If an error occurs during Kaggle dataset download.
-            ValueError: If an unsupported file type is selected.
+        Prompts for Kaggle credentials if not already stored. A dataset version already in
+        the local dataset store is opened from there. Byte-level progress is shown in the
+        browse frame and the Cancel button stops the download; a cancelled or interrupted
+        download resumes from where it stopped the next time it is started.
         """
+        from data_visualization.data_loader import KaggleFile, BackgroundDownloader, DatasetStore
         if not os.path.exists('./kaggle.json'):
             CredentialsWindow().mainloop()
 
@@ -183,48 +457,73 @@ class DataVisualizationWindow(ctk.CTk):
             messagebox.showerror('Invalid URL', 'Please make sure the provided URL is valid.')
             return
 
-        folder_path = './Datasets/' + url.split('/')[-1]
-        false_dir = f"./Datasets/"
-        false_dirs = list()
-        for dir in url.split('/'):
-            false_dir += f'{dir}/'
-            false_dirs.append(false_dir)
-        if not os.path.exists(folder_path):
-            try:
-                self.download_progress_label.configure(text='Downloading dataset. . .')
-                self.update()
-                # download_thread = threading.Thread(target=KaggleFile.download_kaggle_dataset, args=(url,))
-                # download_thread.start()
-                # download_thread.join()
-                KaggleFile.download_kaggle_dataset(url= url)
-                self.download_progress_label.configure(text=' ')
-            except Exception as e:
-                messagebox.showerror('Invalid URL!', 'Please make sure the provided URL is valid.')
-                if false_dirs:
-                    for dir in false_dirs[::-1]:
-                        os.rmdir(dir)  # Delete the falsely created empty directory
-                self.download_progress_label.configure(text=' ')
-                return
+        try:
+            KaggleFile.dataset_id(url)
+        except ValueError:
+            messagebox.showerror('Invalid URL!', 'Please make sure the provided URL is valid.')
+            return
 
-            downloaded_datasets_list = os.listdir(folder_path)
-            try:
-                self.load_kaggle_dataset(folder_path, downloaded_datasets_list)
-            except ValueError as e:
-                messagebox.showerror(
-                        title="Unsupported File Type",
-                        message=f"The selected file type is not supported. Please choose a file with a supported extension (CSV, JSON, Parquet, Excel, or Pickle)."
-                )
-        else:
-            downloaded_datasets_list = os.listdir(folder_path)
-            messagebox.showinfo('Dataset found!', 'Dataset already exists!')
-            self.load_kaggle_dataset(folder_path, downloaded_datasets_list)
+        if self.downloader is not None:
+            self.downloader.cancel()
+        if self.dataset_store is None:
+            self.dataset_store = DatasetStore(max_bytes= self._DATASET_STORE_BYTES)
+        kaggle = KaggleFile(store= self.dataset_store, compact= self.compact_download_var.get())
+        self.downloader = BackgroundDownloader(url, kaggle).start()
+        self.download_progress_label.configure(text= 'Downloading dataset. . .')
+        self.cancel_load_btn.place(x= 620, y= 10)
+        self.local_read_btn.configure(state= 'disabled')
+        self.download_kaggle_btn.configure(state= 'disabled')
+        self.after(self._LOAD_POLL_INTERVAL_MS, self._poll_downloader, self.downloader)
+
+    def _poll_downloader(self, downloader: 'BackgroundDownloader') -> None:
+        """Drains the downloader's events on the Tk main loop and reschedules itself until it finishes."""
+        from data_visualization.data_loader import LoadEvent
+        if downloader is not self.downloader:
+            return  # Superseded by a newer download
+        for event, payload in downloader.poll():
+            if event is LoadEvent.PROGRESS:
+                stage, done, total = payload
+                if stage == 'extract':
+                    text = f'Extracting. . . {done:,} / {total:,} files'
+                elif stage == 'compact':
+                    text = f'Compacting to Parquet. . . {done:,} / {total:,} files'
+                elif total:
+                    text = (f'Downloading dataset. . . {100 * done / total:.0f}% '
+                            f'({done / 2**20:,.1f} / {total / 2**20:,.1f} MB)')
+                else:
+                    text = f'Downloading dataset. . . {done / 2**20:,.1f} MB'
+                self.download_progress_label.configure(text= text)
+                continue
+
+            self._finish_download()
+            if event is LoadEvent.DONE:
+                if downloader.kaggle.from_store:
+                    self.download_progress_label.configure(text= 'Opened from the local dataset store')
+                self.load_kaggle_dataset(payload, os.listdir(payload))
+            elif event is LoadEvent.CANCELLED:
+                self.download_progress_label.configure(text= 'Download cancelled; it resumes next time')
+            elif isinstance(payload, ValueError):
+                messagebox.showerror('Invalid URL!', f'Please make sure the provided URL is valid.\n\n{payload}')
+            else:
+                messagebox.showerror('Download Failed', f'An error occurred: {payload}')
+            return
+        self.after(self._LOAD_POLL_INTERVAL_MS, self._poll_downloader, downloader)
+
+    def _finish_download(self) -> None:
+        """Restores the load controls after a background download ends."""
+        self.downloader = None
+        self.download_progress_label.configure(text= ' ')
+        self.cancel_load_btn.place_forget()
+        self.local_read_btn.configure(state= 'normal')
+        self.download_kaggle_btn.configure(state= 'normal')
 
     def load_kaggle_dataset(self, folder_path: str = None, downloaded_datasets_list: list[str] = None) -> None:
         """
         Loads a Kaggle dataset from a specified folder.
 
-        If only one file is present, loads it directly.
-        Otherwise, prompts the user to select a file.
+        If only one file or folder is present, loads it directly; a folder's files are read
+        in parallel as the shards of one dataset. With several files, the user can load them
+        all as one dataset or select a single file.
 
         Args:
             folder_path (str): The path to the folder containing the dataset files.
@@ -235,30 +534,27 @@ class DataVisualizationWindow(ctk.CTk):
         """
         if len(downloaded_datasets_list) == 1:
             file_path = f'{folder_path}/{downloaded_datasets_list[0]}'
-            self.data = File().read(file_path)
-            self._update_window()
+            self.start_loading(file_path, self._update_window)
+        elif messagebox.askyesno('Multiple files',
+                                 f'This dataset has {len(downloaded_datasets_list)} files. '
+                                 'Load them all as one dataset?'):
+            self.start_loading(folder_path, self._update_window)
         else:
             file_path = filedialog.askopenfilenames(
             title="Select a File",
             filetypes=[
                 ("CSV Files", "*.csv"),
-                ("JSON Files", "*.json"),
+                ("JSON Files", ["*.json","*.jsonl","*.ndjson"]),
                 ("Parquet Files", "*.parquet"),
                 ("Excel Files", ["*.xlsx","*.xls"]),  
                 ("Pickle Files", ["*.pickle","*.pkl","*.p"]),
+                ("Feather / Arrow Files", ["*.feather","*.arrow","*.ipc"]),
                 ("All Files", "*.*")
             ],
             initialdir= folder_path,
         )
             if file_path:
-                try:
-                    self.data = File().read(file_path[0])
-                    self._update_window()
-                except ValueError as e:
-                    messagebox.showerror(
-                        title="Unsupported File Type",
-                        message=f"The selected file type is not supported. Please choose a file with a supported extension (CSV, JSON, Parquet, Excel, or Pickle)."
-                )
+                self.start_loading(file_path[0], self._update_window)
 
     # changes some functionalities in the window after loading a kaggle dataset
     def _update_window(self) -> None:
@@ -270,6 +566,7 @@ class DataVisualizationWindow(ctk.CTk):
         """
         self.update_data_columns()
         self.enable_plot(self.plot_frame)
+        self.enable_plot(self.dashboard_frame)
         # self.disable_load_option(self.import_frame)
         # self.read_entry.configure(state = 'readonly')
         # self.download_kaggle_btn.configure(state= 'disabled')
@@ -292,30 +589,54 @@ class DataVisualizationWindow(ctk.CTk):
             self.read_entry.configure(state='normal')
 
     def update_data_columns(self) -> None:
-        """Updates numerical and categorical data columns."""
-
-        def _update_frame(frame, cols, nunique_values):
-            """Updates a frame with column information."""
-            header_labels = frame.grid_slaves(row=0)  # Preserve header labels
-            for child in frame.winfo_children():
-                if child not in header_labels:
-                    child.destroy()  # Clear only labels below header
-
-            for i, col in enumerate(cols):
-                label1 = ctk.CTkLabel(frame, text=col)
-                label1.grid(row=i + 1, column=0, padx=10, sticky=ctk.N)
-                label2 = ctk.CTkLabel(frame, text=nunique_values.iloc[i])
-                label2.grid(row=i + 1, column=1, padx=10, sticky=ctk.N)
-
-        # Update numerical columns
-        num_cols = self.data.select_dtypes(include=['number']).columns
-        num_nunique_values = self.data[num_cols].nunique()
-        _update_frame(self.num_col_frame, num_cols, num_nunique_values)
-
-        # Update categorical columns
-        cat_cols = self.data.select_dtypes(include=['object']).columns
-        cat_nunique_values = self.data[cat_cols].nunique()
-        _update_frame(self.cat_col_frame, cat_cols, cat_nunique_values)
+        """
+        Updates numerical and categorical data columns.
+
+        Column names are listed immediately; distinct counts are computed on a background
+        pool and filled in as each column finishes. Counts prefixed with '~' are estimates.
+        """
+        from data_visualization.data_loader import LazyDataset, ChunkedDataset
+        from data_visualization.data_loader.column_stats import DistinctCountJob, summary_columns
+        if self.summary_job is not None:
+            self.summary_job.cancel()
+            self.summary_job = None
+
+        with timer.phase('update_data_columns') as span:
+            # A lazy dataset only exposes its schema, so distinct counts are left unknown;
+            # an out-of-core one is counted by streaming it
+            lazy = isinstance(self.data, LazyDataset)
+            chunked = isinstance(self.data, ChunkedDataset)
+            data = self.data.schema if lazy or chunked else self.data
+            span.rows = self.data.num_rows if lazy or chunked else len(data)
+
+            num_cols, cat_cols = summary_columns(data)
+            placeholder = '-' if lazy else '...'
+            self.num_col_frame.set_columns(num_cols, placeholder)
+            self.cat_col_frame.set_columns(cat_cols, placeholder)
+
+        if not lazy:
+            self.summary_job = DistinctCountJob(self.data, num_cols + cat_cols).start()
+            # Ended by _poll_summary once every column is counted
+            self._summary_span = timer.phase('DistinctCountJob', columns= len(num_cols + cat_cols))
+            self._summary_span.rows = span.rows
+            self.after(self._SUMMARY_POLL_INTERVAL_MS, self._poll_summary, self.summary_job)
+        self._show_timings()
+
+    def _poll_summary(self, job: 'DistinctCountJob') -> None:
+        """Shows the distinct counts finished so far and reschedules itself until the job is done."""
+        if job is not self.summary_job:
+            return  # Superseded by a newer dataset
+        running = job.is_running()
+        for column, count, approximate in job.poll():
+            text = f'~{count}' if approximate else f'{count}'
+            self.num_col_frame.set_value(column, text)
+            self.cat_col_frame.set_value(column, text)
+        if running:
+            self.after(self._SUMMARY_POLL_INTERVAL_MS, self._poll_summary, job)
+        else:
+            self.summary_job = None
+            self._summary_span.end()
+            self._show_timings()
 
     def create_plot_frame(self) -> None:
         """
@@ -358,38 +679,164 @@ class DataVisualizationWindow(ctk.CTk):
                                     command= self.plot_graph)
         self.plot_btn.grid(row=1, column= 4, padx= 12, pady= 5)
 
+        # How scatter plots with too many rows to draw individually are rendered
+        self.scatter_mode_label = ctk.CTkLabel(self.plot_frame, text= 'Large scatter')
+        self.scatter_mode_label.grid(row=2, column=0, padx=5, pady=5)
+        self.scatter_mode_var = StringVar(value= 'Sample')
+        self.scatter_mode_optionmenu = ctk.CTkOptionMenu(self.plot_frame, values= ['Sample', 'Density'],
+                                                        variable= self.scatter_mode_var)
+        self.scatter_mode_optionmenu.grid(row=2, column=1, padx=11, pady=5)
+
+        # Whether bar and box plots aggregate in one pass or let seaborn bootstrap every statistic
+        self.stats_mode_label = ctk.CTkLabel(self.plot_frame, text= 'Bar/Box stats')
+        self.stats_mode_label.grid(row=2, column=2, padx=11, pady=5)
+        self.stats_mode_var = StringVar(value= 'Fast')
+        self.stats_mode_optionmenu = ctk.CTkOptionMenu(self.plot_frame, values= ['Fast', 'Exact'],
+                                                      variable= self.stats_mode_var)
+        self.stats_mode_optionmenu.grid(row=2, column=3, padx=5, pady=5)
+
+        self.render_cache_label = ctk.CTkLabel(self.plot_frame, text= ' ')
+        self.render_cache_label.grid(row=0, column=4, padx=5, pady=5, sticky= ctk.W)
+
+        # Marks plots drawn from a preview sample while the full dataset loads
+        self.preview_label = ctk.CTkLabel(self.plot_frame, text= ' ', text_color= 'orange')
+        self.preview_label.grid(row=2, column=4, padx=5, pady=5, sticky= ctk.W)
+
         for child in self.plot_frame.winfo_children():
             child.configure(state='disabled')
 
+        # Sends plots to one cell of a dashboard grid instead of replacing the whole figure
+        self.dashboard_frame = ctk.CTkFrame(self, fg_color= 'transparent')
+        self.dashboard_frame.place(x= 1090, y= 280, anchor= ctk.NE)
+        self.dashboard_cell_label = ctk.CTkLabel(self.dashboard_frame, text= 'Dashboard cell')
+        self.dashboard_cell_label.grid(row=0, column=0, padx=5)
+        self.dashboard_cell_var = StringVar(value= 'Off')
+        rows, columns = self._DASHBOARD_SHAPE
+        self.dashboard_cell_optionmenu = ctk.CTkOptionMenu(
+            self.dashboard_frame, values= ['Off'] + [str(cell) for cell in range(1, rows * columns + 1)],
+            variable= self.dashboard_cell_var, width= 70,
+        )
+        self.dashboard_cell_optionmenu.grid(row=0, column=1)
+        for child in self.dashboard_frame.winfo_children():
+            child.configure(state='disabled')
+
 
     def plot_graph(self) -> None:
-        """Creates and displays a plot based on user-specified options."""
+        """
+        Creates and displays a plot based on user-specified options, either on the whole
+        figure or in the chosen dashboard cell.
+        """
+        from data_visualization.plot_types import PlotSpec, ScatterMode, StatsMode
         # Get user-selected plot type
         plot_type = self.optionmenu_var.get()
-        self.plotter = Plots(plot_type)
+        options = {}
+        if plot_type == 'Scatter':
+            options['mode'] = ScatterMode(self.scatter_mode_var.get().lower())
+        elif plot_type in ['Box', 'Bar']:
+            options['mode'] = StatsMode(self.stats_mode_var.get().lower())
 
         # Retrieve plot data from user entries
         x_value = self.x_entry.get()
         y_value = self.y_entry.get() if plot_type in ['Scatter', 'Box', 'Bar'] else None
         hue = self.hue_entry.get() if self.hue_entry.get() else None
+        cell = self.dashboard_cell_var.get()
+        if cell != 'Off':
+            self._plot_dashboard_cell(int(cell) - 1, PlotSpec(plot_type, x_value, y_value, hue, options))
+            return
+        self._render_plot(plot_type, options, x_value, y_value, hue)
 
-        plt.close('all')
-        if self.canvas is not None:
-            self.canvas.get_tk_widget().destroy()
-            self.figure.clf()
-            self.canvas = None
-            self.figure = None
-        gc.collect()
+    def _plot_dashboard_cell(self, index: int, spec: 'PlotSpec') -> None:
+        """
+        Puts `spec` in a cell of the dashboard, replacing the single plot with an empty
+        dashboard first. Only that cell is prepared again, on the dashboard's thread pool.
+        """
+        from data_visualization.plot_types import Dashboard
+        if self.dashboard is None:
+            self._reset_figure()
+            self.dashboard = Dashboard(self.figure, *self._DASHBOARD_SHAPE)
+        self._last_plot = None
+        self._refresh_dashboard()
+        if self.dashboard.set_spec(index, spec):
+            self._watch_dashboard()
+
+    def _refresh_dashboard(self) -> None:
+        """Points the dashboard at the current dataset, re-preparing every cell if it changed."""
+        self.dashboard.set_data(self.data)
+        title = f'Preview of a {len(self.data):,}-row sample; full dataset loading' if self.is_preview else ''
+        self.figure.suptitle(title, color= 'tab:orange')
+        self._watch_dashboard()
+
+    def _watch_dashboard(self) -> None:
+        """Polls the dashboard until its cells are prepared, unless a poll is already running."""
+        if self._polling_dashboard or not self.dashboard.is_running():
+            return
+        self._polling_dashboard = True
+        self.plot_progress_label.configure(text= 'Plotting. . .')
+        self.after(self._DASHBOARD_POLL_INTERVAL_MS, self._poll_dashboard, self.dashboard)
+
+    def _poll_dashboard(self, dashboard: 'Dashboard') -> None:
+        """Draws the dashboard cells prepared since the last poll."""
+        if dashboard is not self.dashboard:
+            self._polling_dashboard = False
+            return  # Replaced by a single plot
+        # Checked first: once no cell is running, every result is already queued for draw_ready
+        running = dashboard.is_running()
+        if dashboard.draw_ready():
+            with timer.phase('canvas.draw', plot= 'Dashboard'):
+                self.canvas.draw()
+            self._show_timings()
+        if running:
+            self.after(self._DASHBOARD_POLL_INTERVAL_MS, self._poll_dashboard, dashboard)
+        else:
+            self._polling_dashboard = False
+            self.plot_progress_label.configure(text= ' ')
+
+    def _render_plot(self, plot_type: str, options: dict, x_value: str, y_value: str, hue: str) -> None:
+        """
+        Draws a plot of the current dataset, or blits it from the render cache. Plots of a
+        preview sample are titled as such.
+        """
+        import numpy as np
+        from data_visualization.plot_types import Plots, RenderCache, supports_detail
+        if self.render_cache is None:
+            self.render_cache = RenderCache()
+        self.plotter = Plots(plot_type, **options)
+        self._last_plot = None
 
         try:
             self.plot_progress_label.configure(text= 'Plotting. . .')
             self.update()
-            self.figure = plt.figure(figsize=(8, 5.5))
-            self.plotter.plot(data=self.data, x=x_value, y=y_value, hue=hue)
-            self.canvas = FigureCanvasTkAgg(self.figure, master=self)
-            self.canvas.get_tk_widget().place(x= 315, y= 280)
+            ax = self._clear_plot()
+            zoomable = supports_detail(self.data, plot_type, x_value, y_value, hue)
+            # Zoomable plots are drawn live, since a blitted image has no axes to zoom into
+            cache_key = None if zoomable else self.render_cache.key(
+                self.data, plot_type, x_value, y_value, hue, options, self.canvas.get_width_height(physical=True))
+            image = self.render_cache.get(cache_key) if cache_key is not None else None
+            if image is not None:
+                # Blit the stored pixels instead of recomputing and redrawing the plot
+                self.figure.clear()
+                self.figure.figimage(image, resize=False)
+                self.canvas.draw_idle()
+            else:
+                self.plotter.plot(data=self.data, x=x_value, y=y_value, hue=hue, ax=ax)
+                if self.is_preview:
+                    self.figure.suptitle(f'Preview of a {len(self.data):,}-row sample; full dataset loading',
+                                         color= 'tab:orange')
+                with timer.phase('canvas.draw', plot= plot_type):
+                    self.canvas.draw()
+                if zoomable:
+                    self._detail_spec = (self.data, plot_type, options, x_value, y_value, hue)
+                    self._watch_view(ax)
+                else:
+                    self.render_cache.put(cache_key, np.asarray(self.canvas.buffer_rgba()).copy())
+            self.render_cache_label.configure(text= self.render_cache.stats())
             self.plot_progress_label.configure(text= ' ')
+            self._last_plot = (plot_type, options, x_value, y_value, hue)
+            self._show_timings()
         except ValueError as e:
+            self._clear_plot()
+            self.canvas.draw_idle()
+            self.plot_progress_label.configure(text= ' ')
             messagebox.showerror(
             title= "Data Value Mismatch",
             message= "Oops! I couldn't find the specified X, Y, or Hue value in the dataset.\n"
@@ -401,6 +848,124 @@ class DataVisualizationWindow(ctk.CTk):
             )
 
 
+    def toggle_timings(self) -> None:
+        """Starts a new timing session, or stops recording while keeping the last one for export."""
+        if self.timing_var.get():
+            timer.enable()
+        else:
+            timer.disable()
+        self._show_timings()
+
+    def _show_timings(self) -> None:
+        """Shows the latest time, rows and memory change of each instrumented phase."""
+        text = timer.summary(self._TIMED_PHASES) if timer.enabled else ''
+        self.timing_label.configure(text= text or ' ')
+
+    def export_timings(self) -> None:
+        """Saves the recorded timings as a Chrome trace (*.trace.json) or a plain JSON list."""
+        if not timer.records:
+            messagebox.showinfo('No timings', "Tick 'Record timings', then load and plot a dataset first.")
+            return
+        path = filedialog.asksaveasfilename(
+            title= 'Export Timings',
+            initialfile= 'timings.trace.json',
+            defaultextension= '.json',
+            filetypes= [('Chrome trace', '*.trace.json'), ('JSON', '*.json')],
+        )
+        if not path:
+            return
+        if path.endswith('.trace.json'):
+            timer.export_chrome_trace(path)
+        else:
+            timer.export_json(path)
+
+    def _clear_plot(self) -> 'Axes':
+        """
+        Clears the plot surface and returns a fresh Axes to draw on.
+
+        The figure and its Tk canvas are created on the first plot and reused afterwards,
+        so re-plotting only rebuilds the axes' artists instead of the whole widget.
+        """
+        self._reset_figure()
+        return self.figure.add_subplot()
+
+    def _reset_figure(self) -> None:
+        """Creates or clears the figure, dropping the zoom state and dashboard of the previous plot."""
+        if self.figure is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            self.figure = Figure(figsize=(8, 5.2))
+            self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+            self.toolbar = NavigationToolbar2Tk(self.canvas, self, pack_toolbar=False)
+            self.toolbar.place(x= 315, y= 280)
+            self.canvas.get_tk_widget().place(x= 315, y= 315)
+        self._cancel_detail()
+        self._detail_spec = None
+        if self.dashboard is not None:
+            self.dashboard.close()
+            self.dashboard = None
+            self.figure.set_layout_engine(None)
+        self.figure.clear()
+        self.toolbar.update()  # Forget the zoom history of the previous plot
+
+    def _watch_view(self, ax: 'Axes') -> None:
+        """Re-aggregates the plot for the visible range whenever `ax` is zoomed or panned."""
+        ax.callbacks.connect('xlim_changed', self._on_view_changed)
+        ax.callbacks.connect('ylim_changed', self._on_view_changed)
+
+    def _on_view_changed(self, ax: 'Axes') -> None:
+        """Restarts the debounce timer, so a drag or a zoom (which moves both limits) computes once."""
+        if self._detail_after is not None:
+            self.after_cancel(self._detail_after)
+        self._detail_after = self.after(self._DETAIL_DEBOUNCE_MS, self._request_detail, ax)
+
+    def _request_detail(self, ax: 'Axes') -> None:
+        """Starts re-aggregating the plot on a worker thread for the current limits of `ax`."""
+        from data_visualization.plot_types import DetailTask
+        self._detail_after = None
+        if self.detail_task is not None:
+            self.detail_task.cancel()
+        data, plot_type, options, x_value, y_value, hue = self._detail_spec
+        self.detail_task = DetailTask(data, plot_type, x_value, y_value, hue, ax.get_xlim(), ax.get_ylim(),
+                                      options).start()
+        self.plot_progress_label.configure(text= 'Refining view. . .')
+        self.after(self._DETAIL_POLL_INTERVAL_MS, self._poll_detail, self.detail_task, ax)
+
+    def _poll_detail(self, task: 'DetailTask', ax: 'Axes') -> None:
+        """Draws a finished detail task's view, unless a later zoom or plot superseded it."""
+        from data_visualization.data_loader import LoadEvent
+        from data_visualization.plot_types import redraw_detail
+        if task is not self.detail_task:
+            return
+        for event, payload in task.poll():
+            if event is LoadEvent.DONE:
+                self.detail_task = None
+                ax = redraw_detail(ax, payload, task.plot_type, task.xlim, task.ylim)
+                if self.is_preview:
+                    self.figure.suptitle(f'Preview of a {len(task.data):,}-row sample; full dataset loading',
+                                         color= 'tab:orange')
+                self._watch_view(ax)  # Clearing the Axes dropped its callbacks
+                with timer.phase('canvas.draw', plot= task.plot_type):
+                    self.canvas.draw()
+                self.plot_progress_label.configure(text= ' ')
+                self._show_timings()
+                return
+            if event in (LoadEvent.ERROR, LoadEvent.CANCELLED):
+                # The stretched view of the previous aggregate stays on screen
+                self.detail_task = None
+                self.plot_progress_label.configure(text= ' ')
+                return
+        self.after(self._DETAIL_POLL_INTERVAL_MS, self._poll_detail, task, ax)
+
+    def _cancel_detail(self) -> None:
+        """Drops a pending or running re-aggregation of the current view."""
+        if self._detail_after is not None:
+            self.after_cancel(self._detail_after)
+            self._detail_after = None
+        if self.detail_task is not None:
+            self.detail_task.cancel()
+            self.detail_task = None
+
     def enable_plot(self, child_list) -> None:
         """Enables plot widgets."""
         for child in child_list.winfo_children():
@@ -481,6 +1046,7 @@ class CredentialsWindow(ctk.CTk):
 
         if self.username and self.key:
             try:
+                from data_visualization.data_loader import KaggleFile
                 KaggleFile.set_credentials(self.username, self.key)
                 messagebox.showinfo("Success!", "Credentials saved successfully.")
                 self.destroy()  # Close window if successful
@@ -488,3 +1054,38 @@ class CredentialsWindow(ctk.CTk):
                 messagebox.showerror("Error", f"An error occurred: {e}")
         else:
             messagebox.showerror("Value Error", "Username or Key is incorrect!")
+
+
+class SheetPicker(ctk.CTkToplevel):
+    """
+    A modal dialog listing the sheets of an Excel workbook, with their row counts where
+    the workbook records them. `choice` holds the picked sheet name, or None if cancelled.
+    """
+    def __init__(self, master, file_name: str, sheets: list['ExcelSheet']) -> None:
+        super().__init__(master)
+        self.choice = None
+        self._sheets = {sheet.label(): sheet.name for sheet in sheets}
+
+        self.title("Choose a Sheet")
+        self.geometry('340x160')
+        self.resizable(False, False)
+
+        self.instruction_label = ctk.CTkLabel(master=self, text=f"{file_name} has {len(sheets)} sheets:")
+        self.instruction_label.place(x= 10, y= 10)
+
+        self.sheet_var = StringVar(value= sheets[0].label())
+        self.sheet_optionmenu = ctk.CTkOptionMenu(master=self, values= list(self._sheets),
+                                                  variable= self.sheet_var, width= 320)
+        self.sheet_optionmenu.place(x= 10, y= 50)
+
+        self.load_button = ctk.CTkButton(master=self, text="Load", width= 100, command= self._load)
+        self.load_button.place(x= 120, y= 110)
+        self.cancel_button = ctk.CTkButton(master=self, text="Cancel", width= 100, command= self.destroy)
+        self.cancel_button.place(x= 230, y= 110)
+
+        self.transient(master)
+        self.after(10, self.grab_set)  # The window has to be visible before it can grab input
+
+    def _load(self) -> None:
+        self.choice = self._sheets[self.sheet_var.get()]
+        self.destroy()
@@ -0,0 +1,96 @@
+import customtkinter as ctk
+
+
+class VirtualColumnList(ctk.CTkFrame):
+    """
+    A two-column (name, unique values) list that only creates widgets for the visible rows.
+
+    A fixed pool of `visible_rows` label pairs is reused while scrolling, so showing
+    thousands of columns costs the same as showing a handful. Values can be filled in
+    one column at a time as they are computed.
+    """
+    _MAX_NAME_CHARS: int = 18
+
+    def __init__(self, master, title: str, visible_rows: int = 6, **kwargs) -> None:
+        super().__init__(master, **kwargs)
+        self.visible_rows = visible_rows
+        self._names: list[str] = []
+        self._values: dict[str, str] = {}
+        self._offset = 0
+
+        self.name_header = ctk.CTkLabel(self, text= title, width= 120)
+        self.name_header.grid(row= 0, column=0, padx= 10, pady= 5, sticky= ctk.N)
+        self.value_header = ctk.CTkLabel(self, text= 'Unique Values', width= 90)
+        self.value_header.grid(row= 0, column=1, padx= 10, pady= 5, sticky= ctk.N)
+
+        self._row_labels = []
+        for i in range(visible_rows):
+            name_label = ctk.CTkLabel(self, text= '', width= 120, anchor= ctk.W)
+            name_label.grid(row= i + 1, column=0, padx= 10, sticky= ctk.N)
+            value_label = ctk.CTkLabel(self, text= '', width= 90)
+            value_label.grid(row= i + 1, column=1, padx= 10, sticky= ctk.N)
+            self._row_labels.append((name_label, value_label))
+
+        self.scrollbar = ctk.CTkScrollbar(self, command= self._on_scrollbar)
+        self.scrollbar.grid(row= 1, column=2, rowspan= visible_rows, sticky= ctk.NS)
+
+        for widget in [self, self.name_header, self.value_header, *sum(self._row_labels, ())]:
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+            widget.bind('<Button-4>', lambda event: self.scroll_to(self._offset - 1))
+            widget.bind('<Button-5>', lambda event: self.scroll_to(self._offset + 1))
+        self._render()
+
+    def set_columns(self, names: list[str], placeholder: str = '...') -> None:
+        """Replaces the listed columns, showing `placeholder` until their values arrive."""
+        self._names = list(names)
+        self._values = {name: placeholder for name in self._names}
+        self._offset = 0
+        self._render()
+
+    def set_value(self, name: str, value: str) -> None:
+        """Sets the value shown next to column `name`, redrawing only if it is on screen."""
+        if name not in self._values:
+            return
+        self._values[name] = value
+        if name in self._names[self._offset:self._offset + self.visible_rows]:
+            self._render()
+
+    def scroll_to(self, offset: int) -> None:
+        """Scrolls so the row at `offset` is the first one visible."""
+        max_offset = max(len(self._names) - self.visible_rows, 0)
+        offset = min(max(offset, 0), max_offset)
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _on_scrollbar(self, action: str, amount, unit: str = None) -> None:
+        if action == 'moveto':
+            self.scroll_to(round(float(amount) * len(self._names)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll_to(self._offset + int(amount) * step)
+
+    def _on_mousewheel(self, event) -> None:
+        # Windows reports multiples of 120 per notch, macOS small signed deltas
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_to(self._offset - step)
+
+    def _render(self) -> None:
+        """Writes the visible slice of columns into the label pool."""
+        visible = self._names[self._offset:self._offset + self.visible_rows]
+        for i, (name_label, value_label) in enumerate(self._row_labels):
+            if i < len(visible):
+                name = str(visible[i])
+                name_label.configure(text= name if len(name) <= self._MAX_NAME_CHARS
+                                     else name[:self._MAX_NAME_CHARS - 1] + '…')
+                value_label.configure(text= self._values[visible[i]])
+            else:
+                name_label.configure(text= '')
+                value_label.configure(text= '')
+
+        if self._names:
+            start = self._offset / len(self._names)
+            end = min(self._offset + self.visible_rows, len(self._names)) / len(self._names)
+            self.scrollbar.set(start, end)
+        else:
+            self.scrollbar.set(0, 1)
@@ -1,4 +1,6 @@
 from data_visualization import DataVisualizationWindow
 
-app = DataVisualizationWindow()
-app.run()
\ No newline at end of file
+# Worker processes started while reading partitioned datasets re-import this module
+if __name__ == '__main__':
+    app = DataVisualizationWindow()
+    app.run()
\ No newline at end of file
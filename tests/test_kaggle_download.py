@@ -0,0 +1,155 @@
+import io
+import os
+import re
+import socket
+import zipfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from data_visualization.data_loader import DatasetStore, KaggleFile
+
+DATASET_ID = 'owner/slug'
+
+
+def _zip_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        # Stored uncompressed and large enough to span several client chunks
+        zf.writestr('data.csv', 'a,b\n' + ''.join(f'{i},{i % 7}\n' for i in range(300_000)))
+    return buffer.getvalue()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves the Kaggle API endpoints used by KaggleFile from `server.archive`."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('Range')))
+        if self.path.startswith(f'/api/v1/datasets/view/{DATASET_ID}'):
+            body = b'{"currentVersionNumber": 1}'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not self.path.startswith(f'/api/v1/datasets/download/{DATASET_ID}'):
+            self.send_error(404)
+            return
+
+        archive = server.archive
+        offset = 0
+        match = re.fullmatch(r'bytes=(\d+)-', self.headers.get('Range') or '')
+        if match:
+            offset = int(match.group(1))
+            if server.refuse_ranges or offset >= len(archive):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(archive)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {offset}-{len(archive) - 1}/{len(archive)}')
+        else:
+            self.send_response(200)
+        body = archive[offset:]
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if server.drop_after is not None:
+            # Close the connection part way, once
+            self.wfile.write(body[:server.drop_after])
+            server.drop_after = None
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StandInHandler)
+    server.archive = _zip_bytes()
+    server.requests = []
+    server.drop_after = None
+    server.refuse_ranges = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def kaggle(server, tmp_path, monkeypatch):
+    monkeypatch.delenv('KAGGLE_USERNAME', raising=False)
+    monkeypatch.delenv('KAGGLE_KEY', raising=False)
+    return KaggleFile(api_url=f'http://127.0.0.1:{server.server_address[1]}/api/v1',
+                      credentials_path=str(tmp_path / 'missing.json'),
+                      store=DatasetStore(str(tmp_path / 'store')))
+
+
+def _read_csv(folder: str) -> bytes:
+    with open(os.path.join(folder, 'data.csv'), 'rb') as f:
+        return f.read()
+
+
+def _expected_csv(server) -> bytes:
+    with zipfile.ZipFile(io.BytesIO(server.archive)) as zf:
+        return zf.read('data.csv')
+
+
+def test_full_download(kaggle, server):
+    progress = []
+    folder = kaggle.download(f'https://www.kaggle.com/datasets/{DATASET_ID}',
+                             progress=lambda stage, done, total: progress.append((stage, done, total)))
+
+    assert _read_csv(folder) == _expected_csv(server)
+    assert not kaggle.from_store
+    assert ('download', len(server.archive), len(server.archive)) in progress
+    assert [path for path, _ in server.requests if 'download' in path] == \
+        [f'/api/v1/datasets/download/{DATASET_ID}?datasetVersionNumber=1']
+    assert not os.listdir(os.path.dirname(kaggle.store.download_path(DATASET_ID, 1)))
+
+    assert kaggle.download(DATASET_ID) == folder
+    assert kaggle.from_store
+
+
+def test_resume_after_dropped_connection(kaggle, server):
+    dropped_at = server.drop_after = len(server.archive) // 3
+    part = kaggle.store.download_path(DATASET_ID, 1) + '.part'
+
+    with pytest.raises(ConnectionError):
+        kaggle.download(DATASET_ID)
+    assert os.path.getsize(part) == dropped_at
+
+    folder = kaggle.download(DATASET_ID)
+    assert _read_csv(folder) == _expected_csv(server)
+    ranges = [requested for path, requested in server.requests if 'download' in path]
+    assert ranges == [None, f'bytes={dropped_at}-']
+
+
+def test_complete_partial_download_is_used_on_416(kaggle, server):
+    part = kaggle.store.download_path(DATASET_ID, 1) + '.part'
+    os.makedirs(os.path.dirname(part))
+    with open(part, 'wb') as f:
+        f.write(server.archive)
+
+    folder = kaggle.download(DATASET_ID)
+    assert _read_csv(folder) == _expected_csv(server)
+    assert not os.path.exists(part)
+
+
+def test_stale_partial_download_restarts_on_416(kaggle, server):
+    server.refuse_ranges = True
+    part = kaggle.store.download_path(DATASET_ID, 1) + '.part'
+    os.makedirs(os.path.dirname(part))
+    with open(part, 'wb') as f:
+        f.write(b'not the start of a zip archive')
+
+    folder = kaggle.download(DATASET_ID)
+    assert _read_csv(folder) == _expected_csv(server)
+    assert not os.path.exists(part)
+    ranges = [requested for path, requested in server.requests if 'download' in path]
+    assert ranges == ['bytes=30-', None]
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+from data_visualization.data_loader.chunked_dataset import ChunkedDataset
+from data_visualization.data_loader.column_stats import approximate_distinct, count_distinct_chunked
+from data_visualization.plot_types import aggregations, out_of_core
+
+ROWS = 20_000
+CHUNK_ROWS = 1_500
+
+
+@pytest.fixture(scope='module')
+def frame() -> DataFrame:
+    rng = np.random.default_rng(1)
+    frame = DataFrame({
+        'value': rng.normal(50, 12, ROWS),
+        'group': rng.choice(['b', 'a', 'c'], ROWS),
+        'size': rng.choice([30, 10, 20], ROWS),
+        'hue': rng.choice(['x', 'y'], ROWS),
+        'id': rng.integers(0, 5_000, ROWS),
+    })
+    frame.loc[rng.random(ROWS) < .05, 'value'] = np.nan
+    # Levels first seen in later chunks, so each chunk's table must be aligned to the running one
+    frame.loc[ROWS // 2:, 'group'] = frame.loc[ROWS // 2:, 'group'].replace('c', 'late')
+    frame.loc[ROWS - 3 * CHUNK_ROWS:, 'hue'] = rng.choice(['x', 'y', 'z'], 3 * CHUNK_ROWS)
+    frame.loc[ROWS - CHUNK_ROWS:, 'size'] = 5
+    return frame
+
+
+@pytest.fixture(scope='module')
+def dataset(frame, tmp_path_factory) -> ChunkedDataset:
+    import pyarrow.dataset as ds
+    path = tmp_path_factory.mktemp('out_of_core') / 'data.parquet'
+    frame.to_parquet(path, index=False, row_group_size=4_000)
+    return ChunkedDataset(ds.dataset(str(path)), num_rows=ROWS, chunk_rows=CHUNK_ROWS)
+
+
+@pytest.mark.parametrize('hue', [None, 'hue'])
+def test_histogram_counts_match_in_memory(frame, dataset, hue):
+    expected = aggregations.histogram_counts(frame['value'], frame[hue] if hue else None)
+    result = out_of_core.histogram_counts(dataset, 'value', hue)
+
+    np.testing.assert_allclose(result.edges, expected.edges)
+    np.testing.assert_array_equal(result.counts, expected.counts)
+    if hue:
+        assert list(result.hue_levels) == list(expected.hue_levels)
+
+
+@pytest.mark.parametrize('x, hue', [('group', None), ('group', 'hue'), ('size', 'hue')])
+def test_value_counts_match_in_memory(frame, dataset, x, hue):
+    expected = aggregations.value_counts(frame[x], frame[hue] if hue else None)
+    result = out_of_core.value_counts(dataset, x, hue)
+
+    assert list(result.levels) == list(expected.levels)
+    np.testing.assert_array_equal(result.counts, expected.counts)
+    if hue:
+        assert list(result.hue_levels) == list(expected.hue_levels)
+
+
+@pytest.mark.parametrize('errorbar', ['ci', 'se', 'sd'])
+@pytest.mark.parametrize('x, hue', [('group', None), ('group', 'hue'), ('size', 'hue')])
+def test_bar_estimates_match_in_memory(frame, dataset, x, hue, errorbar):
+    expected = aggregations.bar_estimates(frame[x], frame['value'], frame[hue] if hue else None, errorbar)
+    result = out_of_core.bar_estimates(dataset, x, 'value', hue, errorbar)
+
+    assert list(result.levels) == list(expected.levels)
+    if hue:
+        assert list(result.hue_levels) == list(expected.hue_levels)
+    np.testing.assert_array_equal(result.counts, expected.counts)
+    np.testing.assert_allclose(result.means, expected.means, rtol=1e-12)
+    np.testing.assert_allclose(result.lower, expected.lower, rtol=1e-12)
+    np.testing.assert_allclose(result.upper, expected.upper, rtol=1e-12)
+
+
+@pytest.mark.parametrize('x, hue', [('group', None), ('size', 'hue')])
+def test_box_statistics_match_in_memory(frame, dataset, x, hue):
+    # Groups are smaller than QUANTILE_SAMPLE_SIZE, so the sampled quartiles are exact
+    expected = aggregations.box_statistics(frame[x], frame['value'], frame[hue] if hue else None, max_fliers=None)
+    result = out_of_core.box_statistics(dataset, x, 'value', hue, max_fliers=None)
+
+    assert list(result.levels) == list(expected.levels)
+    if hue:
+        assert list(result.hue_levels) == list(expected.hue_levels)
+    for result_row, expected_row in zip(result.stats, expected.stats, strict=True):
+        for result_box, expected_box in zip(result_row, expected_row, strict=True):
+            if expected_box is None:
+                assert result_box is None
+                continue
+            for key in ('q1', 'med', 'q3', 'whislo', 'whishi', 'mean', 'cilo', 'cihi'):
+                assert result_box[key] == pytest.approx(expected_box[key], rel=1e-12), key
+            np.testing.assert_array_equal(np.sort(result_box['fliers']), np.sort(expected_box['fliers']))
+
+
+def test_count_distinct_chunked_is_exact_below_the_limit(frame, dataset):
+    results = count_distinct_chunked(dataset, ['group', 'size', 'id'])
+    assert results == [(column, frame[column].nunique(), False) for column in ('group', 'size', 'id')]
+
+
+def test_count_distinct_chunked_switches_to_hyperloglog(frame, dataset):
+    # 'id' passes the limit after a few chunks; merged registers equal those of the whole column
+    (column, count, approximate), = count_distinct_chunked(dataset, ['id'], exact_limit=1_000)
+    assert approximate
+    assert count == approximate_distinct(frame['id'])
+    assert count == pytest.approx(frame['id'].nunique(), rel=.02)
+
+
+def test_box_outliers_are_capped_with_the_extremes_kept(tmp_path):
+    import pyarrow.dataset as ds
+    rng = np.random.default_rng(2)
+    frame = DataFrame({'group': rng.choice(['a', 'b'], ROWS), 'value': rng.standard_t(1, ROWS)})
+    frame.to_parquet(tmp_path / 'heavy_tails.parquet', index=False)
+    dataset = ChunkedDataset(ds.dataset(str(tmp_path / 'heavy_tails.parquet')), chunk_rows=CHUNK_ROWS)
+
+    for aggregate in (aggregations.box_statistics(frame['group'], frame['value'], max_fliers=50),
+                      out_of_core.box_statistics(dataset, 'group', 'value', max_fliers=50)):
+        for level, (box,) in zip(aggregate.levels, aggregate.stats):
+            values = frame.loc[frame['group'] == level, 'value']
+            assert len(box['fliers']) == 50
+            assert box['fliers'].min() == values.min()
+            assert box['fliers'].max() == values.max()